@@ -0,0 +1,130 @@
+"""
+Achievement engine benchmark: threshold index vs re-checking every rule.
+
+Generates --rules achievement rules spread over the metrics and feeds a
+stream of completion / level-up / life-force events for --users users:
+  - naive: after each event, every rule the user has not unlocked yet
+    is compared with the user's metric values
+  - indexed: AchievementEngine (one comparison against the cached next
+    threshold; rules looked up only when it is crossed)
+
+Both must unlock the same achievements.
+
+    python benchmarks/bench_achievements.py --rules 100 1000 5000 --events 200000
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Set
+
+from habit_hero.application.achievements import AchievementEngine
+from habit_hero.domain.achievements import (
+    METRICS,
+    AchievementProgress,
+    AchievementRule,
+    record_metrics,
+)
+from habit_hero.domain.events import DomainEvent, HabitCompleted, LevelUp, LifeForceLogged
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryAchievementRepository,
+)
+
+START = date(2025, 1, 1)
+
+
+def make_rules(count: int, rng: random.Random) -> List[AchievementRule]:
+    limits = {"streak": 365, "level": 100, "completions": 5000, "aligned_days": 365}
+    return [
+        AchievementRule(f"rule-{i}", f"Rule {i}", metric, rng.randint(1, limits[metric]))
+        for i, metric in enumerate(rng.choice(METRICS) for _ in range(count))
+    ]
+
+
+def make_events(users: int, count: int, rng: random.Random) -> List[DomainEvent]:
+    streaks = [0] * users
+    levels = [1] * users
+    days = [0] * users
+    events: List[DomainEvent] = []
+    for _ in range(count):
+        u = rng.randrange(users)
+        user_id = f"user-{u}"
+        kind = rng.random()
+        if kind < 0.7:
+            streaks[u] = streaks[u] + 1 if rng.random() < 0.9 else 1
+            day = START + timedelta(days=days[u])
+            events.append(HabitCompleted(user_id, "habit", day, 10, streaks[u]))
+        elif kind < 0.8:
+            levels[u] += 1
+            events.append(LevelUp(user_id, levels[u] - 1, levels[u]))
+        else:
+            days[u] += 1
+            day = START + timedelta(days=days[u])
+            events.append(LifeForceLogged(user_id, day, rng.randint(0, 3), rng.randint(0, 3), 0))
+    return events
+
+
+def naive(rules: List[AchievementRule], events: List[DomainEvent]) -> Dict[str, Set[str]]:
+    progress: Dict[str, AchievementProgress] = {}
+    for event in events:
+        user = progress.setdefault(event.user_id, AchievementProgress(event.user_id))
+        record_metrics(user, event)
+        for rule in rules:
+            if rule.id not in user.unlocked and user.values.get(rule.metric, 0) >= rule.threshold:
+                user.unlocked[rule.id] = None
+    return {user_id: set(p.unlocked) for user_id, p in progress.items()}
+
+
+def indexed(
+    rules: List[AchievementRule], events: List[DomainEvent], batch: int
+) -> Dict[str, Set[str]]:
+    repo = InMemoryAchievementRepository(rules)
+    engine = AchievementEngine(repo)
+    for i in range(0, len(events), batch):
+        engine.handle(events[i : i + batch])
+    return {user_id: set(repo.get_progress(user_id).unlocked) for user_id in repo.user_ids()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rules", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--naive-events", type=int, default=20_000)
+    parser.add_argument("--batch", type=int, default=256, help="events per handle() call")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    events = make_events(args.users, args.events, rng)
+    sample = events[: args.naive_events]
+
+    for count in args.rules:
+        rules = make_rules(count, random.Random(count))
+
+        started = time.perf_counter()
+        expected = naive(rules, sample)
+        slow = (time.perf_counter() - started) / len(sample)
+
+        assert indexed(rules, sample, args.batch) == expected
+
+        started = time.perf_counter()
+        indexed(rules, events, args.batch)
+        fast = (time.perf_counter() - started) / len(events)
+
+        print(
+            f"rules={count:>6,} naive={slow * 1e6:9.2f}us/event "
+            f"indexed={fast * 1e6:7.2f}us/event ({slow / fast:,.0f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Dashboard benchmark: read model vs N+1 composition.
+
+Seeds users with a number of habits and some completions, then renders
+every user's home screen both ways:
+  - composed: character + habit list + one streak lookup per habit +
+    today's logs + today's life force check
+  - read model: GetDashboardUseCase (one lookup)
+
+    python benchmarks/bench_dashboard.py --users 2000 --habits 5 20 100
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from habit_hero.container import Container, Settings
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+from habit_hero.application.use_cases.get_dashboard import GetDashboardRequest
+
+TODAY = date(2025, 6, 1)
+
+
+def seed(container: Container, users: int, habits: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    create_user = container.use_case("create_user")
+    create_habit = container.use_case("create_habit")
+    complete = container.use_case("complete_habit")
+    log_life_force = container.use_case("log_life_force")
+
+    user_ids = []
+    for _ in range(users):
+        user = create_user.execute(CreateUserRequest(long_term_vision="Benchmark.")).user
+        user_ids.append(user.id)
+        for h in range(habits):
+            habit = create_habit.execute(
+                CreateHabitRequest(
+                    user_id=user.id,
+                    name=f"Habit {h}",
+                    cue="Cue",
+                    action="Action",
+                    reward="Reward",
+                    estimated_minutes=10,
+                )
+            )
+            for back in range(rng.randrange(3)):
+                day = TODAY - timedelta(days=back)
+                complete.execute(CompleteHabitRequest(user.id, habit.id, day))
+        log_life_force.execute(LogLifeForceRequest(user.id, TODAY, 2, 2))
+    return user_ids
+
+
+def composed(container: Container, user_id: str) -> tuple:
+    character = container.repository("characters").get_for_user(user_id)
+    habits = container.repository("habits").list_for_user(user_id)
+    streaks = container.repository("streaks")
+    streak_of = {h.id: streaks.get(user_id, h.id) for h in habits}
+    done = {log.habit_id for log in container.repository("logs").list_for_day(user_id, TODAY)}
+    life_force = container.repository("life_force").get_for_day(user_id, TODAY)
+    return character, habits, streak_of, done, life_force
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--habits", type=int, nargs="+", default=[5, 20, 100])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for habits in args.habits:
+        container = Container(Settings())
+        user_ids = seed(container, max(1, args.users * 5 // habits), habits, args.seed)
+        get_dashboard = container.use_case("get_dashboard")
+
+        started = time.perf_counter()
+        for user_id in user_ids:
+            composed(container, user_id)
+        slow = (time.perf_counter() - started) / len(user_ids)
+
+        started = time.perf_counter()
+        for user_id in user_ids:
+            get_dashboard.execute(GetDashboardRequest(user_id=user_id, today=TODAY))
+        fast = (time.perf_counter() - started) / len(user_ids)
+
+        print(
+            f"habits/user={habits:>4} users={len(user_ids):>6,} "
+            f"composed={slow * 1e6:8.1f}us read_model={fast * 1e6:8.1f}us "
+            f"lookups: {habits + 4} vs 1"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Event bus benchmark.
+
+Measures complete_habit latency as subscribers are added, once with the
+subscribers called inline on the request path and once behind the
+batching event bus. Each subscriber costs a fixed amount of work per
+event plus per batch (think: a network round trip).
+
+    python benchmarks/bench_event_bus.py --requests 2000 --subscribers 0 1 4 16
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+from typing import List, Sequence
+
+from habit_hero.application.ports import EventPublisher
+from habit_hero.container import Container, Settings
+from habit_hero.domain.events import DomainEvent
+from habit_hero.infrastructure.events.batching_bus import BatchingEventBus
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+
+
+class InlinePublisher(EventPublisher):
+    """
+    What bolting reactions into the use case amounts to: every handler
+    runs before the request returns.
+    """
+
+    def __init__(self) -> None:
+        self.handlers = []
+
+    def subscribe(self, name, handler) -> None:
+        self.handlers.append(handler)
+
+    def publish(self, events: Sequence[DomainEvent]) -> None:
+        for handler in self.handlers:
+            handler(list(events))
+
+
+def make_subscriber(per_batch: float, per_event: float):
+    def handle(events: List[DomainEvent]) -> None:
+        deadline = time.perf_counter() + per_batch + per_event * len(events)
+        while time.perf_counter() < deadline:
+            pass
+
+    return handle
+
+
+def run(mode: str, subscribers: int, requests: int, per_batch: float, per_event: float):
+    publisher = InlinePublisher() if mode == "inline" else BatchingEventBus()
+    container = Container(Settings())
+    container.override("events", publisher)
+    for i in range(subscribers):
+        publisher.subscribe(f"sub-{i}", make_subscriber(per_batch, per_event))
+
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Benchmark.")
+    ).user
+    habits = [
+        container.use_case("create_habit").execute(
+            CreateHabitRequest(
+                user_id=user.id,
+                name=f"Habit {i}",
+                cue="Cue",
+                action="Action",
+                reward="Reward",
+                estimated_minutes=10,
+            )
+        )
+        for i in range(requests)
+    ]
+
+    complete = container.use_case("complete_habit")
+    latencies = []
+    for i, habit in enumerate(habits):
+        day = date(2025, 1, 1) + timedelta(days=i % 30)
+        started = time.perf_counter()
+        complete.execute(CompleteHabitRequest(user.id, habit.id, day))
+        latencies.append(time.perf_counter() - started)
+
+    drain_started = time.perf_counter()
+    if isinstance(publisher, BatchingEventBus):
+        publisher.flush()
+        lag = max((s.lag for s in publisher.stats().values()), default=0)
+        publisher.close()
+    else:
+        lag = 0
+    drained = time.perf_counter() - drain_started
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    print(
+        f"{mode:>6} subscribers={subscribers:>3} "
+        f"p50={statistics.median(latencies) * 1e6:8.1f}us "
+        f"p99={p99 * 1e6:8.1f}us drain={drained * 1e3:7.1f}ms lag_after={lag}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--subscribers", type=int, nargs="+", default=[0, 1, 4, 16])
+    parser.add_argument("--per-batch-us", type=float, default=50.0)
+    parser.add_argument("--per-event-us", type=float, default=5.0)
+    args = parser.parse_args()
+
+    for mode in ("inline", "bus"):
+        for n in args.subscribers:
+            run(mode, n, args.requests, args.per_batch_us / 1e6, args.per_event_us / 1e6)
+
+
+if __name__ == "__main__":
+    main()
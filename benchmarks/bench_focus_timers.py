@@ -0,0 +1,107 @@
+"""
+Benchmark for server-side focus timers on the hierarchical timing wheel.
+
+Starts N concurrent sessions with random lengths, cancels a share of them,
+then drives a manual clock one second at a time until every timer fired.
+
+    python benchmarks/bench_focus_timers.py --sessions 300000
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from habit_hero.domain.entities import Character
+from habit_hero.infrastructure.clock import ManualClock
+from habit_hero.infrastructure.scheduling.timing_wheel import HierarchicalTimingWheel
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryCharacterRepository,
+    InMemoryFocusSessionRepository,
+)
+from habit_hero.application.use_cases.start_focus_session import (
+    StartFocusSessionUseCase,
+    StartFocusSessionRequest,
+)
+from habit_hero.application.use_cases.cancel_focus_session import (
+    CancelFocusSessionUseCase,
+    CancelFocusSessionRequest,
+)
+from habit_hero.application.use_cases.expire_focus_sessions import (
+    ExpireFocusSessionsUseCase,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sessions", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--cancel-share", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    start_time = datetime(2025, 1, 1, 8, 0, 0)
+    clock = ManualClock(start_time)
+    sessions = InMemoryFocusSessionRepository()
+    characters = InMemoryCharacterRepository()
+    timers = HierarchicalTimingWheel(start=start_time)
+    for u in range(args.users):
+        characters.save(Character(user_id=f"user-{u}"))
+
+    start = StartFocusSessionUseCase(sessions=sessions, timers=timers, clock=clock)
+    cancel = CancelFocusSessionUseCase(sessions=sessions, timers=timers, clock=clock)
+    expire = ExpireFocusSessionsUseCase(
+        sessions=sessions, characters=characters, timers=timers, clock=clock
+    )
+
+    # Stagger start times over the first minute
+    started = []
+    t0 = time.perf_counter()
+    for i in range(args.sessions):
+        if i % (args.sessions // 60 or 1) == 0:
+            clock.advance(timedelta(seconds=1))
+        session = start.execute(
+            StartFocusSessionRequest(
+                user_id=f"user-{rng.randrange(args.users)}",
+                duration_minutes=rng.choice((15, 25, 45, 50, 90)),
+            )
+        )
+        started.append(session)
+    insert_s = time.perf_counter() - t0
+
+    to_cancel = rng.sample(started, int(len(started) * args.cancel_share))
+    t0 = time.perf_counter()
+    for session in to_cancel:
+        cancel.execute(CancelFocusSessionRequest(user_id=session.user_id, session_id=session.id))
+    cancel_s = time.perf_counter() - t0
+
+    tick_times = []
+    completed = 0
+    while len(timers):
+        clock.advance(timedelta(seconds=1))
+        t0 = time.perf_counter()
+        completed += len(expire.execute().completed)
+        tick_times.append(time.perf_counter() - t0)
+
+    tick_times.sort()
+    p50 = tick_times[len(tick_times) // 2] * 1e6
+    p99 = tick_times[int(len(tick_times) * 0.99)] * 1e6
+    worst = tick_times[-1] * 1e3
+    print(f"sessions={args.sessions} start: {args.sessions / insert_s:,.0f}/s")
+    print(f"cancelled={len(to_cancel)} cancel: {len(to_cancel) / cancel_s:,.0f}/s")
+    print(
+        f"ticks={len(tick_times)} completed={completed} "
+        f"tick p50={p50:.1f}us p99={p99:.1f}us max={worst:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
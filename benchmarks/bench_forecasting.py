@@ -0,0 +1,113 @@
+"""
+Progression forecasting benchmark: scalar domain functions vs NumPy.
+
+Builds random users (habits, completion rates, live streaks) and
+projects all of them N days ahead:
+  - scalar: forecast_user_scalar, one user and one day at a time
+  - vectorized: ProgressionForecaster in deterministic mode
+  - monte carlo: ProgressionForecaster with --runs samples per user
+
+The scalar loop only runs on a --scalar-users sample and is
+extrapolated; both deterministic paths are checked to agree on it.
+
+    python benchmarks/bench_forecasting.py --users 100000 --days 90 --runs 100
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from habit_hero.domain.entities import Character, Habit, StreakState
+from habit_hero.domain.forecasting import (
+    HabitPace,
+    ProgressionForecaster,
+    UserPace,
+    forecast_user_scalar,
+)
+
+START = date(2025, 6, 1)
+
+
+def build_users(count: int, habits: int, seed: int) -> list[UserPace]:
+    rng = random.Random(seed)
+    users = []
+    for u in range(count):
+        character = Character(user_id=f"user-{u}", level=rng.randint(1, 10))
+        character.xp_to_next_level = character.level * 100
+        paces = []
+        for h in range(rng.randint(1, habits)):
+            habit = Habit(
+                id=f"habit-{u}-{h}",
+                user_id=character.user_id,
+                name="Habit",
+                cue="Cue",
+                action="Action",
+                reward="Reward",
+                estimated_minutes=10,
+                base_xp=rng.randint(5, 30),
+            )
+            streak = StreakState(
+                habit_id=habit.id,
+                user_id=character.user_id,
+                current_streak=rng.randint(1, 20),
+                longest_streak=20,
+                last_completed_day=START - timedelta(days=rng.randint(0, 1)),
+            )
+            paces.append(HabitPace(habit, rng.random(), streak))
+        users.append(UserPace(character, paces))
+    return users
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--habits", type=int, default=6, help="max habits per user")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--mc-users", type=int, default=10_000)
+    parser.add_argument("--scalar-users", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    users = build_users(args.users, args.habits, args.seed)
+    habits = sum(len(u.habits) for u in users)
+    forecaster = ProgressionForecaster()
+    print(f"users={len(users):,} habits={habits:,} days={args.days}")
+
+    sample = users[: args.scalar_users]
+    started = time.perf_counter()
+    expected = [forecast_user_scalar(u, START, args.days) for u in sample]
+    scalar = (time.perf_counter() - started) / len(sample) * len(users)
+    print(f"  scalar      {scalar:8.2f}s (extrapolated from {len(sample):,} users)")
+
+    started = time.perf_counter()
+    forecasts = forecaster.forecast(users, START, args.days)
+    vectorized = time.perf_counter() - started
+    print(f"  vectorized  {vectorized:8.2f}s ({scalar / vectorized:,.0f}x)")
+
+    mismatches = sum(
+        (f.level, f.xp) != (c.level, c.xp) for f, c in zip(forecasts, expected)
+    )
+    print(f"  deterministic mismatches vs scalar: {mismatches}")
+
+    mc_users = users[: args.mc_users]
+    started = time.perf_counter()
+    forecaster.forecast(mc_users, START, args.days, runs=args.runs, seed=args.seed)
+    monte_carlo = time.perf_counter() - started
+    print(
+        f"  monte carlo {monte_carlo:8.2f}s "
+        f"({len(mc_users):,} users x {args.runs} runs = "
+        f"{len(mc_users) * args.runs / monte_carlo:,.0f} user-runs/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
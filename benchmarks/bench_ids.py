@@ -0,0 +1,108 @@
+"""
+Id generation benchmark: uuid4 hex ids vs time-ordered 64-bit ids.
+
+For each scheme, mints N habit ids and reports:
+  - mint rate
+  - memory held by the ids plus an in-memory habit repository
+  - insert rate and file size of a SQLite id -> owner table (a real
+    B-tree), keyed by compact_key(): random text keys land anywhere,
+    time-ordered integer keys append at the end
+
+    python benchmarks/bench_ids.py --ids 200000
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+
+from habit_hero.application.ids import UuidIdGenerator
+from habit_hero.domain.entities import Habit
+from habit_hero.infrastructure.ids import SortableIdGenerator, compact_key
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryHabitRepository,
+)
+
+
+def sqlite_inserts(ids: list, batch: int) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "owners.sqlite3")
+        db = sqlite3.connect(path)
+        db.execute("CREATE TABLE owners (entity_id NOT NULL PRIMARY KEY, user_id TEXT)")
+        started = time.perf_counter()
+        for i in range(0, len(ids), batch):
+            with db:
+                db.executemany(
+                    "INSERT INTO owners VALUES (?, 'user')",
+                    ((compact_key(entity_id),) for entity_id in ids[i:i + batch]),
+                )
+        elapsed = time.perf_counter() - started
+        db.close()
+        return elapsed, os.path.getsize(path)
+
+
+def build(generator, count: int, users: int) -> tuple[list, object, float, float]:
+    started = time.perf_counter()
+    ids = [generator.new_id("habit") for _ in range(count)]
+    mint = time.perf_counter() - started
+
+    repo = InMemoryHabitRepository()
+    started = time.perf_counter()
+    for i, habit_id in enumerate(ids):
+        repo.save(
+            Habit(
+                id=habit_id,
+                user_id=f"user-{i % users}",
+                name="Habit",
+                cue="Cue",
+                action="Action",
+                reward="Reward",
+                estimated_minutes=10,
+                base_xp=5,
+            )
+        )
+    insert = time.perf_counter() - started
+    return ids, repo, mint, insert
+
+
+def run(name: str, make_generator, count: int, users: int, batch: int) -> None:
+    ids, _, mint, insert = build(make_generator(), count, users)
+
+    # Memory is measured on a separate pass; tracing skews the timings
+    tracemalloc.start()
+    held = build(make_generator(), count, users)
+    memory, _ = tracemalloc.get_traced_memory()
+    del held
+    tracemalloc.stop()
+
+    btree, size = sqlite_inserts(ids, batch)
+
+    print(
+        f"{name:>8}: id_len={len(ids[0])} mint={count / mint:>9,.0f}/s "
+        f"repo_insert={count / insert:>9,.0f}/s mem={memory / 2**20:6.1f} MiB "
+        f"sqlite_insert={count / btree:>9,.0f}/s sqlite_size={size / 2**20:5.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", type=int, default=200_000)
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--batch", type=int, default=1_000, help="rows per transaction")
+    args = parser.parse_args()
+
+    run("uuid4", UuidIdGenerator, args.ids, args.users, args.batch)
+    run("sortable", SortableIdGenerator, args.ids, args.users, args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Log retention benchmark: stored rows and range-query cost before and
+after compaction.
+
+Synthetic history: --users users with --habits habits each, every habit
+completed on ~80% of the days over --years years. HabitLogs are written
+straight into the in-memory repository (no use cases), then the
+retention job compacts everything older than --retention-days.
+
+The output shows the rows kept (raw logs + monthly aggregates) and the
+time to answer monthly_totals() over each user's whole history.
+
+    python benchmarks/bench_log_retention.py --users 200 --years 5
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from habit_hero.domain.entities import HabitLog
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryHabitLogRepository,
+)
+from habit_hero.application.use_cases.compact_habit_logs import (
+    CompactHabitLogsRequest,
+    CompactHabitLogsUseCase,
+)
+
+TODAY = date(2025, 6, 30)
+ALL_TIME = (date(1970, 1, 1), date(2100, 1, 1))
+
+
+def seed(args: argparse.Namespace) -> tuple:
+    rng = random.Random(args.seed)
+    logs = InMemoryHabitLogRepository()
+    start = TODAY - timedelta(days=365 * args.years)
+    n = 0
+    for u in range(args.users):
+        day = start
+        while day <= TODAY:
+            for h in range(args.habits):
+                if rng.random() < 0.8:
+                    n += 1
+                    logs.save(
+                        HabitLog(
+                            f"log-{n}",
+                            f"user-{u}",
+                            f"habit-{h}",
+                            day,
+                            datetime.combine(day, datetime.min.time()),
+                            rng.randint(5, 40),
+                        )
+                    )
+            day += timedelta(days=1)
+    return logs, n
+
+
+def stored_rows(logs: InMemoryHabitLogRepository) -> int:
+    # pop_user hands back raw logs and monthly aggregates alike
+    return sum(len(logs.pop_user(u)) for u in list(logs.user_ids()))
+
+
+def scan(logs: InMemoryHabitLogRepository, users: int, repeat: int) -> tuple:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        totals = [logs.monthly_totals(f"user-{u}", *ALL_TIME) for u in range(users)]
+    elapsed = (time.perf_counter() - started) / (repeat * users)
+    return elapsed, totals
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--habits", type=int, default=3)
+    parser.add_argument("--years", type=int, default=5)
+    parser.add_argument("--retention-days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logs, before = seed(args)
+    raw_scan, raw_totals = scan(logs, args.users, args.repeat)
+
+    started = time.perf_counter()
+    result = CompactHabitLogsUseCase(logs).execute(
+        CompactHabitLogsRequest(today=TODAY, retention_days=args.retention_days)
+    )
+    compact_seconds = time.perf_counter() - started
+    compact_scan, compact_totals = scan(logs, args.users, args.repeat)
+    assert compact_totals == raw_totals, "compaction changed the monthly totals"
+
+    kept = stored_rows(logs)
+    print(
+        f"compacted {result.logs_compacted:,} logs before {result.cutoff} "
+        f"in {compact_seconds:.2f}s"
+    )
+    print(f"  stored rows: {before:>10,} -> {kept:>8,} ({before / kept:.1f}x fewer)")
+    print(
+        f"  monthly_totals per user: {raw_scan * 1e3:8.2f}ms -> "
+        f"{compact_scan * 1e3:6.2f}ms ({raw_scan / compact_scan:.1f}x faster)"
+    )
+
+
+if __name__ == "__main__":
+    main()
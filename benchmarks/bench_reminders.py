@@ -0,0 +1,101 @@
+"""
+Benchmark for cue reminder scheduling.
+
+Schedules one daily reminder per habit (spread over the day), then runs
+the dispatch tick once per simulated minute and reports per-tick latency.
+The default matches the 10M-habit target; it needs several GB of RAM.
+
+    python benchmarks/bench_reminders.py --habits 10000000 --minutes 60
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import time as timer
+from datetime import datetime, time, timedelta
+
+from habit_hero.domain.entities import Habit
+from habit_hero.domain.services import next_reminder_at
+from habit_hero.infrastructure.clock import ManualClock
+from habit_hero.infrastructure.scheduling.bucketed_index import BucketedTimerIndex
+from habit_hero.infrastructure.notifications.in_memory_outbox import (
+    InMemoryReminderOutbox,
+)
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryHabitRepository,
+)
+from habit_hero.application.use_cases.dispatch_reminders import (
+    DispatchRemindersUseCase,
+)
+
+
+class CountingOutbox(InMemoryReminderOutbox):
+    """
+    Counts deliveries instead of keeping them, to keep memory flat.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.count = 0
+
+    def deliver(self, reminders):
+        self.count += len(reminders)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--habits", type=int, default=10_000_000)
+    parser.add_argument("--minutes", type=int, default=60)
+    args = parser.parse_args()
+
+    start = datetime(2025, 1, 1, 0, 0)
+    clock = ManualClock(start)
+    habits = InMemoryHabitRepository()
+    index = BucketedTimerIndex()
+    outbox = CountingOutbox()
+
+    t0 = timer.perf_counter()
+    for i in range(args.habits):
+        minute_of_day = i % 1440
+        habit = Habit(
+            id=f"habit-{i}",
+            user_id=f"user-{i // 8}",
+            name="Habit",
+            cue="Cue",
+            action="Action",
+            reward="Reward",
+            estimated_minutes=10,
+            base_xp=5,
+            reminder_time=time(minute_of_day // 60, minute_of_day % 60),
+        )
+        habits.save(habit)
+        index.schedule(habit.id, next_reminder_at(habit, start))
+    print(f"scheduled {args.habits:,} reminders in {timer.perf_counter() - t0:.1f}s")
+
+    dispatch = DispatchRemindersUseCase(
+        habits=habits, reminders=index, outbox=outbox, clock=clock
+    )
+    ticks = []
+    for _ in range(args.minutes):
+        clock.advance(timedelta(minutes=1))
+        t0 = timer.perf_counter()
+        dispatch.execute()
+        ticks.append(timer.perf_counter() - t0)
+
+    ticks.sort()
+    per_tick = args.habits / 1440
+    print(
+        f"ticks={len(ticks)} (~{per_tick:,.0f} due per tick) "
+        f"p50={ticks[len(ticks) // 2] * 1e3:.2f}ms "
+        f"p99={ticks[int(len(ticks) * 0.99)] * 1e3:.2f}ms "
+        f"max={ticks[-1] * 1e3:.2f}ms delivered={outbox.count:,}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Scaling benchmark for the user-sharded runtime.
+
+For each shard count, creates users and habits through the router and
+then completes habits in batches, reporting completions per second.
+Also times a rebalance from the largest shard count down by one.
+
+    python benchmarks/bench_sharding.py --max-shards 8 --users 2000 --days 20
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import os
+import time
+from datetime import date, timedelta
+
+from habit_hero.container import Settings
+from habit_hero.infrastructure.sharding.router import ShardRouter
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+
+
+def run(shards: int, users: int, days: int) -> tuple[float, ShardRouter]:
+    router = ShardRouter(shards=shards, settings=Settings())
+    created = router.execute_many(
+        "create_user",
+        [CreateUserRequest(long_term_vision="x") for _ in range(users)],
+    )
+    habits = router.execute_many(
+        "create_habit",
+        [
+            CreateHabitRequest(
+                user_id=r.user.id,
+                name="Habit",
+                cue="Cue",
+                action="Action",
+                reward="Reward",
+                estimated_minutes=20,
+            )
+            for r in created
+        ],
+    )
+
+    start_day = date(2025, 1, 1)
+    started = time.perf_counter()
+    for d in range(days):
+        router.execute_many(
+            "complete_habit",
+            [
+                CompleteHabitRequest(
+                    user_id=h.user_id,
+                    habit_id=h.id,
+                    day=start_day + timedelta(days=d),
+                )
+                for h in habits
+            ],
+        )
+    rate = users * days / (time.perf_counter() - started)
+    return rate, router
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--max-shards", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--days", type=int, default=20)
+    args = parser.parse_args()
+
+    baseline = None
+    for shards in range(1, args.max_shards + 1):
+        rate, router = run(shards, args.users, args.days)
+        baseline = baseline or rate
+        print(f"shards={shards} completions/s={rate:,.0f} speedup={rate / baseline:.2f}x")
+        if shards == args.max_shards and shards > 1:
+            started = time.perf_counter()
+            moved = router.rebalance(shards - 1)
+            print(
+                f"rebalance {shards}->{shards - 1}: moved {moved} users "
+                f"in {time.perf_counter() - started:.3f}s"
+            )
+        router.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Snapshot benchmark: cost of a consistent read view of the in-memory
+repositories, against stopping writers and copying the maps.
+
+Seeds --users users with --habits habits and --days days of history
+(habit logs, streaks, characters) straight into the repositories, then:
+
+- opens a snapshot, and separately copies every repository map (what a
+  consistent export needed before: a pause plus a copy);
+- runs --writes habit completions while the snapshot is open, then
+  scans it (logs + streaks);
+- compares latency and allocated memory of the same number of
+  completions with and without an open snapshot: the difference is
+  what the snapshot costs.
+
+    python benchmarks/bench_snapshots.py --users 2000 --days 90 --writes 5000
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+import tracemalloc
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+
+from habit_hero.container import Container, Settings
+from habit_hero.domain.entities import Character, Habit, HabitLog, StreakState
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+
+START = date(2025, 1, 1)
+MAPS = {
+    "logs": "_logs",
+    "streaks": "_streaks",
+    "characters": "_characters",
+    "habits": "_habits",
+}
+
+
+def seed(container: Container, args: argparse.Namespace) -> list:
+    habits, logs = container.repository("habits"), container.repository("logs")
+    streaks = container.repository("streaks")
+    characters = container.repository("characters")
+    pairs = []
+    for u in range(args.users):
+        user_id = f"user-{u}"
+        characters.save(Character(user_id=user_id))
+        for h in range(args.habits):
+            habit = Habit(f"{user_id}-h{h}", user_id, "Read", "Cue", "Read", "Tea", 5, 10)
+            habits.save(habit)
+            pairs.append((user_id, habit.id))
+            for d in range(args.days):
+                day = START + timedelta(days=d)
+                log_id = f"log-{habit.id}-{day}"
+                completed_at = datetime.combine(day, datetime.min.time())
+                logs.save(HabitLog(log_id, user_id, habit.id, day, completed_at, 10))
+            last = START + timedelta(days=args.days - 1)
+            streaks.save(StreakState(user_id, habit.id, args.days, args.days, last))
+    return pairs
+
+
+def completions(
+    container: Container, pairs: list, count: int, rng: random.Random
+) -> float:
+    complete = container.use_case("complete_habit")
+    started = time.perf_counter()
+    for _ in range(count):
+        user_id, habit_id = pairs[rng.randrange(len(pairs))]
+        day = START + timedelta(days=rng.randrange(400))
+        complete.execute(CompleteHabitRequest(user_id, habit_id, day))
+    return (time.perf_counter() - started) / count
+
+
+def allocated(run) -> int:
+    """
+    Bytes still allocated once run() returns (its result kept alive).
+    """
+    tracemalloc.start()
+    try:
+        result = run()
+        size = tracemalloc.get_traced_memory()[0]
+        del result
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def copy_maps(repos: dict) -> dict:
+    return {
+        name: {key: replace(v) for key, v in getattr(repos[name], attr).items()}
+        for name, attr in MAPS.items()
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--habits", type=int, default=3)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--writes", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    container = Container(Settings())
+    # no event bus: its thread would only add noise to the timings
+    container.override("events", None)
+    pairs = seed(container, args)
+    snapshots = container.resolve("snapshots")
+    repos = {name: container.repository(name) for name in MAPS}
+    entities = sum(len(getattr(repos[name], attr)) for name, attr in MAPS.items())
+
+    started = time.perf_counter()
+    copy_maps(repos)
+    copy_seconds = time.perf_counter() - started
+    copy_bytes = allocated(lambda: copy_maps(repos))
+
+    started = time.perf_counter()
+    snapshot = snapshots.snapshot()
+    open_seconds = time.perf_counter() - started
+    with_snapshot = completions(container, pairs, args.writes, rng)
+    kept = snapshots.history_size()
+    started = time.perf_counter()
+    scanned = sum(1 for _ in repos["logs"].scan(snapshot))
+    scanned += sum(1 for _ in repos["streaks"].scan(snapshot))
+    scan_seconds = time.perf_counter() - started
+    snapshot.close()
+    without_snapshot = completions(container, pairs, args.writes, rng)
+
+    def write() -> float:
+        return completions(container, pairs, args.writes, rng)
+
+    plain_bytes = allocated(write)
+    with snapshots.snapshot():
+        snapshot_bytes = allocated(write)
+
+    print(f"{entities:,} entities (logs, streaks, characters, habits)")
+    print(
+        f"  copy every map:  {copy_seconds * 1e3:9.1f}ms, {copy_bytes / 2**20:7.1f}MiB "
+        "(writers paused)"
+    )
+    print(f"  open snapshot:   {open_seconds * 1e6:9.1f}us")
+    print(f"  scan snapshot:   {scan_seconds * 1e3:9.1f}ms for {scanned:,} entities")
+    print(
+        f"  {args.writes:,} completions with it open: {kept:,} old values kept, "
+        f"{(snapshot_bytes - plain_bytes) / 2**20:.2f}MiB more than without"
+    )
+    print(
+        f"  completion:      {without_snapshot * 1e6:6.1f}us without a snapshot, "
+        f"{with_snapshot * 1e6:6.1f}us with one open"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Cold-start benchmark for short-lived entry points (batch jobs, workers).
+
+Measures, in fresh interpreters:
+  - import time of the composition root (`python -X importtime`)
+  - wall time from interpreter start to the first use case finishing
+
+Exits with status 1 when the first use case exceeds the budget.
+
+    python benchmarks/bench_startup.py --budget-ms 250
+"""
+from pathlib import Path
+import sys
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+import argparse
+import subprocess
+import time
+
+FIRST_USE_CASE = """
+from habit_hero.container import Container
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+Container().use_case("create_user").execute(CreateUserRequest(long_term_vision="x"))
+"""
+
+
+def import_time_us(module: str) -> int:
+    """
+    Cumulative import time reported by -X importtime for `module`.
+    """
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like: "import time:  self [us] | cumulative | imported package"
+    for line in out.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"{module} not found in importtime output")
+
+
+def first_use_case_ms(runs: int) -> float:
+    """
+    Best-of-N wall time for a fresh interpreter to run one use case.
+    """
+    best = float("inf")
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", FIRST_USE_CASE], cwd=ROOT_DIR, check=True)
+        best = min(best, (time.perf_counter() - started) * 1000)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=250.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    container_us = import_time_us("habit_hero.container")
+    cli_us = import_time_us("habit_hero.presentation.cli.cli_app")
+    first_ms = first_use_case_ms(args.runs)
+
+    print(f"import habit_hero.container: {container_us / 1000:.2f} ms")
+    print(f"import cli_app:              {cli_us / 1000:.2f} ms")
+    print(f"first use case (cold):       {first_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    if first_ms > args.budget_ms:
+        print("over budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
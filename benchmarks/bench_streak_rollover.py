@@ -0,0 +1,73 @@
+"""
+Benchmark for the day-rollover streak expiry sweep.
+
+    python benchmarks/bench_streak_rollover.py --streaks 1000000
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+from datetime import date, timedelta
+
+from habit_hero.domain.entities import StreakState
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryStreakRepository,
+)
+from habit_hero.application.use_cases.expire_streaks import (
+    ExpireStreaksUseCase,
+    ExpireStreaksRequest,
+)
+
+
+def build_store(count: int, today: date) -> InMemoryStreakRepository:
+    """
+    Spread streaks over the last 10 days so roughly 80% have lapsed.
+    """
+    repo = InMemoryStreakRepository()
+    for i in range(count):
+        repo.save(
+            StreakState(
+                habit_id=f"habit-{i}",
+                user_id=f"user-{i // 5}",
+                current_streak=1 + i % 30,
+                longest_streak=30,
+                last_completed_day=today - timedelta(days=i % 10),
+            )
+        )
+    return repo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--streaks", type=int, default=200_000)
+    args = parser.parse_args()
+
+    today = date(2025, 1, 31)
+    repo = build_store(args.streaks, today)
+    use_case = ExpireStreaksUseCase(streaks=repo)
+
+    result = use_case.execute(ExpireStreaksRequest(today=today))
+    print(
+        f"streaks={args.streaks} "
+        f"processed={result.processed} expired={result.expired} "
+        f"elapsed={result.elapsed_seconds:.3f}s "
+        f"rate={result.streaks_per_second:,.0f} streaks/s"
+    )
+
+    # The next day's sweep only has to visit the newly expired bucket
+    result = use_case.execute(
+        ExpireStreaksRequest(today=today + timedelta(days=1))
+    )
+    print(
+        f"next-day sweep processed={result.processed} "
+        f"elapsed={result.elapsed_seconds:.3f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
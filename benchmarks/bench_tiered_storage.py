@@ -0,0 +1,112 @@
+"""
+Tiered storage benchmark.
+
+Creates a large user base, then replays a day where only a small share
+of users is active. Compares peak memory of the plain in-memory backend
+with the tiered backend under a resident-user budget, and reports the
+hot-tier hit rate.
+
+    python benchmarks/bench_tiered_storage.py --users 20000 --active 0.05 --budget 2000
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+from habit_hero.container import Container, Settings
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+
+
+def run(settings: Settings, users: int, active: float, days: int, seed: int) -> None:
+    container = Container(settings)
+    create_user = container.use_case("create_user")
+    create_habit = container.use_case("create_habit")
+    complete = container.use_case("complete_habit")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+
+    pairs = []
+    for _ in range(users):
+        user = create_user.execute(CreateUserRequest(long_term_vision="Benchmark.")).user
+        habit = create_habit.execute(
+            CreateHabitRequest(
+                user_id=user.id,
+                name="Read",
+                cue="After dinner",
+                action="Read 10 pages",
+                reward="Tea",
+                estimated_minutes=15,
+            )
+        )
+        pairs.append((user.id, habit.id))
+
+    # Each day a fresh random sample of users is active
+    rng = random.Random(seed)
+    start = date(2025, 1, 1)
+    completions = 0
+    for d in range(days):
+        for user_id, habit_id in rng.sample(pairs, int(len(pairs) * active)):
+            complete.execute(
+                CompleteHabitRequest(
+                    user_id=user_id, habit_id=habit_id, day=start + timedelta(days=d)
+                )
+            )
+            completions += 1
+
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{settings.backend:>9}: users={users:,} completions={completions:,} "
+        f"time={elapsed:.2f}s peak_mem={peak / 2**20:.1f} MiB"
+    )
+    if settings.backend == "tiered":
+        tiers = container.resolve("tier_manager")
+        stats = tiers.stats
+        print(
+            f"{'':>9}  resident={tiers.resident_users:,} cold={len(tiers.cold):,} "
+            f"hit_rate={stats.hit_rate:.1%} loads={stats.loads:,} "
+            f"evictions={stats.evictions:,}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--active", type=float, default=0.05, help="share active per day")
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--budget", type=int, default=2_000, help="max resident users")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    run(Settings(backend="in_memory"), args.users, args.active, args.days, args.seed)
+    with tempfile.TemporaryDirectory() as data_dir:
+        run(
+            Settings(
+                backend="tiered",
+                data_dir=data_dir,
+                max_resident_users=args.budget,
+            ),
+            args.users,
+            args.active,
+            args.days,
+            args.seed,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Write-behind benchmark: backend writes with and without coalescing.
+
+Synthetic load: --users hot users each complete --per-minute habits a
+minute for --minutes minutes (plus a LifeForce log every 10 minutes).
+Every completion saves the streak, log, character and dashboard. The
+simulated clock advances with the load, so interval flushes happen as
+they would in production.
+
+For each flush interval, the table shows the repository saves the use
+cases made, the entity writes that reached the backend, and the
+reduction overall and per repository.
+
+    python benchmarks/bench_write_behind.py --users 200 --intervals 1 5 30
+"""
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from habit_hero.container import Container, Settings
+from habit_hero.infrastructure.persistence.write_behind import (
+    WriteBehindCharacterRepository,
+    WriteBehindDashboardRepository,
+    WriteBehindHabitLogRepository,
+    WriteBehindStreakRepository,
+)
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+
+START = date(2025, 6, 1)
+WRAPPERS = {
+    "characters": WriteBehindCharacterRepository,
+    "streaks": WriteBehindStreakRepository,
+    "logs": WriteBehindHabitLogRepository,
+    "dashboards": WriteBehindDashboardRepository,
+}
+
+
+class SimulatedClock:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+
+    def __call__(self) -> float:
+        return self.seconds
+
+
+def run(args: argparse.Namespace, interval: float) -> tuple:
+    clock = SimulatedClock()
+    container = Container(Settings())
+    wrappers = {}
+    for name, wrapper in WRAPPERS.items():
+        wrappers[name] = wrapper(
+            container.repository(name),
+            max_pending=args.max_pending,
+            flush_interval=interval,
+            clock=clock,
+        )
+        container.override(name, wrappers[name])
+
+    rng = random.Random(args.seed)
+    users = []
+    for _ in range(args.users):
+        user = container.use_case("create_user").execute(
+            CreateUserRequest(long_term_vision="Benchmark.")
+        ).user
+        habits = [
+            container.use_case("create_habit").execute(
+                CreateHabitRequest(
+                    user_id=user.id,
+                    name=f"Habit {h}",
+                    cue="Cue",
+                    action="Action",
+                    reward="Reward",
+                    estimated_minutes=5,
+                )
+            )
+            for h in range(args.habits)
+        ]
+        users.append((user.id, habits))
+
+    complete = container.use_case("complete_habit")
+    log_life_force = container.use_case("log_life_force")
+    per_minute = args.users * args.per_minute
+    started = time.perf_counter()
+    for minute in range(args.minutes):
+        # one simulated day per minute keeps every completion a real update
+        day = START + timedelta(days=minute)
+        for i in range(per_minute):
+            clock.seconds = minute * 60 + 60 * i / per_minute
+            user_id, habits = users[rng.randrange(len(users))]
+            habit = rng.choice(habits)
+            complete.execute(CompleteHabitRequest(user_id, habit.id, day))
+            if i % (10 * args.per_minute) == 0:
+                log_life_force.execute(LogLifeForceRequest(user_id, day, 2, 2))
+    container.close()
+    elapsed = time.perf_counter() - started
+
+    return {name: w.stats for name, w in wrappers.items()}, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--habits", type=int, default=5)
+    parser.add_argument("--per-minute", type=int, default=4)
+    parser.add_argument("--minutes", type=int, default=30)
+    parser.add_argument("--max-pending", type=int, default=10_000)
+    parser.add_argument("--intervals", type=float, nargs="+", default=[0, 1, 5, 30])
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for interval in args.intervals:
+        stats, elapsed = run(args, interval)
+        saves = sum(s.saves for s in stats.values())
+        writes = sum(s.writes for s in stats.values())
+        flushes = sum(s.flushes for s in stats.values())
+        label = "write-through" if interval == 0 else f"every {interval:g}s"
+        per_repository = " ".join(
+            f"{name}={s.write_reduction:.1f}x" for name, s in stats.items()
+        )
+        print(
+            f"{label:>14}: saves={saves:>8,} backend_writes={writes:>8,} "
+            f"batches={flushes:>7,} reduction={saves / writes:5.2f}x "
+            f"({elapsed:.2f}s)\n{'':>16}{per_repository}"
+        )
+
+
+if __name__ == "__main__":
+    main()
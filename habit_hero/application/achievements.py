@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Sequence
+
+from habit_hero.application.ports import AchievementRepository, EventPublisher
+from habit_hero.domain.achievements import AchievementProgress, record_metrics
+from habit_hero.domain.events import (
+    AchievementUnlocked,
+    DomainEvent,
+    HabitCompleted,
+    LevelUp,
+    LifeForceLogged,
+)
+
+
+class AchievementEngine:
+    """
+    Unlocks achievements as domain events come in.
+
+    Rules are never re-checked wholesale: each event raises a metric or
+    two, and a raised metric is compared with the user's cached next
+    threshold for it. Only when that threshold is crossed are the rules
+    in [threshold, value] looked up and unlocked, and the next
+    threshold above the new value cached.
+
+    handle() takes a batch, so it can be subscribed to the event bus
+    directly; each user's progress is read and saved once per batch.
+    Unlocks are published before progress is saved: if publishing
+    fails, the metrics are kept but the unlocks are not, so they are
+    unlocked (and published) again on the metric's next raise.
+    """
+
+    EVENT_TYPES = (HabitCompleted, LevelUp, LifeForceLogged)
+
+    def __init__(
+        self,
+        achievements: AchievementRepository,
+        events: Optional[EventPublisher] = None,
+    ) -> None:
+        self.achievements = achievements
+        self.events = events
+
+    def handle(self, events: Sequence[DomainEvent]) -> List[AchievementUnlocked]:
+        by_user: Dict[str, List[DomainEvent]] = {}
+        for event in events:
+            by_user.setdefault(event.user_id, []).append(event)
+
+        unlocked: List[AchievementUnlocked] = []
+        progresses: Dict[str, AchievementProgress] = {}
+        for user_id, user_events in by_user.items():
+            progress = self.achievements.get_progress(user_id)
+            if progress is None:
+                progress = AchievementProgress(user_id=user_id)
+            for event in user_events:
+                for metric in record_metrics(progress, event):
+                    self._evaluate(progress, metric, unlocked)
+            progresses[user_id] = progress
+
+        try:
+            if unlocked and self.events is not None:
+                self.events.publish(unlocked)
+        except Exception:
+            for event in unlocked:
+                progress = progresses[event.user_id]
+                del progress.unlocked[event.rule_id]
+                # Rebuilt from the lowest threshold on the next raise,
+                # which finds the rolled back rules again
+                progress.next_thresholds.clear()
+            raise
+        finally:
+            # Saved even when no metric went up: LifeForce day flags may
+            # still have changed
+            for progress in progresses.values():
+                self.achievements.save_progress(progress)
+        return unlocked
+
+    def _evaluate(
+        self,
+        progress: AchievementProgress,
+        metric: str,
+        unlocked: List[AchievementUnlocked],
+    ) -> None:
+        version = self.achievements.rules_version()
+        if progress.rules_version != version:
+            # Rules changed since the cache was built: start from the
+            # lowest threshold again, already unlocked rules are skipped
+            progress.next_thresholds.clear()
+            progress.rules_version = version
+        if metric not in progress.next_thresholds:
+            progress.next_thresholds[metric] = self.achievements.next_threshold(metric, 0)
+
+        value = progress.values[metric]
+        threshold = progress.next_thresholds[metric]
+        if threshold is None or value < threshold:
+            return
+
+        for rule in self.achievements.rules_between(metric, threshold, value):
+            if rule.id in progress.unlocked:
+                continue
+            progress.unlocked[rule.id] = None
+            unlocked.append(
+                AchievementUnlocked(user_id=progress.user_id, rule_id=rule.id, name=rule.name)
+            )
+        progress.next_thresholds[metric] = self.achievements.next_threshold(metric, value)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, TypeVar
+
+from habit_hero.application.ports import CharacterRepository, ConcurrencyError
+from habit_hero.domain.entities import Character
+from habit_hero.domain.events import DomainEvent, level_up
+from habit_hero.domain.services import apply_xp
+
+T = TypeVar("T")
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Re-runs a read-modify-write operation when a versioned save loses
+    a race, with jittered exponential backoff between attempts.
+    """
+    attempts: int = 8
+    base_delay: float = 0.0005
+    max_delay: float = 0.05
+    sleep: Callable[[float], None] = time.sleep
+    # counters, handy for metrics and benchmarks
+    runs: int = field(default=0, compare=False)
+    retries: int = field(default=0, compare=False)
+
+    def run(self, operation: Callable[[], T]) -> T:
+        self.runs += 1
+        for attempt in range(self.attempts):
+            try:
+                return operation()
+            except ConcurrencyError:
+                if attempt == self.attempts - 1:
+                    raise
+                self.retries += 1
+                delay = min(self.base_delay * (2 ** attempt), self.max_delay)
+                self.sleep(delay * random.uniform(0.5, 1.5))
+        raise AssertionError("unreachable")
+
+
+def award_xp(
+    characters: CharacterRepository,
+    user_id: str,
+    xp: int,
+    retry: RetryPolicy,
+    events: Optional[List[DomainEvent]] = None,
+) -> Optional[Character]:
+    """
+    Apply XP to the user's character and save it, re-reading and
+    retrying if another writer got there first.
+    Returns the updated character, or None if the user has none.
+    If `events` is given, a LevelUp is appended to it when one happened.
+    """
+
+    def attempt() -> Optional[tuple[int, Character]]:
+        character = characters.get_for_user(user_id)
+        if character is None:
+            return None
+        previous_level = character.level
+        updated = apply_xp(character, xp)
+        characters.save(updated)
+        return previous_level, updated
+
+    saved = retry.run(attempt)
+    if saved is None:
+        return None
+    previous_level, updated = saved
+    if events is not None:
+        event = level_up(previous_level, updated)
+        if event is not None:
+            events.append(event)
+    return updated
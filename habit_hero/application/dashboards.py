@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import date
+from typing import Callable, Optional
+
+from habit_hero.application.ports import (
+    CharacterRepository,
+    DashboardRepository,
+    HabitRepository,
+    LifeForceRepository,
+    StreakRepository,
+)
+from habit_hero.domain.entities import (
+    Character,
+    Dashboard,
+    DashboardHabit,
+    Habit,
+    LifeForceCheck,
+    StreakState,
+)
+
+# Helpers the write-side use cases call to keep the Dashboard read model
+# in step with what they just saved. Each is one repository update(),
+# so concurrent changes to the same dashboard are not lost.
+# Habit entries are replaced rather than changed in place, so a
+# repository only has to copy the dashboard and its habits dict.
+# Users without a dashboard are skipped: GetDashboardUseCase composes
+# theirs in full on first read, which is safer than growing one from
+# whatever change happens to come first.
+
+
+def _update(
+    dashboards: Optional[DashboardRepository],
+    user_id: str,
+    change: Callable[[Dashboard], None],
+) -> None:
+    if dashboards is not None:
+        dashboards.update(user_id, change)
+
+
+def start_dashboard(
+    dashboards: Optional[DashboardRepository],
+    character: Character,
+) -> None:
+    """
+    Dashboard for a brand new user: just their starting character.
+    """
+    if dashboards is not None:
+        dashboards.save(Dashboard(user_id=character.user_id, character=_copy(character)))
+
+
+def record_character(
+    dashboards: Optional[DashboardRepository],
+    character: Optional[Character],
+) -> None:
+    if character is None:
+        return
+
+    def change(dashboard: Dashboard) -> None:
+        dashboard.character = _copy(character)
+
+    _update(dashboards, character.user_id, change)
+
+
+def record_habit(dashboards: Optional[DashboardRepository], habit: Habit) -> None:
+    """
+    Add or refresh an active habit; inactive habits leave the dashboard.
+    """
+
+    def change(dashboard: Dashboard) -> None:
+        if not habit.active:
+            dashboard.habits.pop(habit.id, None)
+            return
+        entry = dashboard.habits.get(habit.id)
+        if entry is None:
+            dashboard.habits[habit.id] = _dashboard_habit(habit, None)
+        else:
+            dashboard.habits[habit.id] = replace(
+                entry,
+                name=habit.name,
+                cue=habit.cue,
+                base_xp=habit.base_xp,
+                is_bad_habit=habit.is_bad_habit,
+            )
+
+    _update(dashboards, habit.user_id, change)
+
+
+def record_streak(dashboards: Optional[DashboardRepository], streak: StreakState) -> None:
+    def change(dashboard: Dashboard) -> None:
+        entry = dashboard.habits.get(streak.habit_id)
+        if entry is None:
+            return
+        dashboard.habits[streak.habit_id] = replace(
+            entry,
+            current_streak=streak.current_streak,
+            longest_streak=streak.longest_streak,
+            last_completed_day=streak.last_completed_day,
+        )
+
+    _update(dashboards, streak.user_id, change)
+
+
+def record_life_force(
+    dashboards: Optional[DashboardRepository],
+    check: LifeForceCheck,
+) -> None:
+    def change(dashboard: Dashboard) -> None:
+        # A backfilled older day does not replace a newer check
+        if dashboard.life_force is None or check.day >= dashboard.life_force.day:
+            dashboard.life_force = check
+
+    _update(dashboards, check.user_id, change)
+
+
+def compose_dashboard(
+    user_id: str,
+    today: date,
+    characters: CharacterRepository,
+    habits: HabitRepository,
+    streaks: StreakRepository,
+    life_force: LifeForceRepository,
+) -> Dashboard:
+    """
+    Build a user's dashboard from the write-side repositories: one call
+    per repository plus one streak lookup per habit. Used to seed the
+    read model for users it has not seen yet.
+    """
+    dashboard = Dashboard(user_id=user_id, character=characters.get_for_user(user_id))
+    for habit in habits.list_for_user(user_id):
+        streak = streaks.get(user_id, habit.id)
+        dashboard.habits[habit.id] = _dashboard_habit(habit, streak)
+    dashboard.life_force = life_force.get_for_day(user_id, today)
+    return dashboard
+
+
+def _copy(character: Character) -> Character:
+    return replace(character, appearance=dict(character.appearance))
+
+
+def _dashboard_habit(habit: Habit, streak: Optional[StreakState]) -> DashboardHabit:
+    entry = DashboardHabit(
+        habit_id=habit.id,
+        name=habit.name,
+        cue=habit.cue,
+        base_xp=habit.base_xp,
+        is_bad_habit=habit.is_bad_habit,
+    )
+    if streak is not None:
+        entry.current_streak = streak.current_streak
+        entry.longest_streak = streak.longest_streak
+        entry.last_completed_day = streak.last_completed_day
+    return entry
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from uuid import uuid4
+
+from habit_hero.application.ports import IdGenerator
+
+
+class UuidIdGenerator(IdGenerator):
+    """
+    The original scheme: prefix plus a random 32-character uuid4 hex.
+    Needs no coordination, so it is the default when nothing else is
+    injected; the container wires a time-ordered generator instead.
+    """
+
+    def new_id(self, prefix: str) -> str:
+        return f"{prefix}-{uuid4().hex}"
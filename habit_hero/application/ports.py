@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from datetime import date
-from typing import List, Optional, Protocol
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Protocol, Sequence
 from typing_extensions import runtime_checkable
 
 from habit_hero.domain.entities import (
@@ -10,9 +10,23 @@ from habit_hero.domain.entities import (
     Character,
     Habit,
     HabitLog,
+    HabitLogMonth,
     StreakState,
     LifeForceCheck,
+    LifeForceTrend,
+    FocusSession,
+    Reminder,
+    Dashboard,
 )
+from habit_hero.domain.achievements import AchievementProgress, AchievementRule
+from habit_hero.domain.events import DomainEvent
+
+
+class ConcurrencyError(RuntimeError):
+    """
+    Raised by a versioned save() when the stored entity changed since
+    it was read (its version no longer matches). Re-read and retry.
+    """
 
 
 class UserRepository(ABC):
@@ -24,6 +38,14 @@ class UserRepository(ABC):
     def save(self, user: User) -> None:
         ...
 
+    def save_many(self, users: Sequence[User]) -> None:
+        """
+        Save a batch. The default saves one by one; backends that can
+        write a batch in one round trip override it.
+        """
+        for user in users:
+            self.save(user)
+
 
 class CharacterRepository(ABC):
     @abstractmethod
@@ -32,6 +54,25 @@ class CharacterRepository(ABC):
 
     @abstractmethod
     def save(self, character: Character) -> None:
+        """
+        Compare-and-swap: raises ConcurrencyError if the stored version
+        differs from character.version, otherwise stores it and bumps
+        character.version.
+        """
+        ...
+
+    def save_many(self, characters: Sequence[Character]) -> None:
+        """
+        Like save() (compare-and-swap per character), for a batch.
+        """
+        for character in characters:
+            self.save(character)
+
+    @abstractmethod
+    def list_top(self, limit: int) -> List[Character]:
+        """
+        The `limit` highest characters by (level, xp), best first.
+        """
         ...
 
 
@@ -44,18 +85,86 @@ class HabitRepository(ABC):
     def list_for_user(self, user_id: str) -> List[Habit]:
         ...
 
+    @abstractmethod
+    def list_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[str] = None,
+        active: Optional[bool] = True,
+        is_bad_habit: Optional[bool] = None,
+        replaces_habit_id: Optional[str] = None,
+    ) -> List[Habit]:
+        """
+        Up to `limit` of the user's habits in creation order, starting
+        after the habit with id `after`. A None filter matches anything.
+        Raises ValueError if `after` is not one of the user's habits.
+        """
+        ...
+
+    @abstractmethod
+    def list_with_reminders(self) -> List[Habit]:
+        """
+        Every user's active habits that have a reminder_time, for
+        re-arming the reminder index when a process starts.
+        """
+        ...
+
     @abstractmethod
     def save(self, habit: Habit) -> None:
         ...
 
+    def save_many(self, habits: Sequence[Habit]) -> None:
+        for habit in habits:
+            self.save(habit)
+
 
 class HabitLogRepository(ABC):
+    """
+    Completion logs. Old history can be compacted into per-(user, habit,
+    month) HabitLogMonth aggregates; day-level reads (list_for_day,
+    list_range) only see logs that are still raw.
+    """
+
     @abstractmethod
     def list_for_day(self, user_id: str, day: date) -> List[HabitLog]:
         ...
 
+    @abstractmethod
+    def list_range(self, user_id: str, start: date, end: date) -> List[HabitLog]:
+        """
+        Raw logs with start <= day <= end, oldest day first.
+        """
+        ...
+
+    @abstractmethod
+    def monthly_totals(self, user_id: str, start: date, end: date) -> List[HabitLogMonth]:
+        """
+        Per (habit, month) totals for the range, ordered by month then
+        habit: raw logs are aggregated on the fly and merged with the
+        compacted months. Compacted months count whole if any of their
+        completions fall in the range.
+        """
+        ...
+
     @abstractmethod
     def save(self, log: HabitLog) -> None:
+        """
+        A log for an already compacted (habit, month) is folded into
+        that month instead of being kept raw.
+        """
+        ...
+
+    def save_many(self, logs: Sequence[HabitLog]) -> None:
+        for log in logs:
+            self.save(log)
+
+    @abstractmethod
+    def compact_before(self, cutoff: date) -> int:
+        """
+        Fold every raw log older than `cutoff` into its month and drop
+        it. Returns how many raw logs were compacted.
+        """
         ...
 
 
@@ -64,12 +173,169 @@ class StreakRepository(ABC):
     def get(self, user_id: str, habit_id: str) -> Optional[StreakState]:
         ...
 
+    @abstractmethod
+    def list_completed_before(self, day: date) -> List[StreakState]:
+        """
+        Return live streaks (current_streak > 0) whose last completion
+        is before the given day.
+        """
+        ...
+
     @abstractmethod
     def save(self, streak: StreakState) -> None:
+        """
+        Compare-and-swap, same contract as CharacterRepository.save().
+        """
         ...
 
+    def save_many(self, streaks: Sequence[StreakState]) -> None:
+        """
+        Like save() (compare-and-swap per streak), for a batch.
+        """
+        for streak in streaks:
+            self.save(streak)
+
 @runtime_checkable
 class LifeForceRepository(Protocol):
     def save(self, check: LifeForceCheck) -> None: ...
     def get_for_day(self, user_id: str, day: date) -> Optional[LifeForceCheck]: ...
+    def list_range(self, user_id: str, start: date, end: date) -> List[LifeForceCheck]: ...
+    def trend(self, user_id: str, start: date, end: date) -> LifeForceTrend: ...
+    def trends(
+        self, user_ids: Iterable[str], start: date, end: date
+    ) -> Dict[str, LifeForceTrend]: ...
+
+
+class FocusSessionRepository(ABC):
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[FocusSession]:
+        ...
+
+    @abstractmethod
+    def save(self, session: FocusSession) -> None:
+        ...
+
+
+class DashboardRepository(ABC):
+    """
+    Stores the per-user Dashboard read model.
+    """
+
+    @abstractmethod
+    def get(self, user_id: str) -> Optional[Dashboard]:
+        ...
+
+    @abstractmethod
+    def save(self, dashboard: Dashboard) -> None:
+        ...
+
+    @abstractmethod
+    def update(self, user_id: str, change: Callable[[Dashboard], None]) -> None:
+        """
+        Apply `change` to the user's stored dashboard and save it, as one
+        step: concurrent updates of the same dashboard are not lost.
+        Does nothing if the user has no dashboard.
+        """
+        ...
+
+    def save_many(self, dashboards: Sequence[Dashboard]) -> None:
+        for dashboard in dashboards:
+            self.save(dashboard)
+
+
+class AchievementRepository(ABC):
+    """
+    Achievement rules, indexed by the metric they watch and ordered by
+    threshold, plus each user's AchievementProgress.
+    """
 
+    @abstractmethod
+    def add_rule(self, rule: AchievementRule) -> None:
+        """
+        Add or replace a rule. Bumps rules_version().
+        """
+        ...
+
+    @abstractmethod
+    def get_rule(self, rule_id: str) -> Optional[AchievementRule]:
+        ...
+
+    @abstractmethod
+    def rules_version(self) -> int:
+        ...
+
+    @abstractmethod
+    def next_threshold(self, metric: str, value: int) -> Optional[int]:
+        """
+        The lowest threshold above `value` among the metric's rules.
+        """
+        ...
+
+    @abstractmethod
+    def rules_between(self, metric: str, low: int, high: int) -> List[AchievementRule]:
+        """
+        The metric's rules with low <= threshold <= high, lowest first.
+        """
+        ...
+
+    @abstractmethod
+    def get_progress(self, user_id: str) -> Optional[AchievementProgress]:
+        ...
+
+    @abstractmethod
+    def save_progress(self, progress: AchievementProgress) -> None:
+        ...
+
+
+@runtime_checkable
+class Clock(Protocol):
+    def now(self) -> datetime: ...
+
+
+class IdGenerator(ABC):
+    """
+    Mints entity ids such as "user-..." or "habit-...".
+    """
+
+    @abstractmethod
+    def new_id(self, prefix: str) -> str:
+        ...
+
+
+class TimerScheduler(ABC):
+    """
+    Schedules keyed timers and hands back the keys that have come due.
+    """
+
+    @abstractmethod
+    def schedule(self, key: str, due_at: datetime) -> None:
+        ...
+
+    @abstractmethod
+    def cancel(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def pop_due(self, now: datetime) -> List[str]:
+        ...
+
+
+class ReminderOutbox(ABC):
+    """
+    Where due reminders are handed off for delivery (push, email, ...).
+    """
+
+    @abstractmethod
+    def deliver(self, reminders: List[Reminder]) -> None:
+        ...
+
+
+class EventPublisher(ABC):
+    """
+    Where use cases hand off the domain events they emit. Implementations
+    may deliver later; publish() should not wait for subscribers.
+    """
+
+    @abstractmethod
+    def publish(self, events: Sequence[DomainEvent]) -> None:
+        ...
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from habit_hero.application.ports import (
+    Clock,
+    FocusSessionRepository,
+    TimerScheduler,
+)
+from habit_hero.domain.entities import FocusSession
+
+
+@dataclass
+class CancelFocusSessionRequest:
+    """
+    Cancel a running focus session. No XP is granted.
+    """
+    user_id: str
+    session_id: str
+
+
+class CancelFocusSessionUseCase:
+    """
+    Stops a running focus session and disarms its timer.
+    """
+
+    def __init__(
+        self,
+        sessions: FocusSessionRepository,
+        timers: TimerScheduler,
+        clock: Clock,
+    ) -> None:
+        self.sessions = sessions
+        self.timers = timers
+        self.clock = clock
+
+    def execute(self, req: CancelFocusSessionRequest) -> FocusSession:
+        session = self.sessions.get(req.session_id)
+        if session is None or session.user_id != req.user_id:
+            raise ValueError("Focus session not found for this user.")
+        if session.completed_at is not None or session.cancelled_at is not None:
+            raise ValueError("Focus session is no longer running.")
+
+        self.timers.cancel(session.id)
+        session.cancelled_at = self.clock.now()
+        self.sessions.save(session)
+        return session
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from habit_hero.application.ports import HabitLogRepository
+from habit_hero.domain.services import month_of
+
+
+@dataclass
+class CompactHabitLogsRequest:
+    """
+    Keep day-level logs for the last `retention_days` days (rounded back
+    to the start of that month); older ones become monthly totals.
+    """
+    today: date
+    retention_days: int = 365
+
+
+@dataclass
+class CompactHabitLogsResult:
+    cutoff: date
+    logs_compacted: int
+
+
+class CompactHabitLogsUseCase:
+    """
+    Retention job for HabitLog history. Run it periodically (e.g. daily);
+    it only touches logs older than the cutoff.
+
+    Only whole months are compacted, so a month is either raw or
+    compacted. Streaks live in the streak repository and character XP
+    on the character, so neither depends on the raw logs; the compacted
+    months keep each habit's completion count and XP sum exactly.
+    """
+
+    def __init__(self, logs: HabitLogRepository) -> None:
+        self.logs = logs
+
+    def execute(self, req: CompactHabitLogsRequest) -> CompactHabitLogsResult:
+        if req.retention_days <= 0:
+            raise ValueError("retention_days must be positive.")
+        cutoff = month_of(req.today - timedelta(days=req.retention_days))
+        return CompactHabitLogsResult(
+            cutoff=cutoff,
+            logs_compacted=self.logs.compact_before(cutoff),
+        )
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from habit_hero.application.concurrency import RetryPolicy, award_xp
+from habit_hero.application.dashboards import record_character
+from habit_hero.application.ports import (
+    CharacterRepository,
+    Clock,
+    DashboardRepository,
+    EventPublisher,
+    FocusSessionRepository,
+    TimerScheduler,
+)
+from habit_hero.domain.entities import Character, FocusSession
+from habit_hero.domain.events import DomainEvent
+from habit_hero.domain.services import xp_gain_for_focus_session
+
+
+@dataclass
+class CompleteFocusSessionRequest:
+    """
+    Complete a focus session whose timer has run its full length.
+    """
+    user_id: str
+    session_id: str
+
+
+@dataclass
+class CompleteFocusSessionResult:
+    """
+    The completed session and the updated character (if one exists).
+    """
+    session: FocusSession
+    character: Character | None
+
+
+class CompleteFocusSessionUseCase:
+    """
+    Completes a focus session on the user's request (e.g. the client
+    reports the timer finished before the server tick picked it up),
+    disarms its timer and grants the XP.
+    """
+
+    def __init__(
+        self,
+        sessions: FocusSessionRepository,
+        characters: CharacterRepository,
+        timers: TimerScheduler,
+        clock: Clock,
+        retry: RetryPolicy | None = None,
+        events: EventPublisher | None = None,
+        dashboards: DashboardRepository | None = None,
+    ) -> None:
+        self.sessions = sessions
+        self.characters = characters
+        self.timers = timers
+        self.clock = clock
+        self.retry = retry or RetryPolicy()
+        self.events = events
+        self.dashboards = dashboards
+
+    def execute(self, req: CompleteFocusSessionRequest) -> CompleteFocusSessionResult:
+        session = self.sessions.get(req.session_id)
+        if session is None or session.user_id != req.user_id:
+            raise ValueError("Focus session not found for this user.")
+        if session.completed_at is not None or session.cancelled_at is not None:
+            raise ValueError("Focus session is no longer running.")
+
+        now = self.clock.now()
+        if now < session.started_at + timedelta(minutes=session.duration_minutes):
+            raise ValueError("Focus session has not finished yet.")
+
+        self.timers.cancel(session.id)
+        session.completed_at = now
+        session.xp_earned = xp_gain_for_focus_session(session)
+        self.sessions.save(session)
+
+        events: list[DomainEvent] = []
+        updated_character = award_xp(
+            self.characters, req.user_id, session.xp_earned, self.retry, events
+        )
+        if self.events is not None and events:
+            self.events.publish(events)
+        record_character(self.dashboards, updated_character)
+
+        return CompleteFocusSessionResult(
+            session=session,
+            character=updated_character,
+        )
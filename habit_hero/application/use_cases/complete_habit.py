@@ -1,20 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date, datetime, time
 
 from habit_hero.application.ports import (
     HabitRepository,
     HabitLogRepository,
     StreakRepository,
     CharacterRepository,
+    TimerScheduler,
+    EventPublisher,
+    DashboardRepository,
 )
-from habit_hero.domain.entities import HabitLog
+from habit_hero.application.concurrency import RetryPolicy, award_xp
+from habit_hero.application.dashboards import record_character, record_streak
+from habit_hero.domain.entities import HabitLog, StreakState
+from habit_hero.domain.events import DomainEvent, HabitCompleted, streak_broken_by
 from habit_hero.domain.services import (
     calculate_new_streak,
-    xp_gain_for_habit,
-    apply_xp,
+    next_reminder_at,
 )
+from habit_hero.domain.xp_rules import XpRuleEngine
 
 
 @dataclass
@@ -32,11 +38,16 @@ class CompleteHabitUseCase:
     Orchestrates what happens when a user completes a habit:
       1) fetch the habit
       2) fetch existing streak
-      3) calculate new streak
+      3) calculate + save the new streak
       4) calculate XP
-      5) create a HabitLog
+      5) create + save a HabitLog
       6) update the character's XP / level
-      7) save everything
+      7) push today's cue reminder (if any) to the next day
+      8) publish HabitCompleted (plus StreakBroken / LevelUp if they happened)
+      9) refresh the user's dashboard read model
+
+    Streak and character saves are versioned; if another worker updates
+    them first, that step re-reads and retries instead of overwriting.
     """
 
     def __init__(
@@ -45,11 +56,21 @@ class CompleteHabitUseCase:
         logs: HabitLogRepository,
         streaks: StreakRepository,
         characters: CharacterRepository,
+        reminders: TimerScheduler | None = None,
+        xp_rules: XpRuleEngine | None = None,
+        retry: RetryPolicy | None = None,
+        events: EventPublisher | None = None,
+        dashboards: DashboardRepository | None = None,
     ) -> None:
         self.habits = habits
         self.logs = logs
         self.streaks = streaks
         self.characters = characters
+        self.reminders = reminders
+        self.xp_rules = xp_rules or XpRuleEngine()
+        self.retry = retry or RetryPolicy()
+        self.events = events
+        self.dashboards = dashboards
 
     def execute(self, req: CompleteHabitRequest) -> None:
         """
@@ -60,16 +81,25 @@ class CompleteHabitUseCase:
         if habit is None or habit.user_id != req.user_id:
             raise ValueError("Habit not found for this user.")
 
-        # 2. Fetch existing streak
-        existing_streak = self.streaks.get(req.user_id, req.habit_id)
+        # 2–3. Fetch existing streak, calculate and save the new one
+        events: list[DomainEvent] = []
+
+        def update_streak() -> StreakState:
+            existing_streak = self.streaks.get(req.user_id, req.habit_id)
+            new_streak = calculate_new_streak(existing_streak, habit, req.day)
+            self.streaks.save(new_streak)
+            broken = streak_broken_by(existing_streak, req.day)
+            if broken is not None:
+                events.append(broken)
+            return new_streak
 
-        # 3. Calculate new streak
-        new_streak = calculate_new_streak(existing_streak, habit, req.day)
+        new_streak = self.retry.run(update_streak)
 
         # 4. Calculate XP
-        xp = xp_gain_for_habit(habit, new_streak)
+        xp = self.xp_rules.habit_xp(habit, new_streak)
 
-        # 5. Create log
+        # 5. Create + save log (the id is per habit per day, so a retried
+        #    request overwrites rather than duplicates it)
         log = HabitLog(
             id=f"log-{req.habit_id}-{req.day.isoformat()}",
             user_id=req.user_id,
@@ -78,15 +108,32 @@ class CompleteHabitUseCase:
             completed_at=datetime.utcnow(),
             xp_earned=xp,
         )
+        self.logs.save(log)
 
         # 6. Update character
-        character = self.characters.get_for_user(req.user_id)
-        if character is not None:
-            updated = apply_xp(character, xp)
-            self.characters.save(updated)
+        events.append(
+            HabitCompleted(
+                user_id=req.user_id,
+                habit_id=req.habit_id,
+                day=req.day,
+                xp_earned=xp,
+                current_streak=new_streak.current_streak,
+            )
+        )
+        character = award_xp(self.characters, req.user_id, xp, self.retry, events)
 
-        # 7. Save streak + log
-        self.streaks.save(new_streak)
-        self.logs.save(log)
+        # 7. No need to remind about a habit already done for the day
+        if self.reminders is not None:
+            next_fire = next_reminder_at(habit, datetime.combine(req.day, time.max))
+            if next_fire is not None:
+                self.reminders.schedule(habit.id, next_fire)
+
+        # 8. Subscribers run off the request path
+        if self.events is not None:
+            self.events.publish(events)
+
+        # 9. Keep the home screen a single lookup
+        record_streak(self.dashboards, new_streak)
+        record_character(self.dashboards, character)
 
         return None
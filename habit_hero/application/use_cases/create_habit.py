@@ -1,10 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from uuid import uuid4
+from datetime import datetime, time
 
-from habit_hero.application.ports import HabitRepository
+from habit_hero.application.dashboards import record_habit
+from habit_hero.application.ids import UuidIdGenerator
+from habit_hero.application.ports import (
+    Clock,
+    DashboardRepository,
+    HabitRepository,
+    IdGenerator,
+    TimerScheduler,
+)
 from habit_hero.domain.entities import Habit
+from habit_hero.domain.services import next_reminder_at
 
 
 @dataclass
@@ -21,15 +30,28 @@ class CreateHabitRequest:
     base_xp: int | None = None
     is_bad_habit: bool = False
     replaces_habit_id: str | None = None
+    reminder_time: time | None = None
 
 
 class CreateHabitUseCase:
     """
     Use case to create a new habit and store it via the HabitRepository.
+    If the habit has a reminder time, its first cue reminder is scheduled.
     """
 
-    def __init__(self, habits: HabitRepository) -> None:
+    def __init__(
+        self,
+        habits: HabitRepository,
+        reminders: TimerScheduler | None = None,
+        clock: Clock | None = None,
+        ids: IdGenerator | None = None,
+        dashboards: DashboardRepository | None = None,
+    ) -> None:
         self.habits = habits
+        self.reminders = reminders
+        self.clock = clock
+        self.ids = ids or UuidIdGenerator()
+        self.dashboards = dashboards
 
     def execute(self, req: CreateHabitRequest) -> Habit:
         # Decide base XP if not explicitly set
@@ -40,7 +62,7 @@ class CreateHabitUseCase:
             base_xp = max(5, min(50, (req.estimated_minutes // 10) * 5))
 
         habit = Habit(
-            id=f"habit-{uuid4().hex}",
+            id=self.ids.new_id("habit"),
             user_id=req.user_id,
             name=req.name,
             cue=req.cue,
@@ -51,7 +73,16 @@ class CreateHabitUseCase:
             is_bad_habit=req.is_bad_habit,
             replaces_habit_id=req.replaces_habit_id,
             active=True,
+            reminder_time=req.reminder_time,
         )
 
         self.habits.save(habit)
+        record_habit(self.dashboards, habit)
+
+        if self.reminders is not None:
+            now = self.clock.now() if self.clock is not None else datetime.utcnow()
+            next_fire = next_reminder_at(habit, now)
+            if next_fire is not None:
+                self.reminders.schedule(habit.id, next_fire)
+
         return habit
@@ -2,18 +2,29 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from uuid import uuid4
 
-from habit_hero.application.ports import UserRepository, CharacterRepository
+from habit_hero.application.dashboards import start_dashboard
+from habit_hero.application.ids import UuidIdGenerator
+from habit_hero.application.ports import (
+    UserRepository,
+    CharacterRepository,
+    DashboardRepository,
+    EventPublisher,
+    IdGenerator,
+)
 from habit_hero.domain.entities import User, Character
+from habit_hero.domain.events import UserCreated
 
 
 @dataclass
 class CreateUserRequest:
     """
     Data needed to create a new user.
+    user_id can be pre-assigned (e.g. by a shard router that needs the
+    id to pick a shard); otherwise a new one is generated.
     """
     long_term_vision: str
+    user_id: str | None = None
 
 
 @dataclass
@@ -34,13 +45,19 @@ class CreateUserUseCase:
         self,
         users: UserRepository,
         characters: CharacterRepository,
+        events: EventPublisher | None = None,
+        ids: IdGenerator | None = None,
+        dashboards: DashboardRepository | None = None,
     ) -> None:
         self.users = users
         self.characters = characters
+        self.events = events
+        self.ids = ids or UuidIdGenerator()
+        self.dashboards = dashboards
 
     def execute(self, req: CreateUserRequest) -> CreateUserResponse:
         user = User(
-            id=f"user-{uuid4().hex}",
+            id=req.user_id or self.ids.new_id("user"),
             long_term_vision=req.long_term_vision,
             created_at=datetime.utcnow(),
         )
@@ -48,5 +65,9 @@ class CreateUserUseCase:
 
         character = Character(user_id=user.id)
         self.characters.save(character)
+        start_dashboard(self.dashboards, character)
+
+        if self.events is not None:
+            self.events.publish([UserCreated(user_id=user.id)])
 
         return CreateUserResponse(user=user, character=character)
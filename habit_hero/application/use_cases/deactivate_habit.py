@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from habit_hero.application.dashboards import record_habit
+from habit_hero.application.ports import (
+    DashboardRepository,
+    HabitRepository,
+    TimerScheduler,
+)
+from habit_hero.domain.entities import Habit
+
+
+@dataclass
+class DeactivateHabitRequest:
+    """
+    Request to stop tracking (but keep the history of) a habit.
+    """
+    user_id: str
+    habit_id: str
+
+
+class DeactivateHabitUseCase:
+    """
+    Marks a habit inactive and drops its pending cue reminder.
+    """
+
+    def __init__(
+        self,
+        habits: HabitRepository,
+        reminders: TimerScheduler | None = None,
+        dashboards: DashboardRepository | None = None,
+    ) -> None:
+        self.habits = habits
+        self.reminders = reminders
+        self.dashboards = dashboards
+
+    def execute(self, req: DeactivateHabitRequest) -> Habit:
+        habit = self.habits.get(req.habit_id)
+        if habit is None or habit.user_id != req.user_id:
+            raise ValueError("Habit not found for this user.")
+
+        habit.active = False
+        self.habits.save(habit)
+        record_habit(self.dashboards, habit)
+
+        if self.reminders is not None:
+            self.reminders.cancel(habit.id)
+
+        return habit
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from habit_hero.application.ports import (
+    Clock,
+    HabitRepository,
+    ReminderOutbox,
+    TimerScheduler,
+)
+from habit_hero.domain.entities import Reminder
+from habit_hero.domain.services import next_reminder_at
+
+
+@dataclass
+class DispatchRemindersResult:
+    """
+    How many reminders came due this tick and how many were delivered.
+    """
+    due: int
+    delivered: int
+
+
+class DispatchRemindersUseCase:
+    """
+    Reminder tick: pops only the reminders that are due, hands them to
+    the outbox in one batch and schedules each habit's next cue.
+    """
+
+    def __init__(
+        self,
+        habits: HabitRepository,
+        reminders: TimerScheduler,
+        outbox: ReminderOutbox,
+        clock: Clock,
+    ) -> None:
+        self.habits = habits
+        self.reminders = reminders
+        self.outbox = outbox
+        self.clock = clock
+
+    def execute(self) -> DispatchRemindersResult:
+        now = self.clock.now()
+        due = self.reminders.pop_due(now)
+
+        batch: list[Reminder] = []
+        for habit_id in due:
+            habit = self.habits.get(habit_id)
+            if habit is None or not habit.active or habit.reminder_time is None:
+                continue
+
+            batch.append(
+                Reminder(
+                    habit_id=habit.id,
+                    user_id=habit.user_id,
+                    cue=habit.cue,
+                    action=habit.action,
+                    fire_at=now,
+                )
+            )
+
+            next_fire = next_reminder_at(habit, now)
+            if next_fire is not None:
+                self.reminders.schedule(habit.id, next_fire)
+
+        if batch:
+            self.outbox.deliver(batch)
+
+        return DispatchRemindersResult(due=len(due), delivered=len(batch))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, List
+
+from habit_hero.application.concurrency import RetryPolicy, award_xp
+from habit_hero.application.dashboards import record_character
+from habit_hero.application.ports import (
+    CharacterRepository,
+    Clock,
+    DashboardRepository,
+    EventPublisher,
+    FocusSessionRepository,
+    TimerScheduler,
+)
+from habit_hero.domain.entities import FocusSession
+from habit_hero.domain.events import DomainEvent
+from habit_hero.domain.services import xp_gain_for_focus_session
+
+
+@dataclass
+class ExpireFocusSessionsResult:
+    """
+    Sessions completed by this tick and the XP granted per user.
+    """
+    completed: List[FocusSession] = field(default_factory=list)
+    xp_by_user: Dict[str, int] = field(default_factory=dict)
+
+
+class ExpireFocusSessionsUseCase:
+    """
+    Timer tick: completes every focus session whose timer came due.
+
+    XP is summed per user across the whole batch, so each character is
+    loaded, levelled via apply_xp and saved once per tick.
+    """
+
+    def __init__(
+        self,
+        sessions: FocusSessionRepository,
+        characters: CharacterRepository,
+        timers: TimerScheduler,
+        clock: Clock,
+        retry: RetryPolicy | None = None,
+        events: EventPublisher | None = None,
+        dashboards: DashboardRepository | None = None,
+    ) -> None:
+        self.sessions = sessions
+        self.characters = characters
+        self.timers = timers
+        self.clock = clock
+        self.retry = retry or RetryPolicy()
+        self.events = events
+        self.dashboards = dashboards
+
+    def execute(self) -> ExpireFocusSessionsResult:
+        result = ExpireFocusSessionsResult()
+
+        for session_id in self.timers.pop_due(self.clock.now()):
+            session = self.sessions.get(session_id)
+            if session is None:
+                continue
+            if session.completed_at is not None or session.cancelled_at is not None:
+                continue
+
+            # Completed at the moment the timer ran out, not when we noticed
+            session.completed_at = session.started_at + timedelta(
+                minutes=session.duration_minutes
+            )
+            session.xp_earned = xp_gain_for_focus_session(session)
+            self.sessions.save(session)
+
+            result.completed.append(session)
+            result.xp_by_user[session.user_id] = (
+                result.xp_by_user.get(session.user_id, 0) + session.xp_earned
+            )
+
+        events: List[DomainEvent] = []
+        for user_id, xp in result.xp_by_user.items():
+            character = award_xp(self.characters, user_id, xp, self.retry, events)
+            record_character(self.dashboards, character)
+        if self.events is not None and events:
+            self.events.publish(events)
+
+        return result
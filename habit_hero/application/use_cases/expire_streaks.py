@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from time import perf_counter
+
+from habit_hero.application.ports import (
+    ConcurrencyError,
+    EventPublisher,
+    StreakRepository,
+)
+from habit_hero.domain.events import StreakBroken
+from habit_hero.domain.services import expire_streaks
+
+
+@dataclass
+class ExpireStreaksRequest:
+    """
+    Run the day-rollover sweep as of `today`.
+    """
+    today: date
+
+
+@dataclass
+class ExpireStreaksResult:
+    """
+    How many streaks the sweep looked at, how many it reset,
+    and how long it took.
+    """
+    processed: int
+    expired: int
+    elapsed_seconds: float
+
+    @property
+    def streaks_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return float(self.processed)
+        return self.processed / self.elapsed_seconds
+
+
+class ExpireStreaksUseCase:
+    """
+    Day-rollover job: resets every streak whose habit was last completed
+    before yesterday, so reads stop showing stale streak values.
+
+    Only the streaks from the expired day buckets are touched. Resetting
+    a streak is a few attribute writes, far cheaper than pickling it to
+    another process, so the sweep runs in the calling process.
+    """
+
+    def __init__(
+        self,
+        streaks: StreakRepository,
+        events: EventPublisher | None = None,
+    ) -> None:
+        self.streaks = streaks
+        self.events = events
+
+    def execute(self, req: ExpireStreaksRequest) -> ExpireStreaksResult:
+        started = perf_counter()
+
+        # Anything completed yesterday or later can still be continued
+        cutoff = req.today - timedelta(days=1)
+        candidates = self.streaks.list_completed_before(cutoff)
+
+        expired = expire_streaks(candidates, req.today)
+
+        # expire_streaks returns copies, so candidates keep the old values
+        previous = {(s.user_id, s.habit_id): s.current_streak for s in candidates}
+        broken = []
+        for streak in expired:
+            try:
+                self.streaks.save(streak)
+            except ConcurrencyError:
+                # Completed again since we read it, so no longer expired
+                continue
+            broken.append(
+                StreakBroken(
+                    user_id=streak.user_id,
+                    habit_id=streak.habit_id,
+                    previous_streak=previous[(streak.user_id, streak.habit_id)],
+                    last_completed_day=streak.last_completed_day,
+                )
+            )
+        if self.events is not None and broken:
+            self.events.publish(broken)
+
+        return ExpireStreaksResult(
+            processed=len(candidates),
+            expired=len(broken),
+            elapsed_seconds=perf_counter() - started,
+        )
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from habit_hero.application.ports import (
+    CharacterRepository,
+    HabitLogRepository,
+    HabitRepository,
+    StreakRepository,
+)
+from habit_hero.domain.entities import Character
+from habit_hero.domain.forecasting import (
+    HabitPace,
+    ProgressionForecaster,
+    UserForecast,
+    UserPace,
+)
+from habit_hero.domain.xp_rules import XpRuleDefinition, XpRuleEngine
+
+
+@dataclass
+class ForecastProgressionRequest:
+    """
+    Project users `days` days past `today` at the pace of their last
+    `window_days` days.
+
+    target_levels maps a user to the level asked about (default: the
+    next one). runs > 0 switches to Monte Carlo over adherence. `rules`
+    forecasts everyone under that curve instead of their own cohort's.
+    """
+    user_ids: List[str]
+    today: date
+    days: int = 30
+    window_days: int = 28
+    target_levels: Dict[str, int] = field(default_factory=dict)
+    runs: int = 0
+    seed: Optional[int] = None
+    rules: Optional[XpRuleDefinition] = None
+
+
+class ForecastProgressionUseCase:
+    """
+    "At your current pace you'll reach level X by date Y".
+
+    Completion rates come from the habit logs in the window; users are
+    grouped by the XP rules that apply to them and each group is
+    simulated in one ProgressionForecaster call.
+    """
+
+    def __init__(
+        self,
+        characters: CharacterRepository,
+        habits: HabitRepository,
+        logs: HabitLogRepository,
+        streaks: StreakRepository,
+        xp_rules: Optional[XpRuleEngine] = None,
+    ) -> None:
+        self.characters = characters
+        self.habits = habits
+        self.logs = logs
+        self.streaks = streaks
+        self.xp_rules = xp_rules or XpRuleEngine()
+
+    def execute(self, req: ForecastProgressionRequest) -> Dict[str, UserForecast]:
+        if req.window_days <= 0:
+            raise ValueError("window_days must be positive.")
+
+        groups: Dict[XpRuleDefinition, List[UserPace]] = {}
+        for user_id in req.user_ids:
+            character = self.characters.get_for_user(user_id) or Character(user_id=user_id)
+            rules = req.rules or self.xp_rules.rules_for(user_id).definition
+            groups.setdefault(rules, []).append(self._pace(character, req))
+
+        forecasts: Dict[str, UserForecast] = {}
+        for rules, paces in groups.items():
+            targets = [
+                req.target_levels.get(p.character.user_id, p.character.level + 1)
+                for p in paces
+            ]
+            for forecast in ProgressionForecaster(rules).forecast(
+                paces, req.today, req.days, targets, runs=req.runs, seed=req.seed
+            ):
+                forecasts[forecast.user_id] = forecast
+        return {user_id: forecasts[user_id] for user_id in req.user_ids}
+
+    def _pace(self, character: Character, req: ForecastProgressionRequest) -> UserPace:
+        user_id = character.user_id
+        start = req.today - timedelta(days=req.window_days - 1)
+        completions: Counter[str] = Counter(
+            log.habit_id for log in self.logs.list_range(user_id, start, req.today)
+        )
+
+        return UserPace(
+            character=character,
+            habits=[
+                HabitPace(
+                    habit=habit,
+                    completion_rate=completions[habit.id] / req.window_days,
+                    streak=self.streaks.get(user_id, habit.id),
+                )
+                for habit in self.habits.list_for_user(user_id)
+                if habit.active
+            ],
+        )
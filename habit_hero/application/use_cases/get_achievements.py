@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from habit_hero.application.ports import AchievementRepository
+from habit_hero.domain.achievements import METRICS, AchievementRule
+
+
+@dataclass
+class GetAchievementsRequest:
+    user_id: str
+
+
+@dataclass
+class GetAchievementsResult:
+    """
+    Unlocked badges in unlock order, each metric's current value and
+    the next threshold to aim for (None once every rule is unlocked).
+    """
+    unlocked: List[AchievementRule]
+    values: Dict[str, int]
+    next_thresholds: Dict[str, Optional[int]]
+
+
+class GetAchievementsUseCase:
+    """
+    Reads a user's achievement progress. Progress is updated by the
+    AchievementEngine as events are delivered, so it may trail the
+    latest use case by a batch.
+    """
+
+    def __init__(self, achievements: AchievementRepository) -> None:
+        self.achievements = achievements
+
+    def execute(self, req: GetAchievementsRequest) -> GetAchievementsResult:
+        progress = self.achievements.get_progress(req.user_id)
+        values = dict(progress.values) if progress is not None else {}
+        unlocked_ids = list(progress.unlocked) if progress is not None else []
+
+        unlocked = []
+        for rule_id in unlocked_ids:
+            rule = self.achievements.get_rule(rule_id)
+            if rule is not None:
+                unlocked.append(rule)
+        return GetAchievementsResult(
+            unlocked=unlocked,
+            values={metric: values.get(metric, 0) for metric in METRICS},
+            next_thresholds={
+                metric: self.achievements.next_threshold(metric, values.get(metric, 0))
+                for metric in METRICS
+            },
+        )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from habit_hero.application.dashboards import compose_dashboard
+from habit_hero.application.ports import (
+    CharacterRepository,
+    DashboardRepository,
+    HabitRepository,
+    LifeForceRepository,
+    StreakRepository,
+)
+from habit_hero.domain.entities import Character, LifeForceCheck
+
+
+@dataclass
+class GetDashboardRequest:
+    """
+    Home screen for a user as of `today`.
+    """
+    user_id: str
+    today: date
+
+
+@dataclass
+class DashboardHabitStatus:
+    """
+    One active habit with its streak and whether it is done today.
+    """
+    habit_id: str
+    name: str
+    cue: str
+    base_xp: int
+    is_bad_habit: bool
+    completed_today: bool
+    current_streak: int
+    longest_streak: int
+
+
+@dataclass
+class GetDashboardResult:
+    character: Character | None
+    habits: list[DashboardHabitStatus]
+    life_force_today: LifeForceCheck | None
+
+
+class GetDashboardUseCase:
+    """
+    Everything the home screen needs from a single read-model lookup.
+
+    The Dashboard is maintained by the write-side use cases; here it is
+    only read and evaluated against `today` (a streak whose last
+    completion is older than yesterday shows as 0 even before the
+    rollover job has reset it). Users without a dashboard yet get one
+    composed from the repositories and saved.
+    """
+
+    def __init__(
+        self,
+        dashboards: DashboardRepository,
+        characters: CharacterRepository,
+        habits: HabitRepository,
+        streaks: StreakRepository,
+        life_force: LifeForceRepository,
+    ) -> None:
+        self.dashboards = dashboards
+        self.characters = characters
+        self.habits = habits
+        self.streaks = streaks
+        self.life_force = life_force
+
+    def execute(self, req: GetDashboardRequest) -> GetDashboardResult:
+        dashboard = self.dashboards.get(req.user_id)
+        if dashboard is None:
+            dashboard = compose_dashboard(
+                req.user_id,
+                req.today,
+                self.characters,
+                self.habits,
+                self.streaks,
+                self.life_force,
+            )
+            self.dashboards.save(dashboard)
+
+        yesterday = req.today - timedelta(days=1)
+        habits = []
+        for entry in dashboard.habits.values():
+            last = entry.last_completed_day
+            habits.append(
+                DashboardHabitStatus(
+                    habit_id=entry.habit_id,
+                    name=entry.name,
+                    cue=entry.cue,
+                    base_xp=entry.base_xp,
+                    is_bad_habit=entry.is_bad_habit,
+                    completed_today=last == req.today,
+                    current_streak=(
+                        entry.current_streak if last is not None and last >= yesterday else 0
+                    ),
+                    longest_streak=entry.longest_streak,
+                )
+            )
+
+        life_force = dashboard.life_force
+        return GetDashboardResult(
+            character=dashboard.character,
+            habits=habits,
+            life_force_today=(
+                life_force if life_force is not None and life_force.day == req.today else None
+            ),
+        )
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from habit_hero.application.ports import CharacterRepository
+from habit_hero.domain.entities import Character
+
+
+@dataclass
+class GetLeaderboardRequest:
+    """
+    How many top characters to return.
+    """
+    limit: int = 10
+
+
+class GetLeaderboardUseCase:
+    """
+    Returns the highest characters by level, then XP.
+    """
+
+    def __init__(self, characters: CharacterRepository) -> None:
+        self.characters = characters
+
+    def execute(self, req: GetLeaderboardRequest) -> list[Character]:
+        return self.characters.list_top(req.limit)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List
+
+from habit_hero.application.ports import LifeForceRepository
+from habit_hero.domain.entities import LifeForceTrend
+
+
+@dataclass
+class GetLifeForceTrendsRequest:
+    """
+    Trend window ending on `end` (inclusive) and covering `window_days`
+    days, for one or many users.
+    """
+    user_ids: List[str]
+    end: date
+    window_days: int = 7
+
+
+class GetLifeForceTrendsUseCase:
+    """
+    Returns exercise / diet totals, averages and aligned-day counts
+    for every requested user over the same window.
+    """
+
+    def __init__(self, life_force: LifeForceRepository) -> None:
+        self.life_force = life_force
+
+    def execute(self, req: GetLifeForceTrendsRequest) -> Dict[str, LifeForceTrend]:
+        if req.window_days <= 0:
+            raise ValueError("window_days must be positive.")
+        start = req.end - timedelta(days=req.window_days - 1)
+        return self.life_force.trends(req.user_ids, start, req.end)
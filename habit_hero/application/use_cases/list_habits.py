@@ -5,22 +5,62 @@ from dataclasses import dataclass
 from habit_hero.application.ports import HabitRepository
 from habit_hero.domain.entities import Habit
 
+MAX_PAGE_SIZE = 500
+
 
 @dataclass
 class ListHabitsRequest:
     """
     Request object for listing habits for a user.
+
+    Filters left as None match anything; by default only active habits
+    are listed. Pass the previous result's next_cursor as `cursor` to
+    get the following page.
     """
     user_id: str
+    active: bool | None = True
+    is_bad_habit: bool | None = None
+    replaces_habit_id: str | None = None
+    cursor: str | None = None
+    limit: int = 50
+
+
+@dataclass
+class ListHabitsResult:
+    """
+    One page of habits, in creation order.
+    next_cursor is None when this is the last page.
+    """
+    habits: list[Habit]
+    next_cursor: str | None
 
 
 class ListHabitsUseCase:
     """
-    Simple use case to return all active habits for a user.
+    Returns a user's habits one page at a time, with stable ordering,
+    so accounts with thousands of habits stay cheap to browse.
     """
 
     def __init__(self, habits: HabitRepository) -> None:
         self.habits = habits
 
-    def execute(self, req: ListHabitsRequest) -> list[Habit]:
-        return self.habits.list_for_user(req.user_id)
+    def execute(self, req: ListHabitsRequest) -> ListHabitsResult:
+        if not 0 < req.limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}.")
+
+        # One extra row tells us whether there is another page
+        habits = self.habits.list_page(
+            req.user_id,
+            req.limit + 1,
+            after=req.cursor,
+            active=req.active,
+            is_bad_habit=req.is_bad_habit,
+            replaces_habit_id=req.replaces_habit_id,
+        )
+        has_more = len(habits) > req.limit
+        habits = habits[:req.limit]
+
+        return ListHabitsResult(
+            habits=habits,
+            next_cursor=habits[-1].id if has_more else None,
+        )
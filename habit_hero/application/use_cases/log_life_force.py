@@ -2,11 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import date
-from uuid import uuid4
 
-from habit_hero.application.ports import LifeForceRepository, CharacterRepository
+from habit_hero.application.concurrency import RetryPolicy, award_xp
+from habit_hero.application.dashboards import record_character, record_life_force
+from habit_hero.application.ids import UuidIdGenerator
+from habit_hero.application.ports import (
+    LifeForceRepository,
+    CharacterRepository,
+    DashboardRepository,
+    EventPublisher,
+    IdGenerator,
+)
 from habit_hero.domain.entities import LifeForceCheck, Character
-from habit_hero.domain.services import apply_xp
+from habit_hero.domain.events import DomainEvent, LifeForceLogged
+from habit_hero.domain.xp_rules import XpRuleEngine
 
 
 @dataclass
@@ -47,9 +56,19 @@ class LogLifeForceUseCase:
         self,
         life_force: LifeForceRepository,
         characters: CharacterRepository,
+        xp_rules: XpRuleEngine | None = None,
+        retry: RetryPolicy | None = None,
+        events: EventPublisher | None = None,
+        ids: IdGenerator | None = None,
+        dashboards: DashboardRepository | None = None,
     ) -> None:
         self.life_force = life_force
         self.characters = characters
+        self.xp_rules = xp_rules or XpRuleEngine()
+        self.retry = retry or RetryPolicy()
+        self.events = events
+        self.ids = ids or UuidIdGenerator()
+        self.dashboards = dashboards
 
     def execute(self, req: LogLifeForceRequest) -> LogLifeForceResult:
         # Clamp scores between 0 and 3 to avoid bad data
@@ -57,7 +76,7 @@ class LogLifeForceUseCase:
         diet = max(0, min(3, req.diet_score))
 
         lf = LifeForceCheck(
-            id=f"lf-{uuid4().hex}",
+            id=self.ids.new_id("lf"),
             user_id=req.user_id,
             day=req.day,
             exercise_score=exercise,
@@ -65,15 +84,28 @@ class LogLifeForceUseCase:
         )
         self.life_force.save(lf)
 
-        total_score = exercise + diet  # 0–6
-        xp_awarded = total_score * 5   # simple rule: 5 XP per point of alignment
+        # Default rule: 5 XP per point of alignment (0–6 points)
+        xp_awarded = self.xp_rules.life_force_xp(req.user_id, exercise, diet)
 
+        events: list[DomainEvent] = [
+            LifeForceLogged(
+                user_id=req.user_id,
+                day=req.day,
+                exercise_score=exercise,
+                diet_score=diet,
+                xp_awarded=xp_awarded,
+            )
+        ]
         updated_character: Character | None = None
         if xp_awarded > 0:
-            character = self.characters.get_for_user(req.user_id)
-            if character is not None:
-                updated_character = apply_xp(character, xp_awarded)
-                self.characters.save(updated_character)
+            updated_character = award_xp(
+                self.characters, req.user_id, xp_awarded, self.retry, events
+            )
+        if self.events is not None:
+            self.events.publish(events)
+
+        record_life_force(self.dashboards, lf)
+        record_character(self.dashboards, updated_character)
 
         return LogLifeForceResult(
             life_force_check=lf,
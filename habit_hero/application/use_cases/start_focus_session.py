@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from habit_hero.application.ids import UuidIdGenerator
+from habit_hero.application.ports import (
+    Clock,
+    FocusSessionRepository,
+    IdGenerator,
+    TimerScheduler,
+)
+from habit_hero.domain.entities import FocusSession
+
+
+@dataclass
+class StartFocusSessionRequest:
+    """
+    Start a focus timer of the given length for a user.
+    """
+    user_id: str
+    duration_minutes: int
+
+
+class StartFocusSessionUseCase:
+    """
+    Creates a focus session and arms its server-side timer.
+    When the timer fires, ExpireFocusSessionsUseCase completes it.
+    """
+
+    def __init__(
+        self,
+        sessions: FocusSessionRepository,
+        timers: TimerScheduler,
+        clock: Clock,
+        ids: IdGenerator | None = None,
+    ) -> None:
+        self.sessions = sessions
+        self.timers = timers
+        self.clock = clock
+        self.ids = ids or UuidIdGenerator()
+
+    def execute(self, req: StartFocusSessionRequest) -> FocusSession:
+        if req.duration_minutes <= 0:
+            raise ValueError("Focus session duration must be positive.")
+
+        session = FocusSession(
+            id=self.ids.new_id("focus"),
+            user_id=req.user_id,
+            duration_minutes=req.duration_minutes,
+            started_at=self.clock.now(),
+        )
+        self.sessions.save(session)
+
+        due_at = session.started_at + timedelta(minutes=session.duration_minutes)
+        self.timers.schedule(session.id, due_at)
+        return session
@@ -0,0 +1,456 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+# A component is either an import path "package.module:Name" or a factory.
+# Import paths are only imported the first time the component is needed,
+# so entry points only pay for what they actually use.
+Target = Union[str, Callable[..., Any]]
+
+
+def _load(target: Target) -> Callable[..., Any]:
+    if not isinstance(target, str):
+        return target
+    module_name, _, attr = target.partition(":")
+    return getattr(import_module(module_name), attr)
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Runtime configuration for the composition root.
+    backend: which registered repository backend to use.
+    data_dir: where on-disk backends keep their files.
+    max_resident_users: memory budget of the "tiered" backend.
+    node_id: this process's node in time-ordered ids (0-1023); every
+        process minting ids at the same time needs its own.
+    write_behind_max_pending: buffer up to this many dirty entities per
+        WRITE_BEHIND repository before writing them out (0 = write through).
+        Cross-repository snapshots are not available with it on.
+    write_behind_interval: seconds a buffered write may wait at most.
+    """
+    backend: str = "in_memory"
+    data_dir: str = ".habit_hero"
+    max_resident_users: int = 10_000
+    node_id: int = 0
+    write_behind_max_pending: int = 0
+    write_behind_interval: float = 1.0
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        env = os.environ if environ is None else environ
+        return cls(
+            backend=env.get("HABIT_HERO_BACKEND", cls.backend),
+            data_dir=env.get("HABIT_HERO_DATA_DIR", cls.data_dir),
+            max_resident_users=int(
+                env.get("HABIT_HERO_MAX_RESIDENT_USERS", cls.max_resident_users)
+            ),
+            node_id=int(env.get("HABIT_HERO_NODE_ID", cls.node_id)),
+            write_behind_max_pending=int(
+                env.get("HABIT_HERO_WRITE_BEHIND_MAX_PENDING", cls.write_behind_max_pending)
+            ),
+            write_behind_interval=float(
+                env.get("HABIT_HERO_WRITE_BEHIND_INTERVAL", cls.write_behind_interval)
+            ),
+        )
+
+
+_IN_MEMORY = "habit_hero.infrastructure.persistence.in_memory_repositories"
+_TIERED = "habit_hero.infrastructure.persistence.tiered_repositories"
+_USE_CASES = "habit_hero.application.use_cases"
+
+# A backend repository is a bare target, or a (target, dependencies)
+# pair when it needs other components, like COMPONENTS entries below
+Repository = Union[Target, tuple[Target, Dict[str, str]]]
+
+_ON_TIERS = {"tiers": "tier_manager"}
+_ON_SNAPSHOTS = {"snapshots": "snapshots"}
+
+# backend name -> repository name -> target
+BACKENDS: Dict[str, Dict[str, Repository]] = {
+    "in_memory": {
+        # One SnapshotManager for all of them, so a snapshot is
+        # consistent across repositories
+        "users": (f"{_IN_MEMORY}:InMemoryUserRepository", _ON_SNAPSHOTS),
+        "characters": (f"{_IN_MEMORY}:InMemoryCharacterRepository", _ON_SNAPSHOTS),
+        "habits": (f"{_IN_MEMORY}:InMemoryHabitRepository", _ON_SNAPSHOTS),
+        "logs": (f"{_IN_MEMORY}:InMemoryHabitLogRepository", _ON_SNAPSHOTS),
+        "streaks": (f"{_IN_MEMORY}:InMemoryStreakRepository", _ON_SNAPSHOTS),
+        "life_force": (f"{_IN_MEMORY}:InMemoryLifeForceRepository", _ON_SNAPSHOTS),
+        "focus_sessions": (f"{_IN_MEMORY}:InMemoryFocusSessionRepository", _ON_SNAPSHOTS),
+        "dashboards": (f"{_IN_MEMORY}:InMemoryDashboardRepository", _ON_SNAPSHOTS),
+        "achievements": (f"{_IN_MEMORY}:InMemoryAchievementRepository", _ON_SNAPSHOTS),
+    },
+    "tiered": {
+        "users": (f"{_TIERED}:TieredUserRepository", _ON_TIERS),
+        "characters": (f"{_TIERED}:TieredCharacterRepository", _ON_TIERS),
+        "habits": (f"{_TIERED}:TieredHabitRepository", _ON_TIERS),
+        "logs": (f"{_TIERED}:TieredHabitLogRepository", _ON_TIERS),
+        "streaks": (f"{_TIERED}:TieredStreakRepository", _ON_TIERS),
+        "life_force": (f"{_TIERED}:TieredLifeForceRepository", _ON_TIERS),
+        "focus_sessions": (f"{_TIERED}:TieredFocusSessionRepository", _ON_TIERS),
+        "dashboards": (f"{_TIERED}:TieredDashboardRepository", _ON_TIERS),
+        # Updated from the event bus thread, so kept out of the
+        # TierManager to keep that thread off its lock; progress is a
+        # few ints per user plus at most a month of LifeForce day flags
+        "achievements": f"{_IN_MEMORY}:InMemoryAchievementRepository",
+    },
+}
+
+_WRITE_BEHIND = "habit_hero.infrastructure.persistence.write_behind"
+
+# repository name -> write-behind wrapper, used on any backend when
+# Settings.write_behind_max_pending is set
+WRITE_BEHIND: Dict[str, Target] = {
+    "characters": f"{_WRITE_BEHIND}:WriteBehindCharacterRepository",
+    "streaks": f"{_WRITE_BEHIND}:WriteBehindStreakRepository",
+    "logs": f"{_WRITE_BEHIND}:WriteBehindHabitLogRepository",
+    "dashboards": f"{_WRITE_BEHIND}:WriteBehindDashboardRepository",
+}
+
+
+def _focus_timers(clock: Any) -> Any:
+    from habit_hero.infrastructure.scheduling.timing_wheel import (
+        HierarchicalTimingWheel,
+    )
+
+    return HierarchicalTimingWheel(start=clock.now())
+
+
+def _event_bus(achievements: Any) -> Any:
+    from habit_hero.application.achievements import AchievementEngine
+    from habit_hero.infrastructure.events.batching_bus import BatchingEventBus
+
+    bus = BatchingEventBus()
+    engine = AchievementEngine(achievements, events=bus)
+    bus.subscribe("achievements", engine.handle, *AchievementEngine.EVENT_TYPES)
+    return bus
+
+
+def _id_generator(settings: Settings) -> Any:
+    from habit_hero.infrastructure.ids import SortableIdGenerator
+
+    return SortableIdGenerator(node_id=settings.node_id)
+
+
+def _reminder_index(habits: Any, clock: Any) -> Any:
+    from habit_hero.domain.services import next_reminder_at
+    from habit_hero.infrastructure.scheduling.bucketed_index import BucketedTimerIndex
+
+    # The index only lives in memory: rebuild it from the stored habits
+    index = BucketedTimerIndex()
+    now = clock.now()
+    for habit in habits.list_with_reminders():
+        next_fire = next_reminder_at(habit, now)
+        if next_fire is not None:
+            index.schedule(habit.id, next_fire)
+    return index
+
+
+def _tier_manager(settings: Settings) -> Any:
+    from pathlib import Path
+
+    from habit_hero.infrastructure.persistence.tiered_repositories import (
+        SqliteColdStore,
+        TierManager,
+    )
+
+    data_dir = Path(settings.data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    return TierManager(
+        cold=SqliteColdStore(data_dir / "cold_users.sqlite3"),
+        max_resident_users=settings.max_resident_users,
+    )
+
+
+# component name -> (target, constructor argument -> component name)
+COMPONENTS: Dict[str, tuple[Target, Dict[str, str]]] = {
+    "clock": ("habit_hero.infrastructure.clock:SystemClock", {}),
+    "focus_timers": (_focus_timers, {"clock": "clock"}),
+    "tier_manager": (_tier_manager, {"settings": "settings"}),
+    "snapshots": ("habit_hero.infrastructure.persistence.snapshots:SnapshotManager", {}),
+    "ids": (_id_generator, {"settings": "settings"}),
+    "xp_rules": ("habit_hero.domain.xp_rules:XpRuleEngine", {}),
+    "events": (_event_bus, {"achievements": "achievements"}),
+    "reminder_index": (_reminder_index, {"habits": "habits", "clock": "clock"}),
+    "reminder_outbox": (
+        "habit_hero.infrastructure.notifications.in_memory_outbox:InMemoryReminderOutbox",
+        {},
+    ),
+}
+
+# use case name -> (target, constructor argument -> component name)
+USE_CASES: Dict[str, tuple[Target, Dict[str, str]]] = {
+    "create_user": (
+        f"{_USE_CASES}.create_user:CreateUserUseCase",
+        {
+            "users": "users",
+            "characters": "characters",
+            "events": "events",
+            "ids": "ids",
+            "dashboards": "dashboards",
+        },
+    ),
+    "create_habit": (
+        f"{_USE_CASES}.create_habit:CreateHabitUseCase",
+        {
+            "habits": "habits",
+            "reminders": "reminder_index",
+            "clock": "clock",
+            "ids": "ids",
+            "dashboards": "dashboards",
+        },
+    ),
+    "deactivate_habit": (
+        f"{_USE_CASES}.deactivate_habit:DeactivateHabitUseCase",
+        {
+            "habits": "habits",
+            "reminders": "reminder_index",
+            "dashboards": "dashboards",
+        },
+    ),
+    "complete_habit": (
+        f"{_USE_CASES}.complete_habit:CompleteHabitUseCase",
+        {
+            "habits": "habits",
+            "logs": "logs",
+            "streaks": "streaks",
+            "characters": "characters",
+            "reminders": "reminder_index",
+            "xp_rules": "xp_rules",
+            "events": "events",
+            "dashboards": "dashboards",
+        },
+    ),
+    "list_habits": (
+        f"{_USE_CASES}.list_habits:ListHabitsUseCase",
+        {"habits": "habits"},
+    ),
+    "log_life_force": (
+        f"{_USE_CASES}.log_life_force:LogLifeForceUseCase",
+        {
+            "life_force": "life_force",
+            "characters": "characters",
+            "xp_rules": "xp_rules",
+            "events": "events",
+            "ids": "ids",
+            "dashboards": "dashboards",
+        },
+    ),
+    "get_leaderboard": (
+        f"{_USE_CASES}.get_leaderboard:GetLeaderboardUseCase",
+        {"characters": "characters"},
+    ),
+    "get_dashboard": (
+        f"{_USE_CASES}.get_dashboard:GetDashboardUseCase",
+        {
+            "dashboards": "dashboards",
+            "characters": "characters",
+            "habits": "habits",
+            "streaks": "streaks",
+            "life_force": "life_force",
+        },
+    ),
+    "forecast_progression": (
+        f"{_USE_CASES}.forecast_progression:ForecastProgressionUseCase",
+        {
+            "characters": "characters",
+            "habits": "habits",
+            "logs": "logs",
+            "streaks": "streaks",
+            "xp_rules": "xp_rules",
+        },
+    ),
+    "get_achievements": (
+        f"{_USE_CASES}.get_achievements:GetAchievementsUseCase",
+        {"achievements": "achievements"},
+    ),
+    "compact_habit_logs": (
+        f"{_USE_CASES}.compact_habit_logs:CompactHabitLogsUseCase",
+        {"logs": "logs"},
+    ),
+    "get_life_force_trends": (
+        f"{_USE_CASES}.get_life_force_trends:GetLifeForceTrendsUseCase",
+        {"life_force": "life_force"},
+    ),
+    "expire_streaks": (
+        f"{_USE_CASES}.expire_streaks:ExpireStreaksUseCase",
+        {"streaks": "streaks", "events": "events"},
+    ),
+    "dispatch_reminders": (
+        f"{_USE_CASES}.dispatch_reminders:DispatchRemindersUseCase",
+        {
+            "habits": "habits",
+            "reminders": "reminder_index",
+            "outbox": "reminder_outbox",
+            "clock": "clock",
+        },
+    ),
+    "start_focus_session": (
+        f"{_USE_CASES}.start_focus_session:StartFocusSessionUseCase",
+        {
+            "sessions": "focus_sessions",
+            "timers": "focus_timers",
+            "clock": "clock",
+            "ids": "ids",
+        },
+    ),
+    "complete_focus_session": (
+        f"{_USE_CASES}.complete_focus_session:CompleteFocusSessionUseCase",
+        {
+            "sessions": "focus_sessions",
+            "characters": "characters",
+            "timers": "focus_timers",
+            "clock": "clock",
+            "events": "events",
+            "dashboards": "dashboards",
+        },
+    ),
+    "cancel_focus_session": (
+        f"{_USE_CASES}.cancel_focus_session:CancelFocusSessionUseCase",
+        {"sessions": "focus_sessions", "timers": "focus_timers", "clock": "clock"},
+    ),
+    "expire_focus_sessions": (
+        f"{_USE_CASES}.expire_focus_sessions:ExpireFocusSessionsUseCase",
+        {
+            "sessions": "focus_sessions",
+            "characters": "characters",
+            "timers": "focus_timers",
+            "clock": "clock",
+            "events": "events",
+            "dashboards": "dashboards",
+        },
+    ),
+}
+
+
+class Container:
+    """
+    Composition root shared by every entry point (CLI, workers, jobs).
+
+    Repositories come from the backend chosen in Settings, other
+    components and use cases are registered by name. Nothing is imported
+    or constructed until it is first asked for, and each component is
+    built once per container.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None) -> None:
+        self.settings = settings or Settings.from_env()
+        self._backends: Dict[str, Dict[str, Repository]] = {
+            name: dict(repositories) for name, repositories in BACKENDS.items()
+        }
+        self._components: Dict[str, tuple[Target, Dict[str, str]]] = dict(COMPONENTS)
+        self._use_cases: Dict[str, tuple[Target, Dict[str, str]]] = dict(USE_CASES)
+        self._instances: Dict[str, Any] = {"settings": self.settings}
+
+    # --- registration -------------------------------------------------
+
+    def register_backend(self, name: str, repositories: Mapping[str, Repository]) -> None:
+        self._backends[name] = dict(repositories)
+
+    def register_component(self, name: str, target: Target, **dependencies: str) -> None:
+        """
+        Register a shared component (clock, scheduler, event bus, ...).
+        `dependencies` maps constructor arguments to component names.
+        """
+        self._components[name] = (target, dependencies)
+
+    def register_use_case(self, name: str, target: Target, **dependencies: str) -> None:
+        self._use_cases[name] = (target, dependencies)
+
+    def override(self, name: str, instance: Any) -> None:
+        """
+        Use a ready-made instance for a component (handy in tests).
+        """
+        self._instances[name] = instance
+
+    # --- resolution ---------------------------------------------------
+
+    def resolve(self, name: str) -> Any:
+        """
+        Return the repository or component registered under `name`,
+        constructing it (and its dependencies) on first use.
+        """
+        if name in self._instances:
+            return self._instances[name]
+
+        write_behind = bool(self.settings.write_behind_max_pending)
+        if name == "snapshots" and write_behind:
+            # Each buffer flushes on its own schedule, so no snapshot
+            # could be consistent across repositories
+            raise ValueError("Snapshots are not available with write-behind buffering.")
+
+        backend = self._backend()
+        if name in backend:
+            entry = backend[name]
+            if isinstance(entry, tuple):
+                target, dependencies = entry
+                if write_behind:
+                    # each repository then keeps a private SnapshotManager
+                    dependencies = {
+                        arg: component
+                        for arg, component in dependencies.items()
+                        if component != "snapshots"
+                    }
+                instance = self._build(target, dependencies)
+            else:
+                instance = _load(entry)()
+            if write_behind and name in WRITE_BEHIND:
+                instance = _load(WRITE_BEHIND[name])(
+                    instance,
+                    max_pending=self.settings.write_behind_max_pending,
+                    flush_interval=self.settings.write_behind_interval,
+                )
+        elif name in self._components:
+            instance = self._build(*self._components[name])
+        else:
+            raise KeyError(f"Unknown component: {name}")
+
+        self._instances[name] = instance
+        return instance
+
+    def repository(self, name: str) -> Any:
+        return self.resolve(name)
+
+    def repositories(self) -> Dict[str, Any]:
+        """
+        Every repository of the active backend, keyed by name.
+        """
+        return {name: self.resolve(name) for name in self._backend()}
+
+    def use_case(self, name: str) -> Any:
+        key = f"use_case:{name}"
+        if key not in self._instances:
+            if name not in self._use_cases:
+                raise KeyError(f"Unknown use case: {name}")
+            self._instances[key] = self._build(*self._use_cases[name])
+        return self._instances[key]
+
+    def close(self) -> None:
+        """
+        Deliver queued events and write out anything still buffered
+        (write-behind repositories); call before the process exits.
+        Only components that were built are touched.
+        """
+        # The bus first: its subscribers may still save while draining
+        events = self._instances.get("events")
+        close = getattr(events, "close", None)
+        if close is not None:
+            close()
+        for name in WRITE_BEHIND:
+            close = getattr(self._instances.get(name), "close", None)
+            if close is not None:
+                close()
+
+    def _backend(self) -> Dict[str, Repository]:
+        try:
+            return self._backends[self.settings.backend]
+        except KeyError:
+            raise ValueError(f"Unknown backend: {self.settings.backend}") from None
+
+    def _build(self, target: Target, dependencies: Dict[str, str]) -> Any:
+        kwargs = {arg: self.resolve(component) for arg, component in dependencies.items()}
+        return _load(target)(**kwargs)
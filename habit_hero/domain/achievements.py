@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from .events import DomainEvent, HabitCompleted, LevelUp, LifeForceLogged
+from .services import is_aligned
+
+# Metrics an achievement can watch. Every metric only ever goes up:
+# streak and level keep the best value seen, the others are counts.
+STREAK = "streak"  # longest streak reached on any habit
+LEVEL = "level"
+COMPLETIONS = "completions"  # habit completions, all time
+ALIGNED_DAYS = "aligned_days"  # distinct days with an aligned LifeForce check
+METRICS = (STREAK, LEVEL, COMPLETIONS, ALIGNED_DAYS)
+
+# A re-logged LifeForce day is recognised (and not counted twice) when it
+# is at most this many days before the latest day logged; older re-logs
+# are taken as first logs
+ALIGNED_WINDOW_DAYS = 31
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    """
+    A badge earned once `metric` reaches `threshold`.
+    """
+    id: str
+    name: str
+    metric: str
+    threshold: int
+
+
+@dataclass
+class AchievementProgress:
+    """
+    One user's metric values and unlocked badges.
+
+    next_thresholds caches, per metric, the lowest rule threshold above
+    the value it was last evaluated at (None = no rules left), so most
+    updates are a single comparison. It is only valid for the rule set
+    with `rules_version`; on a mismatch it is recomputed.
+    """
+    user_id: str
+    values: Dict[str, int] = field(default_factory=dict)
+    next_thresholds: Dict[str, Optional[int]] = field(default_factory=dict)
+    rules_version: int = 0
+    # rule ids in unlock order
+    unlocked: Dict[str, None] = field(default_factory=dict)
+    # aligned LifeForce days counted so far, and whether each day logged
+    # within ALIGNED_WINDOW_DAYS of the latest one was aligned
+    aligned_count: int = 0
+    recent_days: Dict[date, bool] = field(default_factory=dict)
+
+
+DEFAULT_ACHIEVEMENTS = (
+    AchievementRule("streak-7", "7-day streak", STREAK, 7),
+    AchievementRule("streak-30", "30-day streak", STREAK, 30),
+    AchievementRule("streak-100", "100-day streak", STREAK, 100),
+    AchievementRule("level-5", "Level 5", LEVEL, 5),
+    AchievementRule("level-10", "Level 10", LEVEL, 10),
+    AchievementRule("level-25", "Level 25", LEVEL, 25),
+    AchievementRule("completions-1", "First completion", COMPLETIONS, 1),
+    AchievementRule("completions-100", "100 completions", COMPLETIONS, 100),
+    AchievementRule("completions-1000", "1000 completions", COMPLETIONS, 1000),
+    AchievementRule("aligned-7", "7 aligned LifeForce days", ALIGNED_DAYS, 7),
+    AchievementRule("aligned-30", "30 aligned LifeForce days", ALIGNED_DAYS, 30),
+)
+
+
+def record_metrics(progress: AchievementProgress, event: DomainEvent) -> List[str]:
+    """
+    Update the metric values an event affects and return the metrics
+    whose value went up.
+    """
+    values = progress.values
+    raised: List[str] = []
+
+    def raise_to(metric: str, value: int) -> None:
+        if value > values.get(metric, 0):
+            values[metric] = value
+            raised.append(metric)
+
+    if isinstance(event, HabitCompleted):
+        raise_to(COMPLETIONS, values.get(COMPLETIONS, 0) + 1)
+        raise_to(STREAK, event.current_streak)
+    elif isinstance(event, LevelUp):
+        raise_to(LEVEL, event.level)
+    elif isinstance(event, LifeForceLogged):
+        # Re-logging a day replaces its check, so count days, not logs
+        aligned = is_aligned(event.exercise_score, event.diet_score)
+        recent = progress.recent_days
+        progress.aligned_count += aligned - recent.get(event.day, False)
+        latest = max(recent, default=event.day)
+        if event.day >= latest - timedelta(days=ALIGNED_WINDOW_DAYS):
+            recent[event.day] = aligned
+            if event.day > latest:
+                horizon = event.day - timedelta(days=ALIGNED_WINDOW_DAYS)
+                for day in [d for d in recent if d < horizon]:
+                    del recent[day]
+        raise_to(ALIGNED_DAYS, progress.aligned_count)
+    return raised
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, time
 from typing import Dict, Optional
 
 
@@ -30,6 +30,8 @@ class Character:
     # example appearance keys:
     #   "hair_style", "hair_color", "eyes", "skin_tone", "body_type",
     #   "clothing", "color_palette", "vibe"
+    # bumped by the repository on every save (optimistic concurrency)
+    version: int = 0
 
 
 @dataclass
@@ -48,6 +50,8 @@ class Habit:
     is_bad_habit: bool = False
     replaces_habit_id: str | None = None
     active: bool = True
+    # time of day the cue usually happens; None = no reminders
+    reminder_time: time | None = None
 
 
 @dataclass
@@ -64,6 +68,23 @@ class HabitLog:
     xp_earned: int
 
 
+@dataclass
+class HabitLogMonth:
+    """
+    Compacted HabitLog history: one habit's completions in one calendar
+    month (`month` is its first day). `days` has bit d-1 set when the
+    habit was completed on day d, so a day is never counted twice.
+    """
+    user_id: str
+    habit_id: str
+    month: date
+    completions: int = 0
+    xp_total: int = 0
+    first_day: Optional[date] = None
+    last_day: Optional[date] = None
+    days: int = 0
+
+
 @dataclass
 class StreakState:
     """
@@ -74,6 +95,20 @@ class StreakState:
     current_streak: int
     longest_streak: int
     last_completed_day: Optional[date]
+    # bumped by the repository on every save (optimistic concurrency)
+    version: int = 0
+
+
+@dataclass
+class Reminder:
+    """
+    A cue reminder for a habit, handed to the outbox for delivery.
+    """
+    habit_id: str
+    user_id: str
+    cue: str
+    action: str
+    fire_at: datetime
 
 
 @dataclass
@@ -87,6 +122,7 @@ class FocusSession:
     duration_minutes: int
     started_at: datetime
     completed_at: Optional[datetime] = None
+    cancelled_at: Optional[datetime] = None
     xp_earned: int = 0
 
 
@@ -102,3 +138,54 @@ class LifeForceCheck:
     day: date
     exercise_score: int
     diet_score: int
+
+
+@dataclass
+class LifeForceTrend:
+    """
+    Life Force totals for one user over an inclusive window of days.
+    Averages are per logged day; days without a check are not counted.
+    """
+    user_id: str
+    start: date
+    end: date
+    days_logged: int
+    exercise_total: int
+    diet_total: int
+    aligned_days: int
+
+    @property
+    def exercise_average(self) -> float:
+        return self.exercise_total / self.days_logged if self.days_logged else 0.0
+
+    @property
+    def diet_average(self) -> float:
+        return self.diet_total / self.days_logged if self.days_logged else 0.0
+
+
+@dataclass
+class DashboardHabit:
+    """
+    One active habit as the home screen shows it.
+    """
+    habit_id: str
+    name: str
+    cue: str
+    base_xp: int
+    is_bad_habit: bool = False
+    current_streak: int = 0
+    longest_streak: int = 0
+    last_completed_day: Optional[date] = None
+
+
+@dataclass
+class Dashboard:
+    """
+    Denormalized per-user read model for the home screen, kept up to
+    date by the use cases that change what it shows.
+    life_force is the user's most recent check (by day).
+    """
+    user_id: str
+    character: Optional[Character] = None
+    habits: Dict[str, DashboardHabit] = field(default_factory=dict)
+    life_force: Optional[LifeForceCheck] = None
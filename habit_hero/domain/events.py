@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from .entities import Character, StreakState
+
+
+@dataclass(frozen=True)
+class DomainEvent:
+    """
+    Something that happened to a user, emitted by a use case once its
+    state change has been saved. Subscribers react to these instead of
+    being called from the use case itself.
+    """
+    user_id: str
+
+
+@dataclass(frozen=True)
+class UserCreated(DomainEvent):
+    pass
+
+
+@dataclass(frozen=True)
+class HabitCompleted(DomainEvent):
+    habit_id: str
+    day: date
+    xp_earned: int
+    current_streak: int
+
+
+@dataclass(frozen=True)
+class StreakBroken(DomainEvent):
+    """
+    A running streak was lost: either the day-rollover sweep reset it,
+    or the habit was completed again after a gap.
+    """
+    habit_id: str
+    previous_streak: int
+    last_completed_day: Optional[date]
+
+
+@dataclass(frozen=True)
+class LevelUp(DomainEvent):
+    previous_level: int
+    level: int
+
+
+@dataclass(frozen=True)
+class LifeForceLogged(DomainEvent):
+    day: date
+    exercise_score: int
+    diet_score: int
+    xp_awarded: int
+
+
+@dataclass(frozen=True)
+class AchievementUnlocked(DomainEvent):
+    rule_id: str
+    name: str
+
+
+def streak_broken_by(existing: Optional[StreakState], today: date) -> Optional[StreakBroken]:
+    """
+    The StreakBroken event caused by completing a habit `today`, if the
+    previous completion was more than a day ago and still counted.
+    """
+    if (
+        existing is None
+        or existing.current_streak <= 0
+        or existing.last_completed_day is None
+        or (today - existing.last_completed_day).days <= 1
+    ):
+        return None
+    return StreakBroken(
+        user_id=existing.user_id,
+        habit_id=existing.habit_id,
+        previous_streak=existing.current_streak,
+        last_completed_day=existing.last_completed_day,
+    )
+
+
+def level_up(previous_level: int, character: Character) -> Optional[LevelUp]:
+    if character.level <= previous_level:
+        return None
+    return LevelUp(
+        user_id=character.user_id,
+        previous_level=previous_level,
+        level=character.level,
+    )
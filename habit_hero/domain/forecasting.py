@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, replace
+from datetime import date, timedelta
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .entities import Character, Habit, StreakState
+from .services import apply_xp, calculate_new_streak
+from .xp_rules import XpRuleDefinition, compile_rules, streak_multipliers
+
+
+@dataclass
+class HabitPace:
+    """
+    One habit's recent behaviour: the share of days (0..1) it was
+    completed on, and its streak as of the forecast start.
+    """
+    habit: Habit
+    completion_rate: float
+    streak: Optional[StreakState] = None
+
+
+@dataclass
+class UserPace:
+    """
+    Forecast input for one user: their character now and their habits.
+    """
+    character: Character
+    habits: List[HabitPace] = field(default_factory=list)
+
+
+@dataclass
+class UserForecast:
+    """
+    Where a user is projected to be after the forecast horizon.
+
+    In Monte Carlo mode level/xp are medians over the runs, the p10/p90
+    levels give the spread, reach_probability is the share of runs that
+    hit target_level, and target_date is the median day among runs that
+    did (None if fewer than half did). Deterministic forecasts are one
+    run, so the probability is 1.0 or 0.0.
+    """
+    user_id: str
+    level: int
+    xp: int
+    level_p10: int
+    level_p90: int
+    target_level: int
+    target_date: Optional[date]
+    reach_probability: float
+
+
+def completes_on(day: int, rate: float) -> bool:
+    """
+    Deterministic adherence: a habit done at `rate` is completed on
+    simulation day `day` (1-based) when floor(day * rate) ticks over,
+    which spreads the completions evenly (rate 0.5 = every other day).
+    """
+    return math.floor(day * rate) > math.floor((day - 1) * rate)
+
+
+def forecast_user_scalar(
+    pace: UserPace,
+    start: date,
+    days: int,
+    rules: Optional[XpRuleDefinition] = None,
+) -> Character:
+    """
+    Reference implementation: steps one user through `days` days with
+    the scalar domain functions (calculate_new_streak, the compiled XP
+    rules, apply_xp). The vectorized engine must agree with it exactly.
+    """
+    habit_xp = compile_rules(rules or XpRuleDefinition()).habit_xp
+    character = replace(pace.character, appearance=dict(pace.character.appearance))
+    streaks = [hp.streak for hp in pace.habits]
+    for k in range(1, days + 1):
+        today = start + timedelta(days=k)
+        gained = 0
+        for i, hp in enumerate(pace.habits):
+            if hp.habit.active and completes_on(k, hp.completion_rate):
+                streaks[i] = calculate_new_streak(streaks[i], hp.habit, today)
+                gained += habit_xp(hp.habit, streaks[i])
+        apply_xp(character, gained)
+    return character
+
+
+class ProgressionForecaster:
+    """
+    Simulates every user's next N days at once on NumPy arrays.
+
+    Habits of all users are flattened into one axis (H) and Monte Carlo
+    runs into another (R); each simulated day is a handful of array
+    operations over R x H, XP is summed per user with one bincount, and
+    level-ups are applied to an R x U array exactly like apply_xp.
+
+    `rules` allows what-if forecasts for a different XP curve; the
+    default definition reproduces xp_gain_for_habit.
+    """
+
+    def __init__(self, rules: Optional[XpRuleDefinition] = None) -> None:
+        self.rules = rules or XpRuleDefinition()
+        self._multipliers = np.array(streak_multipliers(self.rules), dtype=np.float64)
+
+    def forecast(
+        self,
+        users: Sequence[UserPace],
+        start: date,
+        days: int,
+        target_levels: Optional[Sequence[int]] = None,
+        runs: int = 0,
+        seed: Optional[int] = None,
+    ) -> List[UserForecast]:
+        """
+        Project each user `days` days past `start`.
+        runs=0 is deterministic (completions spread evenly per rate);
+        runs>0 draws completions at random, `runs` times.
+        Targets default to each user's next level.
+        """
+        if days < 0 or runs < 0:
+            raise ValueError("days and runs must not be negative.")
+        n_users = len(users)
+        targets = np.array(
+            target_levels
+            if target_levels is not None
+            else [u.character.level + 1 for u in users],
+            dtype=np.int64,
+        )
+        if len(targets) != n_users:
+            raise ValueError("One target level per user is needed.")
+
+        paces = [
+            (u, hp)
+            for u, pace in enumerate(users)
+            for hp in pace.habits
+            if hp.habit.active
+        ]
+        owner = np.array([u for u, _ in paces], dtype=np.int64)
+        rate = np.array([hp.completion_rate for _, hp in paces], dtype=np.float64)
+        base = np.array([hp.habit.base_xp for _, hp in paces], dtype=np.float64)
+        bad = np.array([hp.habit.is_bad_habit for _, hp in paces], dtype=bool)
+        streak0, done_yesterday0 = self._initial_streaks(paces, start)
+
+        n_runs = max(runs, 1)
+        rng = np.random.default_rng(seed)
+        streak = np.tile(streak0, (n_runs, 1))
+        done_yesterday = np.tile(done_yesterday0, (n_runs, 1))
+
+        def per_run(values: List[int]) -> np.ndarray:
+            return np.tile(np.array(values, dtype=np.int64), (n_runs, 1))
+
+        level = per_run([u.character.level for u in users])
+        xp = per_run([u.character.xp for u in users])
+        to_next = per_run([u.character.xp_to_next_level for u in users])
+        reached = np.where(level >= targets, 0, -1)
+        bins = (owner + n_users * np.arange(n_runs)[:, None]).ravel()
+
+        for k in range(1, days + 1):
+            if runs:
+                done = rng.random((n_runs, len(paces))) < rate
+            else:
+                done = np.broadcast_to(
+                    np.floor(k * rate) > np.floor((k - 1) * rate), streak.shape
+                )
+            # calculate_new_streak: +1 after yesterday, else back to 1
+            streak = np.where(done, np.where(done_yesterday, streak + 1, 1), streak)
+            done_yesterday = done
+
+            gained = np.where(done, self._habit_xp(base, bad, streak), 0)
+            per_user = np.bincount(bins, weights=gained.ravel(), minlength=n_runs * n_users)
+            xp += per_user.reshape(n_runs, n_users).astype(np.int64)
+            level, xp, to_next = _apply_level_ups(level, xp, to_next)
+
+            reached = np.where((reached < 0) & (level >= targets), k, reached)
+
+        return self._summarize(users, targets, level, xp, reached, start)
+
+    def _habit_xp(self, base: np.ndarray, bad: np.ndarray, streak: np.ndarray) -> np.ndarray:
+        # Same float64 operations (and int() truncation) as the compiled scalar rules
+        rules = self.rules
+        steps = np.minimum(streak // rules.streak_step_days, len(self._multipliers) - 1)
+        xp = np.trunc(base * self._multipliers[steps])
+        if rules.bad_habit_multiplier != 1.0:
+            xp = np.where(bad, np.trunc(xp * rules.bad_habit_multiplier), xp)
+        if rules.max_habit_xp is not None:
+            xp = np.minimum(xp, rules.max_habit_xp)
+        return xp
+
+    @staticmethod
+    def _initial_streaks(paces, start: date) -> tuple[np.ndarray, np.ndarray]:
+        streak = np.zeros(len(paces), dtype=np.int64)
+        done_yesterday = np.zeros(len(paces), dtype=bool)
+        for i, (_, hp) in enumerate(paces):
+            if hp.streak is not None:
+                streak[i] = hp.streak.current_streak
+                # Day 1 of the simulation is the day after `start`
+                done_yesterday[i] = hp.streak.last_completed_day == start
+        return streak, done_yesterday
+
+    @staticmethod
+    def _summarize(
+        users: Sequence[UserPace],
+        targets: np.ndarray,
+        level: np.ndarray,
+        xp: np.ndarray,
+        reached: np.ndarray,
+        start: date,
+    ) -> List[UserForecast]:
+        level_p10, level_p50, level_p90 = np.percentile(
+            level, [10, 50, 90], axis=0, method="lower"
+        )
+        xp_p50 = np.percentile(xp, 50, axis=0, method="lower")
+        reach_probability = (reached >= 0).mean(axis=0)
+        # Unreached runs sort last, so the median is a day only if >= half reached
+        never = np.iinfo(np.int64).max
+        median_day = np.percentile(
+            np.where(reached >= 0, reached, never), 50, axis=0, method="lower"
+        )
+
+        forecasts = []
+        for u, pace in enumerate(users):
+            day = int(median_day[u])
+            forecasts.append(
+                UserForecast(
+                    user_id=pace.character.user_id,
+                    level=int(level_p50[u]),
+                    xp=int(xp_p50[u]),
+                    level_p10=int(level_p10[u]),
+                    level_p90=int(level_p90[u]),
+                    target_level=int(targets[u]),
+                    target_date=start + timedelta(days=day) if day != never else None,
+                    reach_probability=float(reach_probability[u]),
+                )
+            )
+        return forecasts
+
+
+def _apply_level_ups(
+    level: np.ndarray,
+    xp: np.ndarray,
+    to_next: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # apply_xp on whole arrays: repeat while anyone still has a level to take
+    while True:
+        up = xp >= to_next
+        if not up.any():
+            return level, xp, to_next
+        xp = np.where(up, xp - to_next, xp)
+        level = np.where(up, level + 1, level)
+        to_next = np.where(up, level * 100, to_next)
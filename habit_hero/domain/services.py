@@ -1,9 +1,18 @@
 from __future__ import annotations
 
-from datetime import date
-from typing import Optional
+from dataclasses import replace
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Optional
 
-from .entities import Habit, StreakState, Character
+from .entities import (
+    Habit,
+    HabitLog,
+    HabitLogMonth,
+    StreakState,
+    Character,
+    FocusSession,
+    LifeForceCheck,
+)
 
 
 def calculate_new_streak(
@@ -40,9 +49,51 @@ def calculate_new_streak(
         current_streak=current,
         longest_streak=longest,
         last_completed_day=today,
+        version=existing.version,
     )
 
 
+def is_streak_expired(streak: StreakState, today: date) -> bool:
+    """
+    A streak is expired when it is still counting but its habit was
+    last completed before yesterday (so it can no longer be continued).
+    """
+    if streak.current_streak == 0 or streak.last_completed_day is None:
+        return False
+    return (today - streak.last_completed_day).days > 1
+
+
+def expire_streaks(
+    streaks: Iterable[StreakState],
+    today: date,
+) -> List[StreakState]:
+    """
+    Return reset copies (current_streak = 0) of every expired streak.
+    The longest streak and last completed day are kept as-is.
+
+    This is a plain module-level function so it can be shipped to
+    worker processes by the rollover job.
+    """
+    return [
+        replace(streak, current_streak=0)
+        for streak in streaks
+        if is_streak_expired(streak, today)
+    ]
+
+
+def next_reminder_at(habit: Habit, after: datetime) -> Optional[datetime]:
+    """
+    The first time strictly after `after` at which the habit's cue
+    reminder should fire, or None if the habit has no reminders.
+    """
+    if not habit.active or habit.reminder_time is None:
+        return None
+    candidate = datetime.combine(after.date(), habit.reminder_time)
+    if candidate <= after:
+        candidate += timedelta(days=1)
+    return candidate
+
+
 def xp_gain_for_habit(
     habit: Habit,
     streak: StreakState,
@@ -63,6 +114,55 @@ def xp_gain_for_habit(
     return int(base * bonus_multiplier)
 
 
+def month_of(day: date) -> date:
+    return day.replace(day=1)
+
+
+def fold_log(month: HabitLogMonth, log: HabitLog) -> bool:
+    """
+    Add a completion to a monthly aggregate. Returns False (and changes
+    nothing) if that day is already counted.
+    """
+    bit = 1 << (log.day.day - 1)
+    if month.days & bit:
+        return False
+    month.days |= bit
+    month.completions += 1
+    month.xp_total += log.xp_earned
+    if month.first_day is None or log.day < month.first_day:
+        month.first_day = log.day
+    if month.last_day is None or log.day > month.last_day:
+        month.last_day = log.day
+    return True
+
+
+def is_aligned(exercise_score: int, diet_score: int, min_score: int = 2) -> bool:
+    """
+    A day is "aligned" when both exercise and diet were at least good.
+    """
+    return exercise_score >= min_score and diet_score >= min_score
+
+
+def is_aligned_day(check: LifeForceCheck, min_score: int = 2) -> bool:
+    return is_aligned(check.exercise_score, check.diet_score, min_score)
+
+
+def xp_gain_for_focus_session(session: FocusSession) -> int:
+    """
+    XP for a completed focus session.
+    Simple rule: 1 XP per focused minute, capped at 120.
+    """
+    return max(0, min(session.duration_minutes, 120))
+
+
+def leaderboard_key(character: Character) -> tuple[int, int, str]:
+    """
+    Sort key for leaderboards: higher level first, then more XP.
+    The user id breaks ties so every shard orders the same way.
+    """
+    return (character.level, character.xp, character.user_id)
+
+
 def apply_xp(
     character: Character,
     gained_xp: int,
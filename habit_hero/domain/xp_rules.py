@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import math
+import zlib
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .entities import Habit, StreakState
+
+# Longest streak multiplier table: the cap must be reached within this
+# many steps (1000 steps of 5 days is ~14 years of streak)
+MAX_STREAK_STEPS = 1000
+
+
+@dataclass(frozen=True)
+class XpRuleDefinition:
+    """
+    Declarative description of a reward curve.
+
+    The defaults reproduce the original rules exactly:
+      - habit XP = base_xp * (1 + 10% per 5 streak days, capped at +50%)
+      - life force XP = 5 per point of exercise + diet alignment
+    """
+    name: str = "default"
+    # streak multiplier
+    streak_step_days: int = 5
+    streak_step_bonus: float = 0.1
+    streak_bonus_cap: float = 0.5
+    # bad habits being broken / replaced
+    bad_habit_multiplier: float = 1.0
+    # hard cap per completion (None = no cap)
+    max_habit_xp: Optional[int] = None
+    # life force
+    life_force_xp_per_point: int = 5
+    life_force_aligned_bonus: int = 0
+    life_force_aligned_min_score: int = 2
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "XpRuleDefinition":
+        known = {f.name for f in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Unknown XP rule fields: {sorted(unknown)}")
+        definition = cls(**data)
+        if definition.streak_step_days <= 0:
+            raise ValueError("streak_step_days must be positive.")
+        bonus, cap = definition.streak_step_bonus, definition.streak_bonus_cap
+        # "not >= 0" also rejects NaN
+        if not (bonus >= 0 and cap >= 0) or math.isinf(cap):
+            raise ValueError("streak_step_bonus and streak_bonus_cap must be finite and >= 0.")
+        if bonus > 0 and cap / bonus > MAX_STREAK_STEPS:
+            raise ValueError(
+                f"streak_bonus_cap must be reached within {MAX_STREAK_STEPS} streak steps."
+            )
+        return definition
+
+
+HabitXpFn = Callable[[Habit, StreakState], int]
+LifeForceXpFn = Callable[[int, int], int]
+
+
+@dataclass(frozen=True)
+class CompiledXpRules:
+    """
+    A rule definition compiled into plain callables.
+    """
+    definition: XpRuleDefinition
+    habit_xp: HabitXpFn
+    life_force_xp: LifeForceXpFn
+
+    def habit_xp_batch(
+        self,
+        completions: Iterable[Tuple[Habit, StreakState]],
+    ) -> List[int]:
+        habit_xp = self.habit_xp
+        return [habit_xp(habit, streak) for habit, streak in completions]
+
+    def life_force_xp_batch(self, scores: Iterable[Tuple[int, int]]) -> List[int]:
+        life_force_xp = self.life_force_xp
+        return [life_force_xp(exercise, diet) for exercise, diet in scores]
+
+
+def streak_multipliers(definition: XpRuleDefinition) -> List[float]:
+    """
+    Multiplier for each number of completed streak steps, up to the
+    first step that hits the cap (at most MAX_STREAK_STEPS, which
+    from_dict enforces). Later steps reuse the last entry.
+    Computed exactly like xp_gain_for_habit so results match bit for bit.
+    """
+    table = []
+    for steps in range(MAX_STREAK_STEPS + 1):
+        bonus = steps * definition.streak_step_bonus
+        table.append(1.0 + min(bonus, definition.streak_bonus_cap))
+        # "not bonus < cap" also ends on NaN
+        if not bonus < definition.streak_bonus_cap or definition.streak_step_bonus <= 0:
+            break
+    return table
+
+
+def compile_rules(definition: XpRuleDefinition) -> CompiledXpRules:
+    """
+    Turn a definition into closures with every constant pre-bound and
+    the streak multiplier turned into a table lookup, so scoring a
+    completion is a handful of local operations.
+    """
+    table = tuple(streak_multipliers(definition))
+    last_step = len(table) - 1
+    step_days = definition.streak_step_days
+    bad_multiplier = definition.bad_habit_multiplier
+    max_xp = definition.max_habit_xp
+
+    def habit_xp(habit: Habit, streak: StreakState) -> int:
+        steps = streak.current_streak // step_days
+        xp = int(habit.base_xp * table[steps if steps < last_step else last_step])
+        if habit.is_bad_habit and bad_multiplier != 1.0:
+            xp = int(xp * bad_multiplier)
+        if max_xp is not None and xp > max_xp:
+            xp = max_xp
+        return xp
+
+    per_point = definition.life_force_xp_per_point
+    aligned_bonus = definition.life_force_aligned_bonus
+    aligned_min = definition.life_force_aligned_min_score
+
+    def life_force_xp(exercise_score: int, diet_score: int) -> int:
+        xp = (exercise_score + diet_score) * per_point
+        if aligned_bonus and exercise_score >= aligned_min and diet_score >= aligned_min:
+            xp += aligned_bonus
+        return xp
+
+    return CompiledXpRules(
+        definition=definition,
+        habit_xp=habit_xp,
+        life_force_xp=life_force_xp,
+    )
+
+
+class XpRuleEngine:
+    """
+    Holds compiled rule sets and decides which one applies to a user.
+
+    Users are mapped to cohorts either explicitly (assign_user) or by a
+    stable hash of their id over the weighted split, and each cohort
+    points at a named rule set. configure() swaps the whole setup at
+    runtime, so reward curves can be A/B tested without a redeploy.
+    """
+
+    def __init__(self, default: Optional[XpRuleDefinition] = None) -> None:
+        default = default or XpRuleDefinition()
+        self._rules: Dict[str, CompiledXpRules] = {default.name: compile_rules(default)}
+        self._default = default.name
+        self._cohort_rules: Dict[str, str] = {}
+        self._user_cohorts: Dict[str, str] = {}
+        self._split: List[Tuple[str, int]] = []
+        self._split_total = 0
+
+    def register(self, definition: XpRuleDefinition) -> CompiledXpRules:
+        compiled = compile_rules(definition)
+        self._rules[definition.name] = compiled
+        return compiled
+
+    def set_cohort(self, cohort: str, rule_name: str, weight: int = 0) -> None:
+        """
+        Point a cohort at a rule set. A positive weight also makes the
+        cohort part of the hash-based split for unassigned users.
+        """
+        if rule_name not in self._rules:
+            raise ValueError(f"Unknown XP rule set: {rule_name}")
+        self._cohort_rules[cohort] = rule_name
+        self._split = [(c, w) for c, w in self._split if c != cohort]
+        if weight > 0:
+            self._split.append((cohort, weight))
+        self._split_total = sum(w for _, w in self._split)
+
+    def assign_user(self, user_id: str, cohort: str) -> None:
+        self._user_cohorts[user_id] = cohort
+
+    def configure(self, config: Mapping[str, Any]) -> None:
+        """
+        Replace rule sets and cohorts from a plain mapping, e.g. loaded
+        from JSON:
+
+            {
+              "rules": [{"name": "steep", "streak_step_bonus": 0.2}],
+              "cohorts": {"control": {"rules": "default", "weight": 50},
+                          "steep": {"rules": "steep", "weight": 50}}
+            }
+        """
+        fresh = XpRuleEngine(self._rules[self._default].definition)
+        for data in config.get("rules", []):
+            fresh.register(XpRuleDefinition.from_dict(data))
+        for cohort, spec in config.get("cohorts", {}).items():
+            fresh.set_cohort(cohort, spec["rules"], spec.get("weight", 0))
+        # Swap everything in one go; explicit user assignments survive
+        self._rules = fresh._rules
+        self._cohort_rules = fresh._cohort_rules
+        self._split = fresh._split
+        self._split_total = fresh._split_total
+
+    def cohort_for(self, user_id: str) -> Optional[str]:
+        cohort = self._user_cohorts.get(user_id)
+        if cohort is not None or not self._split_total:
+            return cohort
+        point = zlib.crc32(user_id.encode()) % self._split_total
+        for cohort, weight in self._split:
+            if point < weight:
+                return cohort
+            point -= weight
+        return None
+
+    def rules_for(self, user_id: str) -> CompiledXpRules:
+        rule_name = self._cohort_rules.get(self.cohort_for(user_id) or "", self._default)
+        return self._rules[rule_name]
+
+    def habit_xp(self, habit: Habit, streak: StreakState) -> int:
+        return self.rules_for(habit.user_id).habit_xp(habit, streak)
+
+    def life_force_xp(self, user_id: str, exercise_score: int, diet_score: int) -> int:
+        return self.rules_for(user_id).life_force_xp(exercise_score, diet_score)
+
+    def habit_xp_batch(
+        self,
+        completions: Iterable[Tuple[Habit, StreakState]],
+    ) -> List[int]:
+        """
+        Score many completions at once (recompute / import paths).
+        Rule lookup is done once per user, not once per completion.
+        """
+        per_user: Dict[str, HabitXpFn] = {}
+        scores = []
+        for habit, streak in completions:
+            fn = per_user.get(habit.user_id)
+            if fn is None:
+                fn = per_user[habit.user_id] = self.rules_for(habit.user_id).habit_xp
+            scores.append(fn(habit, streak))
+        return scores
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from habit_hero.application.ports import Clock
+
+
+class SystemClock(Clock):
+    """
+    Wall-clock time (UTC), matching the datetime.utcnow() used elsewhere.
+    """
+
+    def now(self) -> datetime:
+        return datetime.utcnow()
+
+
+class ManualClock(Clock):
+    """
+    A clock that only moves when told to.
+    Used by tests and benchmarks to drive timers deterministically.
+    """
+
+    def __init__(self, start: datetime) -> None:
+        self._now = start
+
+    def now(self) -> datetime:
+        return self._now
+
+    def advance(self, delta: timedelta) -> datetime:
+        self._now += delta
+        return self._now
+
+    def set(self, when: datetime) -> None:
+        self._now = when
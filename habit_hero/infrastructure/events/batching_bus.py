@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple, Type
+
+from habit_hero.application.ports import EventPublisher
+from habit_hero.domain.events import DomainEvent
+
+# A subscriber gets a whole batch at a time
+EventHandler = Callable[[List[DomainEvent]], None]
+
+
+class EventBusFull(RuntimeError):
+    """
+    Raised by publish() when the queue stays full past the timeout.
+    """
+
+
+@dataclass
+class SubscriberStats:
+    """
+    Delivery counters for one subscriber.
+    lag: events published but not yet handed to this subscriber.
+    """
+    delivered: int = 0
+    batches: int = 0
+    failures: int = 0
+    lag: int = 0
+    last_error: Optional[BaseException] = field(default=None, compare=False)
+
+
+@dataclass
+class _Subscriber:
+    handler: EventHandler
+    event_types: Tuple[Type[DomainEvent], ...]
+    stats: SubscriberStats = field(default_factory=SubscriberStats)
+
+    def wants(self, event: DomainEvent) -> bool:
+        return not self.event_types or isinstance(event, self.event_types)
+
+
+class BatchingEventBus(EventPublisher):
+    """
+    In-process event bus: publish() only appends to a bounded queue, and a
+    background thread hands queued events to every subscriber in batches
+    of up to `batch_size`. Request latency therefore does not depend on
+    how many subscribers there are or how slow they are.
+
+    Backpressure: once `max_pending` events are queued, publish() blocks
+    until the worker catches up, or raises EventBusFull after
+    `publish_timeout` seconds (None = wait forever).
+
+    Subscribers may publish follow-up events (e.g. AchievementUnlocked)
+    from the worker thread. Those are always queued, even past
+    `max_pending` or while closing: the worker cannot wait for itself,
+    and close() dispatches them before it stops.
+
+    A failing subscriber is counted in its stats and does not affect the
+    others. The worker thread is started on first use.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        max_pending: int = 100_000,
+        publish_timeout: Optional[float] = 5.0,
+    ) -> None:
+        if batch_size <= 0 or max_pending <= 0:
+            raise ValueError("batch_size and max_pending must be positive.")
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.publish_timeout = publish_timeout
+        self._subscribers: Dict[str, _Subscriber] = {}
+        self._queue: Deque[DomainEvent] = deque()
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    # --- subscribing -----------------------------------------------------
+
+    def subscribe(
+        self,
+        name: str,
+        handler: EventHandler,
+        *event_types: Type[DomainEvent],
+    ) -> None:
+        """
+        Register `handler` under `name`. With event_types, it only sees
+        events of those types; otherwise it sees everything.
+        """
+        with self._cond:
+            if name in self._subscribers:
+                raise ValueError(f"Subscriber already registered: {name}")
+            self._subscribers[name] = _Subscriber(handler, tuple(event_types))
+
+    def unsubscribe(self, name: str) -> None:
+        with self._cond:
+            self._subscribers.pop(name, None)
+
+    # --- publishing ------------------------------------------------------
+
+    def publish(self, events: Sequence[DomainEvent]) -> None:
+        if not events:
+            return
+        with self._cond:
+            from_worker = threading.current_thread() is self._worker
+            if self._closed and not from_worker:
+                raise RuntimeError("Event bus is closed.")
+            self._ensure_worker()
+            deadline = None
+            if self.publish_timeout is not None:
+                deadline = monotonic() + self.publish_timeout
+            for event in events:
+                while not from_worker and len(self._queue) >= self.max_pending:
+                    remaining = None if deadline is None else deadline - monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise EventBusFull(f"{len(self._queue)} events pending.")
+                    self._cond.wait(remaining)
+                self._queue.append(event)
+                for subscriber in self._subscribers.values():
+                    if subscriber.wants(event):
+                        subscriber.stats.lag += 1
+            self._cond.notify_all()
+
+    # --- metrics / lifecycle ---------------------------------------------
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def stats(self) -> Dict[str, SubscriberStats]:
+        with self._cond:
+            return {
+                name: SubscriberStats(**vars(subscriber.stats))
+                for name, subscriber in self._subscribers.items()
+            }
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything published so far has been dispatched.
+        Returns False if the timeout ran out first.
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._in_flight, timeout
+            )
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting events, dispatch what is queued, stop the worker.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None:
+            worker.join(timeout)
+
+    def __enter__(self) -> "BatchingEventBus":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # --- worker ----------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._run, name="habit-hero-events", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                count = min(self.batch_size, len(self._queue))
+                batch = [self._queue.popleft() for _ in range(count)]
+                self._in_flight = count
+                subscribers = list(self._subscribers.values())
+                # Room in the queue again: wake blocked publishers
+                self._cond.notify_all()
+
+            for subscriber in subscribers:
+                self._dispatch(subscriber, batch)
+
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _dispatch(self, subscriber: _Subscriber, batch: List[DomainEvent]) -> None:
+        events = (
+            batch
+            if not subscriber.event_types
+            else [e for e in batch if isinstance(e, subscriber.event_types)]
+        )
+        if not events:
+            return
+        stats = subscriber.stats
+        try:
+            subscriber.handler(events)
+            stats.delivered += len(events)
+            stats.batches += 1
+        except Exception as exc:  # a bad subscriber must not stop the bus
+            stats.failures += 1
+            stats.last_error = exc
+        with self._cond:
+            # Events queued before the subscriber joined were never counted
+            stats.lag = max(0, stats.lag - len(events))
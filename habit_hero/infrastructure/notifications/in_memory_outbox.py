@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import List
+
+from habit_hero.application.ports import ReminderOutbox
+from habit_hero.domain.entities import Reminder
+
+
+class InMemoryReminderOutbox(ReminderOutbox):
+    """
+    Local stand-in for a real delivery channel.
+    Keeps every delivered reminder in a list so tests and the demo
+    can see what would have been sent.
+    """
+
+    def __init__(self) -> None:
+        self.delivered: List[Reminder] = []
+
+    def deliver(self, reminders: List[Reminder]) -> None:
+        self.delivered.extend(reminders)
@@ -1,16 +1,43 @@
 from __future__ import annotations
 
+import heapq
+import threading
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import replace
 from datetime import date
-from typing import Dict, Optional
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
 
 from habit_hero.domain.entities import (
     User,
     Character,
     Habit,
     HabitLog,
+    HabitLogMonth,
     StreakState,
     LifeForceCheck,
+    LifeForceTrend,
+    FocusSession,
+    Dashboard,
 )
+from habit_hero.domain.achievements import (
+    DEFAULT_ACHIEVEMENTS,
+    METRICS,
+    AchievementProgress,
+    AchievementRule,
+)
+from habit_hero.domain.services import (
+    fold_log,
+    is_aligned_day,
+    leaderboard_key,
+    month_of,
+)
+from habit_hero.infrastructure.persistence.snapshots import (
+    Snapshot,
+    SnapshotManager,
+    VersionedDict,
+)
+from habit_hero.infrastructure.persistence.versioning import next_version
 from habit_hero.application.ports import (
     UserRepository,
     CharacterRepository,
@@ -18,46 +45,116 @@ from habit_hero.application.ports import (
     HabitLogRepository,
     StreakRepository,
     LifeForceRepository,
+    FocusSessionRepository,
+    DashboardRepository,
+    AchievementRepository,
 )
 
 
+T = TypeVar("T")
+
+
+def _copy(entity: T) -> T:
+    # replace(entity) without re-running __init__: a few times cheaper,
+    # which matters for the copies handed out on every read
+    copied = object.__new__(type(entity))
+    copied.__dict__.update(entity.__dict__)
+    return copied
+
+
 class InMemoryUserRepository(UserRepository):
     """
     Stores user data in memory only.
     This is perfect for early development and tests.
     Nothing is saved to disk.
+
+    Like every in-memory repository, its maps are VersionedDicts: pass
+    the SnapshotManager shared with the other repositories and scan()
+    reads them as of a snapshot while writes go on.
     """
 
-    def __init__(self) -> None:
-        self._users: Dict[str, User] = {}
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._users = VersionedDict(self._snapshots)  # key: user_id
 
     def get(self, user_id: str) -> Optional[User]:
         return self._users.get(user_id)
 
     def save(self, user: User) -> None:
         self._users[user.id] = user
-from habit_hero.application.ports import (
-    UserRepository,
-    CharacterRepository,
-    HabitRepository,
-    HabitLogRepository,
-    StreakRepository,
-)
+
+    def user_ids(self) -> List[str]:
+        return list(self._users)
+
+    def pop_user(self, user_id: str) -> List[User]:
+        user = self._users.pop(user_id, None)
+        return [user] if user is not None else []
+
+    def scan(self, snapshot: Snapshot) -> Iterator[User]:
+        return self._users.view(snapshot).values()
+
+
+def _copy_character(character: Character) -> Character:
+    return replace(character, appearance=dict(character.appearance))
+
 
 class InMemoryCharacterRepository(CharacterRepository):
     """
     In-memory storage for Character objects.
     One character per user (for now).
+    Saves are compare-and-swap on Character.version; the lock is only
+    held for the compare-and-set, like the latch of the shared stores.
     """
 
-    def __init__(self) -> None:
-        self._characters: Dict[str, Character] = {}  # key: user_id
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._characters = VersionedDict(self._snapshots)  # key: user_id
+        self._lock = threading.Lock()
 
     def get_for_user(self, user_id: str) -> Optional[Character]:
-        return self._characters.get(user_id)
+        # Hand out copies so callers can only change state through save()
+        stored = self._characters.get(user_id)
+        return _copy_character(stored) if stored is not None else None
 
     def save(self, character: Character) -> None:
-        self._characters[character.user_id] = character
+        copied = _copy_character(character)
+        with self._lock:
+            version = next_version(self._characters.get(character.user_id), character)
+            copied.version = version
+            self._characters[character.user_id] = copied
+        character.version = version
+
+    def list_top(self, limit: int) -> List[Character]:
+        top = heapq.nlargest(limit, self._characters.values(), key=leaderboard_key)
+        return [_copy_character(c) for c in top]
+
+    def restore(self, character: Character) -> None:
+        """
+        Store a character exactly as given (version included), for
+        moving data between stores rather than updating it.
+        """
+        copied = _copy_character(character)
+        with self._lock:
+            self._characters[character.user_id] = copied
+
+    def user_ids(self) -> List[str]:
+        return list(self._characters)
+
+    def pop_user(self, user_id: str) -> List[Character]:
+        with self._lock:
+            character = self._characters.pop(user_id, None)
+        return [character] if character is not None else []
+
+    def scan(self, snapshot: Snapshot) -> Iterator[Character]:
+        return (_copy_character(c) for c in self._characters.view(snapshot).values())
+
+# (user_id, habit_id, month) of a compacted HabitLogMonth
+_MonthKey = Tuple[str, str, date]
+
+# (group, active, is_bad_habit); group is "" for "all of the user's
+# habits" or a replaced habit id for "habits replacing that one"
+_HabitIndexKey = Tuple[str, bool, bool]
+
 
 class InMemoryHabitRepository(HabitRepository):
     """
@@ -65,70 +162,645 @@ class InMemoryHabitRepository(HabitRepository):
     Supports:
       - get by id
       - list all habits for a user
+      - cursor-paginated, filtered listing
       - save / update a habit
+
+    Each habit gets a sequence number on first save (creation order).
+    Per user, sorted sequence lists are kept for every (active, bad)
+    combination, both overall and per replaced habit, so a page is a
+    bisect plus a slice no matter how many habits are filtered out.
+
+    Habits are stored and handed out as copies, so a snapshot never
+    sees a habit changed in place before it was saved.
     """
 
-    def __init__(self) -> None:
-        self._habits: Dict[str, Habit] = {}  # key: habit_id
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._habits = VersionedDict(self._snapshots)  # key: habit_id
+        self._by_user: Dict[str, Dict[str, None]] = {}  # user_id -> habit ids
+        self._seq: Dict[str, int] = {}  # habit_id -> creation order
+        self._at_seq: Dict[int, str] = {}
+        self._next_seq = 0
+        # user_id -> index key -> sorted sequence numbers
+        self._index: Dict[str, Dict[_HabitIndexKey, List[int]]] = {}
+        # habit_id -> keys it is currently indexed under
+        self._keys_of: Dict[str, Tuple[_HabitIndexKey, ...]] = {}
 
     def get(self, habit_id: str) -> Optional[Habit]:
-        return self._habits.get(habit_id)
+        stored = self._habits.get(habit_id)
+        return _copy(stored) if stored is not None else None
 
     def list_for_user(self, user_id: str) -> list[Habit]:
+        index = self._index.get(user_id, {})
+        seqs = heapq.merge(
+            index.get(("", True, False), ()),
+            index.get(("", True, True), ()),
+        )
+        return [_copy(self._habits[self._at_seq[s]]) for s in seqs]
+
+    def list_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[str] = None,
+        active: Optional[bool] = True,
+        is_bad_habit: Optional[bool] = None,
+        replaces_habit_id: Optional[str] = None,
+    ) -> List[Habit]:
+        start = -1
+        if after is not None:
+            cursor = self._habits.get(after)
+            if cursor is None or cursor.user_id != user_id:
+                raise ValueError("Invalid habit cursor.")
+            start = self._seq[after]
+
+        index = self._index.get(user_id, {})
+        group = replaces_habit_id or ""
+        runs = []
+        for is_active in (True, False) if active is None else (active,):
+            for is_bad in (False, True) if is_bad_habit is None else (is_bad_habit,):
+                seqs = index.get((group, is_active, is_bad))
+                if seqs:
+                    pos = bisect_right(seqs, start)
+                    runs.append(seqs[pos:pos + limit])
+
+        seqs = islice(heapq.merge(*runs), limit)
+        return [_copy(self._habits[self._at_seq[s]]) for s in seqs]
+
+    def list_with_reminders(self) -> List[Habit]:
         return [
-            habit
-            for habit in self._habits.values()
-            if habit.user_id == user_id and habit.active
+            _copy(habit)
+            for habit in list(self._habits.values())
+            if habit.active and habit.reminder_time is not None
         ]
 
     def save(self, habit: Habit) -> None:
-        self._habits[habit.id] = habit
+        self._habits[habit.id] = _copy(habit)
+        self._by_user.setdefault(habit.user_id, {})[habit.id] = None
+
+        seq = self._seq.get(habit.id)
+        if seq is None:
+            seq = self._seq[habit.id] = self._next_seq
+            self._at_seq[seq] = habit.id
+            self._next_seq += 1
+
+        keys: Tuple[_HabitIndexKey, ...] = (("", habit.active, habit.is_bad_habit),)
+        if habit.replaces_habit_id:
+            keys += ((habit.replaces_habit_id, habit.active, habit.is_bad_habit),)
+        # Habits are often saved after being changed in place, so the
+        # previous keys are remembered rather than recomputed
+        old_keys = self._keys_of.get(habit.id, ())
+        if keys == old_keys:
+            return
+        index = self._index.setdefault(habit.user_id, {})
+        for key in old_keys:
+            self._unindex(index, key, seq)
+        for key in keys:
+            insort(index.setdefault(key, []), seq)
+        self._keys_of[habit.id] = keys
+
+    def user_ids(self) -> List[str]:
+        return list(self._by_user)
+
+    def pop_user(self, user_id: str) -> List[Habit]:
+        self._index.pop(user_id, None)
+        popped = []
+        for habit_id in self._by_user.pop(user_id, ()):
+            del self._at_seq[self._seq.pop(habit_id)]
+            del self._keys_of[habit_id]
+            popped.append(self._habits.pop(habit_id))
+        return popped
+
+    def scan(self, snapshot: Snapshot) -> Iterator[Habit]:
+        return (_copy(habit) for habit in self._habits.view(snapshot).values())
+
+    @staticmethod
+    def _unindex(
+        index: Dict[_HabitIndexKey, List[int]],
+        key: _HabitIndexKey,
+        seq: int,
+    ) -> None:
+        seqs = index[key]
+        del seqs[bisect_right(seqs, seq) - 1]
+        if not seqs:
+            del index[key]
 
 class InMemoryHabitLogRepository(HabitLogRepository):
     """
     In-memory storage for habit completion logs.
+
+    Compacted history lives in HabitLogMonth aggregates next to the raw
+    logs, so range scans only walk the raw days still retained plus one
+    entry per habit per compacted month.
     """
 
-    def __init__(self) -> None:
-        self._logs: Dict[str, HabitLog] = {}  # key: log_id
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._logs = VersionedDict(self._snapshots)  # key: log_id
+        # user_id -> day -> log ids
+        self._by_user_day: Dict[str, Dict[date, Dict[str, None]]] = {}
+        # key: (user_id, habit_id, month)
+        self._months = VersionedDict(self._snapshots)
+        # user_id -> keys of their compacted months
+        self._months_of: Dict[str, Dict[_MonthKey, None]] = {}
 
     def list_for_day(self, user_id: str, day: date) -> list[HabitLog]:
+        log_ids = self._by_user_day.get(user_id, {}).get(day, ())
+        return [self._logs[log_id] for log_id in log_ids]
+
+    def list_range(self, user_id: str, start: date, end: date) -> list[HabitLog]:
+        days = self._by_user_day.get(user_id, {})
         return [
-            log
-            for log in self._logs.values()
-            if log.user_id == user_id and log.day == day
+            self._logs[log_id]
+            for day in sorted(d for d in days if start <= d <= end)
+            for log_id in days[day]
         ]
 
+    def monthly_totals(self, user_id: str, start: date, end: date) -> list[HabitLogMonth]:
+        totals: Dict[_MonthKey, HabitLogMonth] = {}
+        for key in self._months_of.get(user_id, ()):
+            month = self._months[key]
+            if month.first_day <= end and month.last_day >= start:
+                totals[key] = replace(month)
+        for log in self.list_range(user_id, start, end):
+            key = (user_id, log.habit_id, month_of(log.day))
+            if key not in totals:
+                totals[key] = HabitLogMonth(user_id, log.habit_id, key[2])
+            fold_log(totals[key], log)
+        return [totals[key] for key in sorted(totals, key=lambda k: (k[2], k[1]))]
+
     def save(self, log: HabitLog) -> None:
-        self._logs[log.id] = log
+        key = (log.user_id, log.habit_id, month_of(log.day))
+        with self._snapshots.commit():
+            previous = self._logs.get(log.id)
+            compacted = key in self._months
+            if previous is not None and (compacted or previous.day != log.day):
+                self._unindex(previous)
+            if compacted:
+                # That month is history now: count the day (once) in its total
+                fold_log(self._months.mutable(key, replace), log)
+                return
+            self._logs[log.id] = log
+            days = self._by_user_day.setdefault(log.user_id, {})
+            days.setdefault(log.day, {})[log.id] = None
+
+    def compact_before(self, cutoff: date) -> int:
+        compacted = 0
+        with self._snapshots.commit():
+            for user_id, days in self._by_user_day.items():
+                old_days = [day for day in days if day < cutoff]
+                if not old_days:
+                    continue
+                months_of = self._months_of.setdefault(user_id, {})
+                for day in old_days:
+                    for log_id in days.pop(day):
+                        log = self._logs.pop(log_id)
+                        key = (user_id, log.habit_id, month_of(day))
+                        if key not in self._months:
+                            month = HabitLogMonth(user_id, log.habit_id, key[2])
+                            self._months[key] = month
+                            months_of[key] = None
+                        fold_log(self._months.mutable(key, replace), log)
+                        compacted += 1
+            self._by_user_day = {u: days for u, days in self._by_user_day.items() if days}
+        return compacted
+
+    def _unindex(self, log: HabitLog) -> None:
+        del self._logs[log.id]
+        days = self._by_user_day[log.user_id]
+        log_ids = days[log.day]
+        del log_ids[log.id]
+        if not log_ids:
+            del days[log.day]
+            if not days:
+                del self._by_user_day[log.user_id]
+
+    def restore(self, entity: HabitLog | HabitLogMonth) -> None:
+        """
+        Store a raw log or a compacted month exactly as given, for
+        moving data between stores.
+        """
+        if isinstance(entity, HabitLogMonth):
+            key = (entity.user_id, entity.habit_id, entity.month)
+            self._months[key] = entity
+            self._months_of.setdefault(entity.user_id, {})[key] = None
+            return
+        self._logs[entity.id] = entity
+        days = self._by_user_day.setdefault(entity.user_id, {})
+        days.setdefault(entity.day, {})[entity.id] = None
+
+    def user_ids(self) -> List[str]:
+        return list(self._by_user_day.keys() | self._months_of.keys())
+
+    def pop_user(self, user_id: str) -> List[HabitLog | HabitLogMonth]:
+        with self._snapshots.commit():
+            logs: List[HabitLog | HabitLogMonth] = [
+                self._logs.pop(log_id)
+                for log_ids in self._by_user_day.pop(user_id, {}).values()
+                for log_id in log_ids
+            ]
+            logs.extend(self._months.pop(key) for key in self._months_of.pop(user_id, ()))
+        return logs
+
+    def scan(self, snapshot: Snapshot) -> Iterator[HabitLog | HabitLogMonth]:
+        """
+        Raw logs, then compacted months, as of the snapshot.
+        """
+        yield from self._logs.view(snapshot).values()
+        for month in self._months.view(snapshot).values():
+            yield replace(month)
+
 
 class InMemoryStreakRepository(StreakRepository):
     """
     In-memory storage for streak state per (user, habit).
+
+    Live streaks are also bucketed by their last completed day so the
+    day-rollover job only has to visit the buckets that just expired.
+    Saves are compare-and-swap on StreakState.version. The lock covers
+    the compare-and-set and the day buckets it updates.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
         # key: (user_id, habit_id) as a single string "user|habit"
-        self._streaks: Dict[str, StreakState] = {}
+        self._streaks = VersionedDict(self._snapshots)
+        self._lock = threading.Lock()
+        # last_completed_day -> keys of live streaks completed that day
+        self._by_day: Dict[date, Dict[str, None]] = {}
+        # key -> the bucket it currently sits in
+        self._bucket_of: Dict[str, date] = {}
+        # user_id -> keys
+        self._by_user: Dict[str, Dict[str, None]] = {}
 
     def _key(self, user_id: str, habit_id: str) -> str:
         return f"{user_id}|{habit_id}"
 
     def get(self, user_id: str, habit_id: str) -> Optional[StreakState]:
-        return self._streaks.get(self._key(user_id, habit_id))
+        stored = self._streaks.get(self._key(user_id, habit_id))
+        return replace(stored) if stored is not None else None
+
+    def list_completed_before(self, day: date) -> list[StreakState]:
+        with self._lock:
+            expired_days = [d for d in self._by_day if d < day]
+            return [
+                replace(self._streaks[key])
+                for d in sorted(expired_days)
+                for key in self._by_day[d]
+            ]
 
     def save(self, streak: StreakState) -> None:
         key = self._key(streak.user_id, streak.habit_id)
-        self._streaks[key] = streak
+        with self._lock:
+            version = next_version(self._streaks.get(key), streak)
+            self._streaks[key] = replace(streak, version=version)
+            self._index(key, streak)
+        streak.version = version
+
+    def restore(self, streak: StreakState) -> None:
+        """
+        Store a streak exactly as given (version included), for moving
+        data between stores rather than updating it.
+        """
+        key = self._key(streak.user_id, streak.habit_id)
+        with self._lock:
+            self._streaks[key] = replace(streak)
+            self._index(key, streak)
+
+    def _index(self, key: str, streak: StreakState) -> None:
+        self._by_user.setdefault(streak.user_id, {})[key] = None
+        self._unindex(key)
+        if streak.current_streak > 0 and streak.last_completed_day is not None:
+            self._by_day.setdefault(streak.last_completed_day, {})[key] = None
+            self._bucket_of[key] = streak.last_completed_day
+
+    def user_ids(self) -> List[str]:
+        return list(self._by_user)
+
+    def pop_user(self, user_id: str) -> List[StreakState]:
+        popped = []
+        with self._lock, self._snapshots.commit():
+            for key in self._by_user.pop(user_id, ()):
+                self._unindex(key)
+                popped.append(self._streaks.pop(key))
+        return popped
+
+    def scan(self, snapshot: Snapshot) -> Iterator[StreakState]:
+        return (replace(streak) for streak in self._streaks.view(snapshot).values())
+
+    def _unindex(self, key: str) -> None:
+        day = self._bucket_of.pop(key, None)
+        if day is None:
+            return
+        bucket = self._by_day[day]
+        del bucket[key]
+        if not bucket:
+            del self._by_day[day]
+
+
+class _LifeForceSeries:
+    """
+    One user's Life Force checks laid out densely by day, with prefix
+    sums so any window total is two lookups.
+
+    prefix[i] holds the total over the first i days from `origin`.
+    """
+
+    def __init__(self, origin: int) -> None:
+        self.origin = origin  # date ordinal of days[0]
+        self.days: list[Optional[LifeForceCheck]] = []
+        self.exercise = [0]
+        self.diet = [0]
+        self.aligned = [0]
+        self.logged = [0]
+
+    def copy(self) -> "_LifeForceSeries":
+        series = _LifeForceSeries(self.origin)
+        series.days = list(self.days)
+        series.exercise = list(self.exercise)
+        series.diet = list(self.diet)
+        series.aligned = list(self.aligned)
+        series.logged = list(self.logged)
+        return series
+
+    def save(self, check: LifeForceCheck) -> None:
+        index = check.day.toordinal() - self.origin
+        if index < 0:
+            raise ValueError("Day is before the start of this series.")
+
+        if index >= len(self.days):
+            gap = index + 1 - len(self.days)
+            self.days.extend([None] * gap)
+            for prefix in (self.exercise, self.diet, self.aligned, self.logged):
+                prefix.extend([prefix[-1]] * gap)
+
+        old = self.days[index]
+        self.days[index] = check
+        deltas = (
+            (self.exercise, check.exercise_score - (old.exercise_score if old else 0)),
+            (self.diet, check.diet_score - (old.diet_score if old else 0)),
+            (self.aligned, is_aligned_day(check) - (is_aligned_day(old) if old else 0)),
+            (self.logged, 0 if old else 1),
+        )
+        # Saving today is the common case, so this usually touches one entry
+        for prefix, delta in deltas:
+            if delta:
+                for i in range(index + 1, len(prefix)):
+                    prefix[i] += delta
+
+    def get(self, day: date) -> Optional[LifeForceCheck]:
+        index = day.toordinal() - self.origin
+        if 0 <= index < len(self.days):
+            return self.days[index]
+        return None
+
+    def _bounds(self, start: date, end: date) -> tuple[int, int]:
+        size = len(self.days)
+        lo = min(max(start.toordinal() - self.origin, 0), size)
+        hi = min(max(end.toordinal() - self.origin + 1, 0), size)
+        return lo, max(lo, hi)
+
+    def list_range(self, start: date, end: date) -> list[LifeForceCheck]:
+        lo, hi = self._bounds(start, end)
+        return [c for c in self.days[lo:hi] if c is not None]
+
+    def trend(self, user_id: str, start: date, end: date) -> LifeForceTrend:
+        lo, hi = self._bounds(start, end)
+        return LifeForceTrend(
+            user_id=user_id,
+            start=start,
+            end=end,
+            days_logged=self.logged[hi] - self.logged[lo],
+            exercise_total=self.exercise[hi] - self.exercise[lo],
+            diet_total=self.diet[hi] - self.diet[lo],
+            aligned_days=self.aligned[hi] - self.aligned[lo],
+        )
+
+
 class InMemoryLifeForceRepository(LifeForceRepository):
-    def __init__(self) -> None:
-        # key: (user_id, day)
-        self._storage: Dict[tuple[str, date], LifeForceCheck] = {}
+    """
+    In-memory storage for daily Life Force checks.
+    Each user gets a dense per-day series with prefix sums, so range
+    reads and window trends do not need one lookup per day.
+
+    Series are updated in place, except that a series an open snapshot
+    can still read is copied on its first save.
+    """
+
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        # key: user_id
+        self._series = VersionedDict(self._snapshots)
 
     def save(self, check: LifeForceCheck) -> None:
-        key = (check.user_id, check.day)
-        self._storage[key] = check
+        with self._snapshots.commit():
+            series = self._series.get(check.user_id)
+            if series is None or check.day.toordinal() < series.origin:
+                # First check, or a backfill before the first day: (re)build
+                # the series starting at this day
+                rebuilt = _LifeForceSeries(check.day.toordinal())
+                if series is not None:
+                    for older in series.list_range(date.min, date.max):
+                        rebuilt.save(older)
+                self._series[check.user_id] = rebuilt
+            self._series.mutable(check.user_id, _LifeForceSeries.copy).save(check)
 
     def get_for_day(self, user_id: str, day: date) -> Optional[LifeForceCheck]:
-        return self._storage.get((user_id, day))
+        series = self._series.get(user_id)
+        return series.get(day) if series is not None else None
+
+    def list_range(self, user_id: str, start: date, end: date) -> list[LifeForceCheck]:
+        series = self._series.get(user_id)
+        return series.list_range(start, end) if series is not None else []
+
+    def trend(self, user_id: str, start: date, end: date) -> LifeForceTrend:
+        series = self._series.get(user_id)
+        if series is None:
+            return LifeForceTrend(user_id, start, end, 0, 0, 0, 0)
+        return series.trend(user_id, start, end)
+
+    def trends(
+        self,
+        user_ids: Iterable[str],
+        start: date,
+        end: date,
+    ) -> Dict[str, LifeForceTrend]:
+        return {user_id: self.trend(user_id, start, end) for user_id in user_ids}
+
+    def user_ids(self) -> List[str]:
+        return list(self._series)
+
+    def pop_user(self, user_id: str) -> List[LifeForceCheck]:
+        series = self._series.pop(user_id, None)
+        return series.list_range(date.min, date.max) if series is not None else []
+
+    def scan(self, snapshot: Snapshot) -> Iterator[LifeForceCheck]:
+        for series in self._series.view(snapshot).values():
+            yield from series.list_range(date.min, date.max)
+
+
+class InMemoryFocusSessionRepository(FocusSessionRepository):
+    """
+    In-memory storage for focus timer sessions, stored and handed out
+    as copies.
+    """
+
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._sessions = VersionedDict(self._snapshots)  # key: session_id
+        self._by_user: Dict[str, Dict[str, None]] = {}  # user_id -> session ids
+
+    def get(self, session_id: str) -> Optional[FocusSession]:
+        stored = self._sessions.get(session_id)
+        return _copy(stored) if stored is not None else None
+
+    def save(self, session: FocusSession) -> None:
+        self._sessions[session.id] = _copy(session)
+        self._by_user.setdefault(session.user_id, {})[session.id] = None
+
+    def user_ids(self) -> List[str]:
+        return list(self._by_user)
+
+    def pop_user(self, user_id: str) -> List[FocusSession]:
+        with self._snapshots.commit():
+            return [self._sessions.pop(s) for s in self._by_user.pop(user_id, ())]
+
+    def scan(self, snapshot: Snapshot) -> Iterator[FocusSession]:
+        return (_copy(session) for session in self._sessions.view(snapshot).values())
+
+
+class InMemoryDashboardRepository(DashboardRepository):
+    """
+    In-memory storage for the per-user Dashboard read model.
+
+    Dashboards are handed out as copies because the projections change
+    them in place (habit entries are replaced, never changed). A saved
+    dashboard is kept as given: the projections drop it after save().
+    update() changes a copy under the repository's lock.
+    """
+
+    def __init__(self, snapshots: Optional[SnapshotManager] = None) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._dashboards = VersionedDict(self._snapshots)  # key: user_id
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str) -> Optional[Dashboard]:
+        stored = self._dashboards.get(user_id)
+        return _copy_dashboard(stored) if stored is not None else None
+
+    def save(self, dashboard: Dashboard) -> None:
+        with self._lock:
+            self._dashboards[dashboard.user_id] = dashboard
+
+    def update(self, user_id: str, change: Callable[[Dashboard], None]) -> None:
+        with self._lock:
+            stored = self._dashboards.get(user_id)
+            if stored is None:
+                return
+            dashboard = _copy_dashboard(stored)
+            change(dashboard)
+            self._dashboards[user_id] = dashboard
+
+    def user_ids(self) -> List[str]:
+        return list(self._dashboards)
+
+    def pop_user(self, user_id: str) -> List[Dashboard]:
+        with self._lock:
+            dashboard = self._dashboards.pop(user_id, None)
+        return [dashboard] if dashboard is not None else []
+
+    def scan(self, snapshot: Snapshot) -> Iterator[Dashboard]:
+        return (_copy_dashboard(d) for d in self._dashboards.view(snapshot).values())
+
+
+def _copy_dashboard(dashboard: Dashboard) -> Dashboard:
+    copied = _copy(dashboard)
+    copied.habits = dict(dashboard.habits)
+    return copied
+
+
+class InMemoryAchievementRepository(AchievementRepository):
+    """
+    In-memory achievement rules and per-user progress.
+
+    Each metric keeps its rules sorted by threshold next to a parallel
+    list of the thresholds, so "next threshold above x" and "rules in
+    [low, high]" are binary searches. Progress is stored and handed out
+    as copies; rules are not versioned.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[AchievementRule] = DEFAULT_ACHIEVEMENTS,
+        snapshots: Optional[SnapshotManager] = None,
+    ) -> None:
+        self._snapshots = snapshots or SnapshotManager()
+        self._rules: Dict[str, AchievementRule] = {}
+        # metric -> (thresholds, rules), both sorted by threshold
+        self._by_metric: Dict[str, Tuple[List[int], List[AchievementRule]]] = {}
+        self._version = 0
+        self._progress = VersionedDict(self._snapshots)  # key: user_id
+        for rule in rules:
+            self.add_rule(rule)
+
+    def add_rule(self, rule: AchievementRule) -> None:
+        if rule.metric not in METRICS:
+            raise ValueError(f"Unknown achievement metric: {rule.metric}")
+        if rule.threshold <= 0:
+            raise ValueError("Achievement thresholds must be positive.")
+        previous = self._rules.get(rule.id)
+        if previous is not None:
+            thresholds, rules = self._by_metric[previous.metric]
+            index = rules.index(previous)
+            del thresholds[index], rules[index]
+        self._rules[rule.id] = rule
+        thresholds, rules = self._by_metric.setdefault(rule.metric, ([], []))
+        index = bisect_right(thresholds, rule.threshold)
+        thresholds.insert(index, rule.threshold)
+        rules.insert(index, rule)
+        self._version += 1
+
+    def get_rule(self, rule_id: str) -> Optional[AchievementRule]:
+        return self._rules.get(rule_id)
+
+    def rules_version(self) -> int:
+        return self._version
+
+    def next_threshold(self, metric: str, value: int) -> Optional[int]:
+        thresholds, _ = self._by_metric.get(metric, ((), ()))
+        index = bisect_right(thresholds, value)
+        return thresholds[index] if index < len(thresholds) else None
+
+    def rules_between(self, metric: str, low: int, high: int) -> List[AchievementRule]:
+        thresholds, rules = self._by_metric.get(metric, ((), ()))
+        return list(rules[bisect_left(thresholds, low) : bisect_right(thresholds, high)])
+
+    def get_progress(self, user_id: str) -> Optional[AchievementProgress]:
+        stored = self._progress.get(user_id)
+        return _copy_progress(stored) if stored is not None else None
+
+    def save_progress(self, progress: AchievementProgress) -> None:
+        self._progress[progress.user_id] = _copy_progress(progress)
+
+    def user_ids(self) -> List[str]:
+        return list(self._progress)
+
+    def pop_user(self, user_id: str) -> List[AchievementProgress]:
+        progress = self._progress.pop(user_id, None)
+        return [progress] if progress is not None else []
+
+    def restore(self, progress: AchievementProgress) -> None:
+        # user data moved between stores carries progress, not rules
+        self.save_progress(progress)
+
+    def scan(self, snapshot: Snapshot) -> Iterator[AchievementProgress]:
+        return (_copy_progress(p) for p in self._progress.view(snapshot).values())
+
 
+def _copy_progress(progress: AchievementProgress) -> AchievementProgress:
+    copied = _copy(progress)
+    copied.values = dict(progress.values)
+    copied.next_thresholds = dict(progress.next_thresholds)
+    copied.unlocked = dict(progress.unlocked)
+    copied.recent_days = dict(progress.recent_days)
+    return copied
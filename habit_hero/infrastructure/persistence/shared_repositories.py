@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import replace
+from datetime import date
+from typing import Any, List, MutableMapping, Optional
+
+from habit_hero.application.ports import CharacterRepository, StreakRepository
+from habit_hero.domain.entities import Character, StreakState
+from habit_hero.domain.services import leaderboard_key
+from habit_hero.infrastructure.persistence.versioning import next_version
+
+
+class SharedCharacterRepository(CharacterRepository):
+    """
+    Character storage shared between worker processes, e.g. backed by a
+    multiprocessing.Manager().dict().
+
+    The latch is only held for the compare-and-set inside save(); reads
+    and the caller's read-modify-write cycle run unlocked, and lost races
+    surface as ConcurrencyError for the use case to retry.
+    """
+
+    # Other processes write the same store: no write-behind buffering
+    shared_between_processes = True
+
+    def __init__(self, store: MutableMapping[str, Character], latch: Any) -> None:
+        self._store = store  # key: user_id
+        self._latch = latch
+
+    def get_for_user(self, user_id: str) -> Optional[Character]:
+        # A manager proxy already returns a fresh (unpickled) copy
+        return self._store.get(user_id)
+
+    def save(self, character: Character) -> None:
+        with self._latch:
+            version = next_version(self._store.get(character.user_id), character)
+            self._store[character.user_id] = replace(character, version=version)
+        character.version = version
+
+    def list_top(self, limit: int) -> List[Character]:
+        return heapq.nlargest(limit, self._store.values(), key=leaderboard_key)
+
+
+class SharedStreakRepository(StreakRepository):
+    """
+    Streak storage shared between worker processes, same model as
+    SharedCharacterRepository. There is no day index here, so
+    list_completed_before() scans every streak.
+    """
+
+    shared_between_processes = True
+
+    def __init__(self, store: MutableMapping[str, StreakState], latch: Any) -> None:
+        self._store = store  # key: "user|habit"
+        self._latch = latch
+
+    def _key(self, user_id: str, habit_id: str) -> str:
+        return f"{user_id}|{habit_id}"
+
+    def get(self, user_id: str, habit_id: str) -> Optional[StreakState]:
+        return self._store.get(self._key(user_id, habit_id))
+
+    def list_completed_before(self, day: date) -> list[StreakState]:
+        return [
+            streak
+            for streak in self._store.values()
+            if streak.current_streak > 0
+            and streak.last_completed_day is not None
+            and streak.last_completed_day < day
+        ]
+
+    def save(self, streak: StreakState) -> None:
+        key = self._key(streak.user_id, streak.habit_id)
+        with self._latch:
+            version = next_version(self._store.get(key), streak)
+            self._store[key] = replace(streak, version=version)
+        streak.version = version
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+# Marks "no value" in history: the key did not exist at that point
+_MISSING: Any = object()
+
+# Once this many deleted keys are waiting in VersionedDict._keys (and
+# they are at least half of it), the key list is rebuilt without them
+_COMPACT_AFTER = 1024
+
+
+class SnapshotManager:
+    """
+    Commit points and snapshots shared by a set of VersionedDicts (one
+    per in-memory repository map).
+
+    Every write to one of the maps is stamped with the next commit
+    number; a repository that must change several keys as one step
+    (e.g. pop_user) wraps them in `with manager.commit():` so they share
+    a number. A snapshot taken with snapshot() sees exactly the commits
+    finished before it was taken, across every map of the manager: a
+    consistent point in time, though a use case's saves are separate
+    commits and a snapshot can fall between them.
+
+    A re-entrant lock is held for each write (or commit block) only, so
+    writers on different threads take turns per write, never per use
+    case. Readers never take it while reading: opening and closing a
+    snapshot only waits for the write in progress. A commit groups
+    visibility, it is not a transaction: nothing is rolled back if the
+    block raises.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # every commit up to this number has finished
+        self._committed = 0
+        # last commit number handed out
+        self._last = 0
+        # commit number of the writes in progress (None between commits)
+        self._writing: Optional[int] = None
+        self._depth = 0
+        # snapshot version -> number of open snapshots at that version
+        self._open: Dict[int, int] = {}
+        self._newest = 0
+        # id -> map (dicts are not hashable, so no WeakSet)
+        self._stores: "weakref.WeakValueDictionary[int, VersionedDict]" = (
+            weakref.WeakValueDictionary()
+        )
+        self._commit = _Commit(self)
+
+    @property
+    def version(self) -> int:
+        """
+        The commit snapshots are taken at: it and every commit before it
+        have finished.
+        """
+        return self._committed
+
+    @property
+    def open_snapshots(self) -> int:
+        return sum(self._open.values())
+
+    def commit(self) -> "_Commit":
+        """
+        Context manager grouping writes into one commit; nested uses
+        join the outer commit. Keep the block to the writes themselves:
+        every other writer waits for it.
+        """
+        return self._commit
+
+    def snapshot(self) -> "Snapshot":
+        """
+        Open a read-only view as of the last finished commit. Close it
+        (or use it as a context manager) so the history kept for it can
+        be dropped.
+        """
+        with self._lock:
+            version = self._committed
+            self._open[version] = self._open.get(version, 0) + 1
+            self._newest = version
+        return Snapshot(self, version)
+
+    def history_size(self) -> int:
+        """
+        Old values currently kept for open snapshots, over all maps.
+        """
+        return sum(store.history_size() for store in list(self._stores.values()))
+
+    def _release(self, version: int) -> None:
+        with self._lock:
+            count = self._open[version] - 1
+            if count:
+                self._open[version] = count
+            else:
+                del self._open[version]
+            oldest = min(self._open, default=None)
+            self._newest = max(self._open, default=0)
+            for store in list(self._stores.values()):
+                store._prune(oldest)
+
+
+class _Commit:
+    __slots__ = ("_manager",)
+
+    def __init__(self, manager: SnapshotManager) -> None:
+        self._manager = manager
+
+    def __enter__(self) -> None:
+        manager = self._manager
+        manager._lock.acquire()
+        if not manager._depth:
+            manager._last += 1
+            manager._writing = manager._last
+        manager._depth += 1
+
+    def __exit__(self, *exc_info) -> None:
+        manager = self._manager
+        manager._depth -= 1
+        if not manager._depth:
+            manager._committed = manager._last
+            manager._writing = None
+        manager._lock.release()
+
+
+class Snapshot:
+    """
+    A consistent point in time of every map sharing one SnapshotManager.
+    """
+
+    def __init__(self, manager: SnapshotManager, version: int) -> None:
+        self.manager = manager
+        self.version = version
+        self.closed = False
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.manager._release(self.version)
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class VersionedDict(dict):
+    """
+    A dict whose past states stay readable through open snapshots.
+
+    Reads of the live dict are plain dict reads. Writes record the value
+    they replace, but only while a snapshot is open and only once per key
+    per commit, so the extra memory is proportional to the keys written
+    since the oldest open snapshot, never to the size of the map. Stored
+    values must not be changed in place; use mutable() for values that
+    are updated in place (it copies them first when a snapshot could
+    still see them).
+
+    Keys are also kept in an append-only list in first-insertion order,
+    which lets a snapshot iterate by position while writers insert and
+    delete, without copying the key set.
+    """
+
+    def __init__(self, snapshots: SnapshotManager) -> None:
+        super().__init__()
+        self._snapshots = snapshots
+        # key -> [(commit that replaced the value, value before it), ...]
+        self._history: Dict[Hashable, List[Tuple[int, Any]]] = {}
+        self._keys: List[Hashable] = []
+        self._deleted: Set[Hashable] = set()  # in _keys but not in the dict
+        snapshots._stores[id(self)] = self
+
+    # --- writes -------------------------------------------------------
+
+    # __setitem__ and __delitem__ take the lock directly rather than
+    # through commit(): they are on every write path
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        snapshots = self._snapshots
+        with snapshots._lock:
+            # Not inside a commit: this write is a commit of its own
+            own_commit = not snapshots._depth
+            if own_commit:
+                snapshots._last += 1
+                snapshots._writing = snapshots._last
+            if snapshots._open:
+                self._remember(key)
+            if not dict.__contains__(self, key):
+                if key in self._deleted:
+                    self._deleted.discard(key)
+                else:
+                    self._keys.append(key)
+            dict.__setitem__(self, key, value)
+            if own_commit:
+                snapshots._committed = snapshots._last
+                snapshots._writing = None
+
+    def __delitem__(self, key: Hashable) -> None:
+        snapshots = self._snapshots
+        with snapshots._lock:
+            if not dict.__contains__(self, key):
+                raise KeyError(key)
+            own_commit = not snapshots._depth
+            if own_commit:
+                snapshots._last += 1
+                snapshots._writing = snapshots._last
+            if snapshots._open:
+                self._remember(key)
+            dict.__delitem__(self, key)
+            self._deleted.add(key)
+            if not snapshots._open and len(self._deleted) >= _COMPACT_AFTER:
+                self._compact()
+            if own_commit:
+                snapshots._committed = snapshots._last
+                snapshots._writing = None
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        with self._snapshots.commit():
+            if not dict.__contains__(self, key):
+                if default is _MISSING:
+                    raise KeyError(key)
+                return default
+            value = dict.__getitem__(self, key)
+            del self[key]
+            return value
+
+    def popitem(self) -> Tuple[Hashable, Any]:
+        with self._snapshots.commit():
+            if not self:
+                raise KeyError("popitem(): dictionary is empty")
+            key = next(reversed(dict.keys(self)))
+            return key, self.pop(key)
+
+    def setdefault(self, key: Hashable, default: Any = None) -> Any:
+        with self._snapshots.commit():
+            if dict.__contains__(self, key):
+                return dict.__getitem__(self, key)
+            self[key] = default
+            return default
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        with self._snapshots.commit():
+            for key, value in dict(*args, **kwargs).items():
+                self[key] = value
+
+    def __ior__(self, other: Any) -> "VersionedDict":
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        with self._snapshots.commit():
+            for key in list(dict.keys(self)):
+                del self[key]
+
+    def mutable(self, key: Hashable, copy: Callable[[Any], Any]) -> Any:
+        """
+        The value under `key`, safe to change in place: if an open
+        snapshot may still read the stored value, a copy is stored and
+        returned instead. Call it inside a commit and finish the change
+        before the commit ends.
+        """
+        value = dict.__getitem__(self, key)
+        snapshots = self._snapshots
+        if snapshots._open:
+            history = self._history.get(key)
+            # Stored after every open snapshot was taken: private to writers
+            if history is None or history[-1][0] <= snapshots._newest:
+                value = copy(value)
+                self[key] = value
+        return value
+
+    def _remember(self, key: Hashable) -> None:
+        version = self._snapshots._writing
+        history = self._history.get(key)
+        if history is None:
+            self._history[key] = [(version, dict.get(self, key, _MISSING))]
+        elif history[-1][0] != version:
+            history.append((version, dict.get(self, key, _MISSING)))
+
+    def _prune(self, oldest: Optional[int]) -> None:
+        # Called with the manager's lock held, after a snapshot closed
+        if oldest is None:
+            self._history = {}
+            self._compact()
+            return
+        kept = {}
+        for key, history in self._history.items():
+            # an entry is only read by snapshots older than its commit
+            history = [entry for entry in history if entry[0] > oldest]
+            if history:
+                kept[key] = history
+        self._history = kept
+
+    def _compact(self) -> None:
+        deleted = self._deleted
+        if len(deleted) >= _COMPACT_AFTER and 2 * len(deleted) >= len(self._keys):
+            # A new list, so a reader still holding the old one is unaffected
+            self._keys = [key for key in self._keys if key not in deleted]
+            self._deleted = set()
+
+    def history_size(self) -> int:
+        return sum(len(history) for history in self._history.values())
+
+    # --- snapshot reads -----------------------------------------------
+
+    def view(self, snapshot: Snapshot) -> "SnapshotView":
+        """
+        Read-only mapping of this dict as of `snapshot`.
+        """
+        if snapshot.manager is not self._snapshots:
+            raise ValueError("Snapshot belongs to another SnapshotManager.")
+        if snapshot.closed:
+            raise ValueError("Snapshot is closed.")
+        return SnapshotView(self, snapshot)
+
+    def _value_at(self, key: Hashable, version: int) -> Any:
+        # Current value first, then history: a writer records history
+        # before it overwrites, so whichever value was read, the history
+        # entry that supersedes it is already there
+        value = dict.get(self, key, _MISSING)
+        for written, old in self._history.get(key, ()):
+            if written > version:
+                return old
+        return value
+
+
+class SnapshotView(Mapping):
+    """
+    A VersionedDict as of a snapshot. len() walks every key.
+    """
+
+    def __init__(self, store: VersionedDict, snapshot: Snapshot) -> None:
+        self._store = store
+        self._snapshot = snapshot
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self._store._value_at(key, self._version())
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self._store._value_at(key, self._version()) is not _MISSING
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for key, _ in self._items():
+            yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._items())
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:  # type: ignore[override]
+        return self._items()
+
+    def values(self) -> Iterator[Any]:  # type: ignore[override]
+        return (value for _, value in self._items())
+
+    def _items(self) -> Iterator[Tuple[Hashable, Any]]:
+        version = self._version()
+        store = self._store
+        keys = store._keys
+        # Keys appended later were inserted after the snapshot anyway
+        for i in range(len(keys)):
+            key = keys[i]
+            value = store._value_at(key, version)
+            if value is not _MISSING:
+                yield key, value
+
+    def _version(self) -> int:
+        if self._snapshot.closed:
+            raise ValueError("Snapshot is closed.")
+        return self._snapshot.version
@@ -0,0 +1,735 @@
+from __future__ import annotations
+
+import functools
+import heapq
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import date
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+from habit_hero.application.ports import (
+    UserRepository,
+    CharacterRepository,
+    HabitRepository,
+    HabitLogRepository,
+    StreakRepository,
+    LifeForceRepository,
+    FocusSessionRepository,
+    DashboardRepository,
+)
+from habit_hero.domain.entities import (
+    User,
+    Character,
+    Habit,
+    HabitLog,
+    HabitLogMonth,
+    StreakState,
+    LifeForceCheck,
+    LifeForceTrend,
+    FocusSession,
+    Dashboard,
+)
+from habit_hero.domain.services import leaderboard_key
+from habit_hero.infrastructure.ids import compact_key
+from habit_hero.infrastructure.persistence.versioning import next_version
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryUserRepository,
+    InMemoryCharacterRepository,
+    InMemoryHabitRepository,
+    InMemoryHabitLogRepository,
+    InMemoryStreakRepository,
+    InMemoryLifeForceRepository,
+    InMemoryFocusSessionRepository,
+    InMemoryDashboardRepository,
+)
+from habit_hero.infrastructure.persistence.user_data import (
+    UserData,
+    export_user,
+    import_user,
+)
+
+# Entities that are looked up by their own id rather than by user id
+_OWNED_KINDS = ("habits", "focus_sessions")
+
+
+def _oldest_log_day(data: UserData) -> Optional[str]:
+    days = [e.day for e in data.entities.get("logs", []) if isinstance(e, HabitLog)]
+    return min(days).isoformat() if days else None
+
+
+class SqliteColdStore:
+    """
+    On-disk home for evicted users: one pickled UserData blob per user,
+    plus the few columns needed to answer cross-user queries (leaderboard,
+    streak rollover) and id -> owner lookups without loading anyone.
+
+    The owner table is keyed by compact_key(), so time-ordered ids are
+    stored as 64-bit integers and appended at the end of the B-tree.
+
+    The connection may be used from any thread, one at a time: the
+    TierManager's lock serializes access.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS cold_users (
+                user_id TEXT PRIMARY KEY,
+                data BLOB NOT NULL,
+                level INTEGER,
+                xp INTEGER,
+                live_streak_day TEXT,
+                oldest_log_day TEXT
+            );
+            CREATE TABLE IF NOT EXISTS cold_owners (
+                kind TEXT NOT NULL,
+                entity_id NOT NULL,  -- no type: INTEGER or TEXT keys as given
+                user_id TEXT NOT NULL,
+                PRIMARY KEY (kind, entity_id)
+            );
+            CREATE INDEX IF NOT EXISTS cold_owners_user ON cold_owners (user_id);
+            CREATE INDEX IF NOT EXISTS cold_users_streak ON cold_users (live_streak_day);
+            """
+        )
+        self._add_oldest_log_day()
+
+    def _add_oldest_log_day(self) -> None:
+        # Stores written before the column existed: add it and fill it in
+        columns = [row[1] for row in self._db.execute("PRAGMA table_info(cold_users)")]
+        with self._db:
+            if "oldest_log_day" not in columns:
+                self._db.execute("ALTER TABLE cold_users ADD COLUMN oldest_log_day TEXT")
+                for user_id, blob in self._db.execute(
+                    "SELECT user_id, data FROM cold_users"
+                ).fetchall():
+                    self._db.execute(
+                        "UPDATE cold_users SET oldest_log_day = ? WHERE user_id = ?",
+                        (_oldest_log_day(pickle.loads(blob)), user_id),
+                    )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS cold_users_logs ON cold_users (oldest_log_day)"
+            )
+
+    def put(self, data: UserData) -> None:
+        characters = data.entities.get("characters", [])
+        live_days = [
+            s.last_completed_day
+            for s in data.entities.get("streaks", [])
+            if s.current_streak > 0 and s.last_completed_day is not None
+        ]
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO cold_users VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    data.user_id,
+                    pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL),
+                    characters[0].level if characters else None,
+                    characters[0].xp if characters else None,
+                    min(live_days).isoformat() if live_days else None,
+                    _oldest_log_day(data),
+                ),
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO cold_owners VALUES (?, ?, ?)",
+                [
+                    (kind, compact_key(entity.id), data.user_id)
+                    for kind in _OWNED_KINDS
+                    for entity in data.entities.get(kind, [])
+                ],
+            )
+
+    def peek(self, user_id: str) -> Optional[UserData]:
+        """
+        Read a user's data without loading them back into memory.
+        """
+        row = self._db.execute(
+            "SELECT data FROM cold_users WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        return pickle.loads(row[0]) if row is not None else None
+
+    def take(self, user_id: str) -> Optional[UserData]:
+        """
+        Remove and return a user's data; once loaded, memory is the truth.
+        """
+        data = self.peek(user_id)
+        if data is None:
+            return None
+        with self._db:
+            self._db.execute("DELETE FROM cold_users WHERE user_id = ?", (user_id,))
+            self._db.execute("DELETE FROM cold_owners WHERE user_id = ?", (user_id,))
+        return data
+
+    def owner(self, kind: str, entity_id: str) -> Optional[str]:
+        row = self._db.execute(
+            "SELECT user_id FROM cold_owners WHERE kind = ? AND entity_id = ?",
+            (kind, compact_key(entity_id)),
+        ).fetchone()
+        return row[0] if row else None
+
+    def top_characters(self, limit: int) -> List[str]:
+        rows = self._db.execute(
+            "SELECT user_id FROM cold_users WHERE level IS NOT NULL "
+            "ORDER BY level DESC, xp DESC, user_id DESC LIMIT ?",
+            (limit,),
+        )
+        return [r[0] for r in rows]
+
+    def users_with_live_streaks_before(self, day: date) -> List[str]:
+        rows = self._db.execute(
+            "SELECT user_id FROM cold_users WHERE live_streak_day < ?",
+            (day.isoformat(),),
+        )
+        return [r[0] for r in rows]
+
+    def users_with_logs_before(self, day: date) -> List[str]:
+        """
+        Users with a raw (not yet compacted) habit log older than `day`.
+        """
+        rows = self._db.execute(
+            "SELECT user_id FROM cold_users WHERE oldest_log_day < ?",
+            (day.isoformat(),),
+        )
+        return [r[0] for r in rows]
+
+    def user_ids(self) -> List[str]:
+        return [r[0] for r in self._db.execute("SELECT user_id FROM cold_users")]
+
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM cold_users").fetchone()[0]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+@dataclass
+class TierStats:
+    """
+    Access counters for the hot tier.
+    hits: user already in memory; misses: user was not;
+    loads: misses that were reloaded from disk; evictions: users spilled.
+    """
+    hits: int = 0
+    misses: int = 0
+    loads: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class TierManager:
+    """
+    Keeps at most `max_resident_users` users' objects in the in-memory
+    repositories, least recently used first out. Evicted users are
+    written to the cold store and transparently reloaded the next time
+    anything of theirs is accessed.
+
+    `lock` guards the LRU, the hot repositories and the cold store. The
+    tiered repositories hold it for each call, so a user cannot be
+    evicted between being touched and being read; callers of the other
+    methods must hold it too, except flush() which takes it itself.
+    """
+
+    def __init__(self, cold: SqliteColdStore, max_resident_users: int) -> None:
+        if max_resident_users <= 0:
+            raise ValueError("max_resident_users must be positive.")
+        self.cold = cold
+        self.max_resident_users = max_resident_users
+        self.hot: Dict[str, Any] = {
+            "users": InMemoryUserRepository(),
+            "characters": InMemoryCharacterRepository(),
+            "habits": InMemoryHabitRepository(),
+            "logs": InMemoryHabitLogRepository(),
+            "streaks": InMemoryStreakRepository(),
+            "life_force": InMemoryLifeForceRepository(),
+            "focus_sessions": InMemoryFocusSessionRepository(),
+            "dashboards": InMemoryDashboardRepository(),
+        }
+        self._resident: OrderedDict[str, None] = OrderedDict()
+        # resident user -> repositories that already handed their data over
+        self._popped: Dict[str, set] = {}
+        self.stats = TierStats()
+        self.lock = threading.RLock()
+
+    @property
+    def resident_users(self) -> int:
+        return len(self._resident)
+
+    def touch(self, user_id: str, write: bool = False) -> None:
+        """
+        Mark a user as just used, loading them from disk if needed.
+        An unknown user only takes a resident slot when `write` says
+        something of theirs is about to be saved; lookups of ids that
+        exist nowhere leave the LRU alone.
+        """
+        if write:
+            # Saved again after a partial pop_user: not on its way out
+            self._popped.pop(user_id, None)
+        if user_id in self._resident:
+            self._resident.move_to_end(user_id)
+            self.stats.hits += 1
+            return
+
+        self.stats.misses += 1
+        data = self.cold.take(user_id)
+        if data is not None:
+            import_user(self.hot, data)
+            self.stats.loads += 1
+        elif not write:
+            return
+        self._resident[user_id] = None
+
+        while len(self._resident) > self.max_resident_users:
+            oldest = next(iter(self._resident))
+            self.evict(oldest)
+
+    def update_cold(
+        self,
+        user_id: str,
+        name: str,
+        change: Callable[[List[Any]], None],
+    ) -> bool:
+        """
+        Apply `change` to an evicted user's entities of repository
+        `name` on disk, without loading the user. Returns False (and
+        changes nothing) if the user is resident or not on disk.
+        """
+        if user_id in self._resident:
+            return False
+        data = self.cold.peek(user_id)
+        if data is None:
+            return False
+        entities = data.entities.setdefault(name, [])
+        change(entities)
+        if not entities:
+            del data.entities[name]
+        self.cold.put(data)
+        return True
+
+    def evict(self, user_id: str) -> None:
+        self._resident.pop(user_id, None)
+        self._popped.pop(user_id, None)
+        data = export_user(self.hot, user_id)
+        if data.entities:
+            self.cold.put(data)
+        self.stats.evictions += 1
+
+    def locate(self, kind: str, entity_id: str) -> Optional[str]:
+        """
+        Owner of an evicted habit / focus session, if it is on disk.
+        """
+        return self.cold.owner(kind, entity_id)
+
+    def user_ids(self, name: str) -> List[str]:
+        """
+        Users that may have data in repository `name`: resident users
+        that do, plus every user on disk (without opening their data).
+        """
+        ids = dict.fromkeys(self.hot[name].user_ids())
+        ids.update(dict.fromkeys(self.cold.user_ids()))
+        return list(ids)
+
+    def pop_user(self, name: str, user_id: str) -> List[Any]:
+        """
+        Remove and return a user's entities from repository `name`, for
+        moving the user to another store. An evicted user's share is
+        taken out of their data on disk without loading them; a resident
+        user leaves the LRU once every repository has handed theirs over.
+        """
+        if user_id not in self._resident:
+            data = self.cold.take(user_id)
+            if data is None:
+                return []
+            entities = data.entities.pop(name, [])
+            if data.entities:
+                self.cold.put(data)
+            return entities
+
+        entities = self.hot[name].pop_user(user_id)
+        popped = self._popped.setdefault(user_id, set())
+        popped.add(name)
+        if len(popped) == len(self.hot):
+            del self._popped[user_id]
+            del self._resident[user_id]
+        return entities
+
+    def flush(self) -> None:
+        """
+        Spill every resident user to disk (e.g. before shutdown).
+        """
+        with self.lock:
+            for user_id in list(self._resident):
+                self.evict(user_id)
+
+
+R = TypeVar("R")
+
+
+def _locked(method: Callable[..., R]) -> Callable[..., R]:
+    # Runs a tiered repository method under its TierManager's lock
+    @functools.wraps(method)
+    def locked(self: Any, *args: Any, **kwargs: Any) -> R:
+        with self.tiers.lock:
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+class TieredUserRepository(UserRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryUserRepository = tiers.hot["users"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("users")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[User]:
+        return self.tiers.pop_user("users", user_id)
+
+    @_locked
+    def get(self, user_id: str) -> Optional[User]:
+        self.tiers.touch(user_id)
+        return self.hot.get(user_id)
+
+    @_locked
+    def save(self, user: User) -> None:
+        self.tiers.touch(user.id, write=True)
+        self.hot.save(user)
+
+
+class TieredCharacterRepository(CharacterRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryCharacterRepository = tiers.hot["characters"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("characters")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[Character]:
+        return self.tiers.pop_user("characters", user_id)
+
+    @_locked
+    def restore(self, character: Character) -> None:
+        self.tiers.touch(character.user_id, write=True)
+        self.hot.restore(character)
+
+    @_locked
+    def get_for_user(self, user_id: str) -> Optional[Character]:
+        self.tiers.touch(user_id)
+        return self.hot.get_for_user(user_id)
+
+    @_locked
+    def save(self, character: Character) -> None:
+        self.tiers.touch(character.user_id, write=True)
+        self.hot.save(character)
+
+    @_locked
+    def list_top(self, limit: int) -> List[Character]:
+        # Cold candidates come from the indexed level/xp columns and are
+        # read in place, so a leaderboard does not churn the hot tier
+        candidates = self.hot.list_top(limit)
+        for user_id in self.tiers.cold.top_characters(limit):
+            data = self.tiers.cold.peek(user_id)
+            if data is not None:
+                candidates.extend(data.entities.get("characters", []))
+        return heapq.nlargest(limit, candidates, key=leaderboard_key)
+
+
+class TieredHabitRepository(HabitRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryHabitRepository = tiers.hot["habits"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("habits")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[Habit]:
+        return self.tiers.pop_user("habits", user_id)
+
+    @_locked
+    def get(self, habit_id: str) -> Optional[Habit]:
+        habit = self.hot.get(habit_id)
+        if habit is not None:
+            self.tiers.touch(habit.user_id)
+            return habit
+        # An evicted owner is read in place (e.g. by the reminder tick);
+        # saving the habit, or reading the rest of the user, loads them
+        owner = self.tiers.locate("habits", habit_id)
+        data = self.tiers.cold.peek(owner) if owner is not None else None
+        if data is None:
+            return None
+        return next((h for h in data.entities.get("habits", []) if h.id == habit_id), None)
+
+    @_locked
+    def list_for_user(self, user_id: str) -> List[Habit]:
+        self.tiers.touch(user_id)
+        return self.hot.list_for_user(user_id)
+
+    @_locked
+    def list_page(
+        self,
+        user_id: str,
+        limit: int,
+        after: Optional[str] = None,
+        active: Optional[bool] = True,
+        is_bad_habit: Optional[bool] = None,
+        replaces_habit_id: Optional[str] = None,
+    ) -> List[Habit]:
+        self.tiers.touch(user_id)
+        return self.hot.list_page(
+            user_id, limit, after, active, is_bad_habit, replaces_habit_id
+        )
+
+    @_locked
+    def list_with_reminders(self) -> List[Habit]:
+        # Evicted users are read in place, not loaded back
+        habits = self.hot.list_with_reminders()
+        for user_id in self.tiers.cold.user_ids():
+            data = self.tiers.cold.peek(user_id)
+            if data is not None:
+                habits.extend(
+                    habit
+                    for habit in data.entities.get("habits", [])
+                    if habit.active and habit.reminder_time is not None
+                )
+        return habits
+
+    @_locked
+    def save(self, habit: Habit) -> None:
+        self.tiers.touch(habit.user_id, write=True)
+        self.hot.save(habit)
+
+
+class TieredHabitLogRepository(HabitLogRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryHabitLogRepository = tiers.hot["logs"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("logs")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[HabitLog | HabitLogMonth]:
+        return self.tiers.pop_user("logs", user_id)
+
+    @_locked
+    def restore(self, entity: HabitLog | HabitLogMonth) -> None:
+        self.tiers.touch(entity.user_id, write=True)
+        self.hot.restore(entity)
+
+    @_locked
+    def list_for_day(self, user_id: str, day: date) -> List[HabitLog]:
+        self.tiers.touch(user_id)
+        return self.hot.list_for_day(user_id, day)
+
+    @_locked
+    def list_range(self, user_id: str, start: date, end: date) -> List[HabitLog]:
+        self.tiers.touch(user_id)
+        return self.hot.list_range(user_id, start, end)
+
+    @_locked
+    def monthly_totals(self, user_id: str, start: date, end: date) -> List[HabitLogMonth]:
+        self.tiers.touch(user_id)
+        return self.hot.monthly_totals(user_id, start, end)
+
+    @_locked
+    def save(self, log: HabitLog) -> None:
+        self.tiers.touch(log.user_id, write=True)
+        self.hot.save(log)
+
+    @_locked
+    def compact_before(self, cutoff: date) -> int:
+        """
+        Resident users are compacted in place. Evicted users are
+        compacted on disk (read, compacted, written back) without
+        being loaded, so the job does not churn the hot tier; only those
+        whose indexed oldest raw log is before the cutoff are read.
+        """
+        compacted = self.hot.compact_before(cutoff)
+        cold = self.tiers.cold
+        for user_id in cold.users_with_logs_before(cutoff):
+            data = cold.peek(user_id)
+            if data is None:
+                continue
+            logs = data.entities.get("logs", [])
+            scratch = InMemoryHabitLogRepository()
+            for log in logs:
+                scratch.restore(log)
+            compacted += scratch.compact_before(cutoff)
+            data.entities["logs"] = scratch.pop_user(user_id)
+            cold.put(data)
+        return compacted
+
+
+class TieredStreakRepository(StreakRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryStreakRepository = tiers.hot["streaks"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("streaks")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[StreakState]:
+        return self.tiers.pop_user("streaks", user_id)
+
+    @_locked
+    def restore(self, streak: StreakState) -> None:
+        self.tiers.touch(streak.user_id, write=True)
+        self.hot.restore(streak)
+
+    @_locked
+    def get(self, user_id: str, habit_id: str) -> Optional[StreakState]:
+        self.tiers.touch(user_id)
+        return self.hot.get(user_id, habit_id)
+
+    @_locked
+    def list_completed_before(self, day: date) -> List[StreakState]:
+        # Only cold users with a lapsed live streak are read, in place
+        streaks = self.hot.list_completed_before(day)
+        for user_id in self.tiers.cold.users_with_live_streaks_before(day):
+            data = self.tiers.cold.peek(user_id)
+            if data is None:
+                continue
+            streaks.extend(
+                s
+                for s in data.entities.get("streaks", [])
+                if s.current_streak > 0
+                and s.last_completed_day is not None
+                and s.last_completed_day < day
+            )
+        return streaks
+
+    @_locked
+    def save(self, streak: StreakState) -> None:
+        # An evicted user's streak (e.g. reset by the rollover sweep) is
+        # saved on disk, so sweeping does not load every lapsed user
+        def change(streaks: List[StreakState]) -> None:
+            stored = next((s for s in streaks if s.habit_id == streak.habit_id), None)
+            version = next_version(stored, streak)
+            if stored is not None:
+                streaks.remove(stored)
+            streaks.append(replace(streak, version=version))
+            streak.version = version
+
+        if not self.tiers.update_cold(streak.user_id, "streaks", change):
+            self.tiers.touch(streak.user_id, write=True)
+            self.hot.save(streak)
+
+
+class TieredLifeForceRepository(LifeForceRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryLifeForceRepository = tiers.hot["life_force"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("life_force")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[LifeForceCheck]:
+        return self.tiers.pop_user("life_force", user_id)
+
+    @_locked
+    def save(self, check: LifeForceCheck) -> None:
+        self.tiers.touch(check.user_id, write=True)
+        self.hot.save(check)
+
+    @_locked
+    def get_for_day(self, user_id: str, day: date) -> Optional[LifeForceCheck]:
+        self.tiers.touch(user_id)
+        return self.hot.get_for_day(user_id, day)
+
+    @_locked
+    def list_range(self, user_id: str, start: date, end: date) -> List[LifeForceCheck]:
+        self.tiers.touch(user_id)
+        return self.hot.list_range(user_id, start, end)
+
+    @_locked
+    def trend(self, user_id: str, start: date, end: date) -> LifeForceTrend:
+        self.tiers.touch(user_id)
+        return self.hot.trend(user_id, start, end)
+
+    @_locked
+    def trends(
+        self,
+        user_ids: Iterable[str],
+        start: date,
+        end: date,
+    ) -> Dict[str, LifeForceTrend]:
+        return {user_id: self.trend(user_id, start, end) for user_id in user_ids}
+
+
+class TieredFocusSessionRepository(FocusSessionRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryFocusSessionRepository = tiers.hot["focus_sessions"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("focus_sessions")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[FocusSession]:
+        return self.tiers.pop_user("focus_sessions", user_id)
+
+    @_locked
+    def get(self, session_id: str) -> Optional[FocusSession]:
+        session = self.hot.get(session_id)
+        if session is not None:
+            self.tiers.touch(session.user_id)
+            return session
+        owner = self.tiers.locate("focus_sessions", session_id)
+        if owner is None:
+            return None
+        self.tiers.touch(owner)
+        return self.hot.get(session_id)
+
+    @_locked
+    def save(self, session: FocusSession) -> None:
+        self.tiers.touch(session.user_id, write=True)
+        self.hot.save(session)
+
+
+class TieredDashboardRepository(DashboardRepository):
+    def __init__(self, tiers: TierManager) -> None:
+        self.tiers = tiers
+        self.hot: InMemoryDashboardRepository = tiers.hot["dashboards"]
+
+    @_locked
+    def user_ids(self) -> List[str]:
+        return self.tiers.user_ids("dashboards")
+
+    @_locked
+    def pop_user(self, user_id: str) -> List[Dashboard]:
+        return self.tiers.pop_user("dashboards", user_id)
+
+    @_locked
+    def get(self, user_id: str) -> Optional[Dashboard]:
+        self.tiers.touch(user_id)
+        return self.hot.get(user_id)
+
+    @_locked
+    def save(self, dashboard: Dashboard) -> None:
+        self.tiers.touch(dashboard.user_id, write=True)
+        self.hot.save(dashboard)
+
+    @_locked
+    def update(self, user_id: str, change: Callable[[Dashboard], None]) -> None:
+        self.tiers.touch(user_id)
+        self.hot.update(user_id, change)
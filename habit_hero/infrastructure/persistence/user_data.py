@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Set
+
+
+@dataclass
+class UserData:
+    """
+    Everything stored for one user, grouped by repository name.
+    Used to move a user between stores (shards, memory tiers).
+    """
+    user_id: str
+    entities: Dict[str, List[Any]] = field(default_factory=dict)
+
+
+def _per_user(repositories: Mapping[str, Any]) -> Dict[str, Any]:
+    # Only repositories that can hand over a user's data take part
+    return {
+        name: repo
+        for name, repo in repositories.items()
+        if hasattr(repo, "pop_user") and hasattr(repo, "user_ids")
+    }
+
+
+def user_ids(repositories: Mapping[str, Any]) -> Set[str]:
+    """
+    Every user id that has data in any of the repositories.
+    """
+    ids: Set[str] = set()
+    for repo in _per_user(repositories).values():
+        ids.update(repo.user_ids())
+    return ids
+
+
+def export_user(repositories: Mapping[str, Any], user_id: str) -> UserData:
+    """
+    Remove a user's data from the repositories and return it.
+    """
+    data = UserData(user_id=user_id)
+    for name, repo in _per_user(repositories).items():
+        entities = repo.pop_user(user_id)
+        if entities:
+            data.entities[name] = entities
+    return data
+
+
+def import_user(repositories: Mapping[str, Any], data: UserData) -> None:
+    """
+    Save exported user data into (another set of) repositories.
+    The user must not already exist there. Repositories with a
+    restore() method take entities as-is, so versions survive the move.
+    """
+    for name, entities in data.entities.items():
+        repo = repositories[name]
+        store = getattr(repo, "restore", None) or repo.save
+        for entity in entities:
+            store(entity)
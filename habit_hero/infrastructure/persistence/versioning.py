@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Optional, Protocol
+
+from habit_hero.application.ports import ConcurrencyError
+
+
+class Versioned(Protocol):
+    version: int
+
+
+def next_version(stored: Optional[Versioned], incoming: Versioned) -> int:
+    """
+    Compare-and-swap check shared by the versioned repositories.
+    The write only goes through if nobody saved since `incoming` was read.
+    """
+    if stored is not None and stored.version != incoming.version:
+        raise ConcurrencyError(
+            f"{type(incoming).__name__} was modified concurrently "
+            f"(read version {incoming.version}, stored version {stored.version})."
+        )
+    return incoming.version + 1
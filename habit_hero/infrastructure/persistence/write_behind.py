@@ -0,0 +1,436 @@
+from __future__ import annotations
+
+import functools
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, replace
+from datetime import date
+from time import monotonic
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from habit_hero.application.ports import (
+    CharacterRepository,
+    ConcurrencyError,
+    DashboardRepository,
+    HabitLogRepository,
+    StreakRepository,
+)
+from habit_hero.domain.entities import (
+    Character,
+    Dashboard,
+    HabitLog,
+    HabitLogMonth,
+    StreakState,
+)
+from habit_hero.infrastructure.persistence.versioning import next_version
+
+
+R = TypeVar("R")
+
+
+def _locked(method: Callable[..., R]) -> Callable[..., R]:
+    # Runs a write-behind repository method under its buffer lock
+    @functools.wraps(method)
+    def locked(self: Any, *args: Any, **kwargs: Any) -> R:
+        with self._lock:
+            return method(self, *args, **kwargs)
+
+    return locked
+
+
+@dataclass
+class WriteBehindStats:
+    """
+    saves: save() calls accepted into the buffer.
+    writes: entities actually handed to the backend.
+    flushes: save_many() calls made on the backend.
+    """
+    saves: int = 0
+    writes: int = 0
+    flushes: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        return self.saves - self.writes
+
+    @property
+    def write_reduction(self) -> float:
+        """
+        How many times fewer entity writes reached the backend.
+        """
+        return self.saves / self.writes if self.writes else 0.0
+
+
+class WriteBehindRepository:
+    """
+    Wraps a repository so save() only records the entity in a buffer
+    keyed by its identity; repeated saves of the same key collapse into
+    one. The buffer is written with the backend's save_many() once it
+    holds `max_pending` keys, once its oldest write is `flush_interval`
+    seconds old (checked on every call, or by a job via flush_if_due),
+    and on flush()/close().
+
+    Subclasses make the port's reads see buffered entities. Any other
+    method (list_top, user_ids, pop_user, ...) flushes first and then
+    goes to the backend, so queries never miss a buffered write.
+
+    Calls are serialized by a re-entrant lock, held across the backend
+    write of a flush, so the buffer can be shared by several threads
+    (e.g. use cases and the event bus worker).
+
+    Entries leave the buffer only once the backend has accepted them: if
+    save_many() raises, whatever it did not write stays buffered for the
+    next flush.
+    """
+
+    def __init__(
+        self,
+        backend: Any,
+        max_pending: int = 1000,
+        flush_interval: float = 1.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if max_pending <= 0 or flush_interval < 0:
+            raise ValueError("max_pending must be positive and flush_interval not negative.")
+        self.backend = backend
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self._pending: Dict[Hashable, Any] = {}
+        self._oldest: Optional[float] = None
+        self._lock = threading.RLock()
+        self.stats = WriteBehindStats()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "backend":  # not set yet
+            raise AttributeError(name)
+        attr = getattr(self.backend, name)
+        if not callable(attr):
+            return attr
+
+        def flushed(*args: Any, **kwargs: Any) -> Any:
+            with self._lock:
+                self.flush()
+                return attr(*args, **kwargs)
+
+        return flushed
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @_locked
+    def flush_if_due(self) -> bool:
+        if self._oldest is None or self.clock() - self._oldest < self.flush_interval:
+            return False
+        self.flush()
+        return True
+
+    @_locked
+    def flush(self) -> None:
+        if not self._pending:
+            return
+        keys = list(self._pending)
+        entities = self._prepare(keys)
+        self.stats.flushes += 1
+        try:
+            self.backend.save_many(entities)
+        except Exception:
+            written = [k for k, e in zip(keys, entities) if self._written(k, e)]
+            self.stats.writes += len(written)
+            self._accepted(written)
+            raise
+        self.stats.writes += len(keys)
+        self._accepted(keys)
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "WriteBehindRepository":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _buffered(self, key: Hashable) -> Any:
+        self.flush_if_due()
+        return self._pending.get(key)
+
+    def _buffer(self, key: Hashable, entity: Any) -> None:
+        self.stats.saves += 1
+        self._pending[key] = entity
+        if self._oldest is None:
+            self._oldest = self.clock()
+        if len(self._pending) >= self.max_pending:
+            self.flush()
+        else:
+            self.flush_if_due()
+
+    def _prepare(self, keys: List[Hashable]) -> List[Any]:
+        return [self._pending[key] for key in keys]
+
+    def _written(self, key: Hashable, entity: Any) -> bool:
+        # Unknown after a failed save_many; writing it again is harmless
+        return False
+
+    def _accepted(self, keys: List[Hashable]) -> None:
+        # The backend has these keys' buffered entities now
+        self._forget(keys)
+
+    def _forget(self, keys: List[Hashable]) -> None:
+        for key in keys:
+            del self._pending[key]
+        if not self._pending:
+            self._oldest = None
+
+
+# id(backend) -> the versioned write-behind wrapper buffering its saves
+_VERSIONED_WRITERS: "weakref.WeakValueDictionary[int, _VersionedWriteBehind]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+class _VersionedWriteBehind(WriteBehindRepository, ABC):
+    """
+    Compare-and-swap against the buffered entity (or the backend's, for
+    a key not buffered yet), bumping the version on every save exactly
+    like the backend would. The backend only sees one write per flush,
+    so it is sent the version it holds (the base) and bumps that once.
+    Callers keep seeing the buffered numbering: entities read from the
+    backend are shifted by the saves it never saw (an offset kept per
+    key), so a copy read before a flush cannot pass for a current one
+    after it.
+
+    Those checks only hold if nothing else writes the backend between
+    flushes, so a backend shared between processes, or already wrapped
+    by another versioned write-behind repository, is refused. A save
+    that still conflicts at flush time (another writer got round the
+    wrapper) cannot be retried by its caller any more: it is dropped
+    and the ConcurrencyError raised, while the rest of the buffer is
+    written or kept.
+    """
+
+    def __init__(self, backend: Any, *args: Any, **kwargs: Any) -> None:
+        if getattr(backend, "shared_between_processes", False):
+            raise ValueError(
+                "Versioned repositories shared between processes cannot be "
+                "buffered: conflicts would only show at flush time."
+            )
+        if _VERSIONED_WRITERS.get(id(backend)) is not None:
+            raise ValueError("This repository already has a write-behind writer.")
+        super().__init__(backend, *args, **kwargs)
+        # key -> backend version the buffered entity is based on
+        self._base_versions: Dict[Hashable, int] = {}
+        # key -> version callers see minus the backend's version
+        self._offsets: Dict[Hashable, int] = {}
+        _VERSIONED_WRITERS[id(backend)] = self
+
+    def _save_versioned(self, key: Hashable, entity: Any, stored: Any) -> None:
+        version = next_version(stored, entity)
+        if key not in self._pending:
+            self._base_versions[key] = entity.version - self._offsets.get(key, 0)
+        self._buffer(key, replace(self._copy(entity), version=version))
+        entity.version = version
+
+    def _present(self, entity: Any) -> Any:
+        # A backend entity in the numbering callers see
+        if entity is None:
+            return None
+        offset = self._offsets.get(self._key_of(entity))
+        return replace(entity, version=entity.version + offset) if offset else entity
+
+    @_locked
+    def flush(self) -> None:
+        conflict: Optional[ConcurrencyError] = None
+        while True:
+            try:
+                super().flush()
+                break
+            except ConcurrencyError as exc:
+                stale = [key for key in self._pending if self._is_stale(key)]
+                if not stale:
+                    raise
+                # Drop what can never be written and write the rest, so
+                # one stale key does not hold back the whole buffer
+                self._forget(stale)
+                conflict = exc
+        if conflict is not None:
+            raise conflict
+
+    def _is_stale(self, key: Hashable) -> bool:
+        stored = self._stored(key)
+        return stored is not None and stored.version != self._base_versions[key]
+
+    def _prepare(self, keys: List[Hashable]) -> List[Any]:
+        return [
+            replace(self._pending[key], version=self._base_versions[key]) for key in keys
+        ]
+
+    def _written(self, key: Hashable, entity: Any) -> bool:
+        # A successful save bumps the version of the entity it was given
+        return entity.version != self._base_versions[key]
+
+    def _accepted(self, keys: List[Hashable]) -> None:
+        for key in keys:
+            # the backend bumped the base once for all the buffered saves
+            offset = self._pending[key].version - (self._base_versions[key] + 1)
+            if offset:
+                self._offsets[key] = offset
+            else:
+                self._offsets.pop(key, None)
+        super()._accepted(keys)
+
+    def _forget(self, keys: List[Hashable]) -> None:
+        for key in keys:
+            del self._base_versions[key]
+        super()._forget(keys)
+
+    def _copy(self, entity: Any) -> Any:
+        return replace(entity)
+
+    @abstractmethod
+    def _stored(self, key: Hashable) -> Any:
+        """
+        The backend's current entity for `key` (None if it has none).
+        """
+        ...
+
+    @abstractmethod
+    def _key_of(self, entity: Any) -> Hashable:
+        ...
+
+
+class WriteBehindCharacterRepository(_VersionedWriteBehind, CharacterRepository):
+    @_locked
+    def get_for_user(self, user_id: str) -> Optional[Character]:
+        buffered = self._buffered(user_id)
+        if buffered is not None:
+            return self._copy(buffered)
+        return self._present(self.backend.get_for_user(user_id))
+
+    @_locked
+    def save(self, character: Character) -> None:
+        stored = self._pending.get(character.user_id)
+        if stored is None:
+            stored = self._present(self.backend.get_for_user(character.user_id))
+        self._save_versioned(character.user_id, character, stored)
+
+    @_locked
+    def list_top(self, limit: int) -> List[Character]:
+        self.flush()
+        return [self._present(c) for c in self.backend.list_top(limit)]
+
+    def _copy(self, character: Character) -> Character:
+        return replace(character, appearance=dict(character.appearance))
+
+    def _stored(self, user_id: Hashable) -> Optional[Character]:
+        return self.backend.get_for_user(user_id)
+
+    def _key_of(self, character: Character) -> Hashable:
+        return character.user_id
+
+
+class WriteBehindStreakRepository(_VersionedWriteBehind, StreakRepository):
+    @_locked
+    def get(self, user_id: str, habit_id: str) -> Optional[StreakState]:
+        buffered = self._buffered((user_id, habit_id))
+        if buffered is not None:
+            return replace(buffered)
+        return self._present(self.backend.get(user_id, habit_id))
+
+    @_locked
+    def list_completed_before(self, day: date) -> List[StreakState]:
+        self.flush()
+        return [self._present(s) for s in self.backend.list_completed_before(day)]
+
+    @_locked
+    def save(self, streak: StreakState) -> None:
+        key = (streak.user_id, streak.habit_id)
+        stored = self._pending.get(key)
+        if stored is None:
+            stored = self._present(self.backend.get(streak.user_id, streak.habit_id))
+        self._save_versioned(key, streak, stored)
+
+    def _stored(self, key: Hashable) -> Optional[StreakState]:
+        return self.backend.get(*key)
+
+    def _key_of(self, streak: StreakState) -> Hashable:
+        return (streak.user_id, streak.habit_id)
+
+
+class WriteBehindHabitLogRepository(WriteBehindRepository, HabitLogRepository):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (user_id, day) -> ids of buffered logs for that day
+        self._by_user_day: Dict[Tuple[str, date], Dict[str, None]] = {}
+
+    @_locked
+    def list_for_day(self, user_id: str, day: date) -> List[HabitLog]:
+        self.flush_if_due()
+        # Buffered versions win over what the backend still has
+        logs = [
+            self._pending.get(log.id, log)
+            for log in self.backend.list_for_day(user_id, day)
+        ]
+        seen = {log.id for log in logs}
+        logs = [log for log in logs if log.day == day]
+        for log_id in self._by_user_day.get((user_id, day), ()):
+            if log_id not in seen:
+                logs.append(self._pending[log_id])
+        return logs
+
+    @_locked
+    def list_range(self, user_id: str, start: date, end: date) -> List[HabitLog]:
+        self.flush()
+        return self.backend.list_range(user_id, start, end)
+
+    @_locked
+    def monthly_totals(self, user_id: str, start: date, end: date) -> List[HabitLogMonth]:
+        self.flush()
+        return self.backend.monthly_totals(user_id, start, end)
+
+    @_locked
+    def compact_before(self, cutoff: date) -> int:
+        self.flush()
+        return self.backend.compact_before(cutoff)
+
+    @_locked
+    def save(self, log: HabitLog) -> None:
+        previous = self._pending.get(log.id)
+        if previous is not None:
+            del self._by_user_day[(previous.user_id, previous.day)][log.id]
+        self._by_user_day.setdefault((log.user_id, log.day), {})[log.id] = None
+        self._buffer(log.id, log)
+
+    def _forget(self, keys: List[Hashable]) -> None:
+        for key in keys:
+            log = self._pending[key]
+            day_ids = self._by_user_day[(log.user_id, log.day)]
+            del day_ids[key]
+            if not day_ids:
+                del self._by_user_day[(log.user_id, log.day)]
+        super()._forget(keys)
+
+
+class WriteBehindDashboardRepository(WriteBehindRepository, DashboardRepository):
+    @_locked
+    def get(self, user_id: str) -> Optional[Dashboard]:
+        buffered = self._buffered(user_id)
+        if buffered is not None:
+            return self._copy(buffered)
+        return self.backend.get(user_id)
+
+    @_locked
+    def save(self, dashboard: Dashboard) -> None:
+        self._buffer(dashboard.user_id, dashboard)
+
+    @_locked
+    def update(self, user_id: str, change: Callable[[Dashboard], None]) -> None:
+        dashboard = self.get(user_id)
+        if dashboard is not None:
+            change(dashboard)
+            self._buffer(user_id, dashboard)
+
+    def _copy(self, dashboard: Dashboard) -> Dashboard:
+        return replace(dashboard, habits=dict(dashboard.habits))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import heapq
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from habit_hero.application.ports import TimerScheduler
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class BucketedTimerIndex(TimerScheduler):
+    """
+    Time-bucketed timer index for very many, mostly far-off timers
+    (e.g. one daily cue reminder per habit).
+
+    Timers are grouped into fixed-width buckets (one minute by default).
+    A min-heap holds the bucket numbers that have timers, so each tick
+    only pops the buckets that are due instead of walking every timer
+    or every empty bucket in between.
+
+    Keys remember their bucket, so schedule() is O(log buckets) and
+    cancel() is O(1). A bucket emptied by cancels is dropped lazily
+    when it reaches the top of the heap.
+    """
+
+    def __init__(self, resolution: timedelta = timedelta(minutes=1)) -> None:
+        if resolution <= timedelta(0):
+            raise ValueError("resolution must be positive.")
+        self._resolution_us = resolution // _ONE_MICROSECOND
+        self._buckets: Dict[int, Dict[str, None]] = {}
+        self._heap: List[int] = []
+        self._bucket_of: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._bucket_of)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._bucket_of
+
+    def schedule(self, key: str, due_at: datetime) -> None:
+        self.cancel(key)
+        # Round up so timers never fire early
+        elapsed_us = (due_at - _EPOCH) // _ONE_MICROSECOND
+        bucket_id = -(-elapsed_us // self._resolution_us)
+
+        bucket = self._buckets.get(bucket_id)
+        if bucket is None:
+            bucket = self._buckets[bucket_id] = {}
+            heapq.heappush(self._heap, bucket_id)
+        bucket[key] = None
+        self._bucket_of[key] = bucket_id
+
+    def cancel(self, key: str) -> bool:
+        bucket_id = self._bucket_of.pop(key, None)
+        if bucket_id is None:
+            return False
+        del self._buckets[bucket_id][key]
+        return True
+
+    def pop_due(self, now: datetime) -> List[str]:
+        current = ((now - _EPOCH) // _ONE_MICROSECOND) // self._resolution_us
+        due: List[str] = []
+        heap = self._heap
+        while heap and heap[0] <= current:
+            bucket = self._buckets.pop(heapq.heappop(heap))
+            for key in bucket:
+                del self._bucket_of[key]
+            due.extend(bucket)
+        return due
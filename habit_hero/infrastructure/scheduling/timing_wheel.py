@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from habit_hero.application.ports import TimerScheduler
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class HierarchicalTimingWheel(TimerScheduler):
+    """
+    Hierarchical timing wheel for large numbers of concurrent timers.
+
+    Time is cut into ticks. Level 0 has one slot per tick, each higher
+    level has slots that span a whole rotation of the level below. A timer
+    is placed on the lowest level whose current rotation contains its
+    deadline, and is cascaded down one level at a time as the wheel turns.
+    Timers too far out for the top level wait in an overflow slot.
+
+    schedule() and cancel() are O(1): every key remembers the slot dict
+    it sits in. pop_due() does constant work per tick plus the cost of
+    the timers that cascade or fire.
+    """
+
+    def __init__(
+        self,
+        start: datetime,
+        tick: timedelta = timedelta(seconds=1),
+        wheel_bits: int = 6,
+        levels: int = 4,
+    ) -> None:
+        if tick <= timedelta(0):
+            raise ValueError("tick must be positive.")
+        self._start = start
+        self._tick_us = tick // _ONE_MICROSECOND
+        self._bits = wheel_bits
+        self._mask = (1 << wheel_bits) - 1
+        self._levels = levels
+        # level -> slot -> {key: deadline_tick}
+        self._wheels: List[List[Dict[str, int]]] = [
+            [{} for _ in range(1 << wheel_bits)] for _ in range(levels)
+        ]
+        self._overflow: Dict[str, int] = {}
+        # timers whose deadline had already passed when they were placed
+        self._ready: Dict[str, int] = {}
+        # key -> the slot dict it currently lives in
+        self._where: Dict[str, Dict[str, int]] = {}
+        # every tick <= _current has been processed
+        self._current = 0
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._where
+
+    def schedule(self, key: str, due_at: datetime) -> None:
+        """
+        Schedule (or reschedule) `key` to fire at `due_at`.
+        Timers never fire early: the deadline is rounded up to a tick.
+        """
+        self.cancel(key)
+        elapsed_us = (due_at - self._start) // _ONE_MICROSECOND
+        self._place(key, -(-elapsed_us // self._tick_us))
+
+    def cancel(self, key: str) -> bool:
+        slot = self._where.pop(key, None)
+        if slot is None:
+            return False
+        del slot[key]
+        return True
+
+    def pop_due(self, now: datetime) -> List[str]:
+        """
+        Turn the wheel up to `now` and return every key that came due,
+        removing them from the wheel.
+        """
+        target = ((now - self._start) // _ONE_MICROSECOND) // self._tick_us
+        due: List[str] = []
+
+        while self._current < target:
+            if len(self._where) == len(self._ready):
+                # Nothing left on the wheels: no need to walk empty ticks
+                self._current = target
+                break
+            self._current += 1
+            self._cascade()
+            self._take(self._wheels[0][self._current & self._mask], due)
+
+        self._take(self._ready, due)
+        return due
+
+    def _place(self, key: str, deadline: int) -> None:
+        slot: Optional[Dict[str, int]] = None
+        if deadline <= self._current:
+            slot = self._ready
+        else:
+            for level in range(self._levels):
+                higher = self._bits * (level + 1)
+                if deadline >> higher == self._current >> higher:
+                    index = (deadline >> (self._bits * level)) & self._mask
+                    slot = self._wheels[level][index]
+                    break
+            if slot is None:
+                slot = self._overflow
+        slot[key] = deadline
+        self._where[key] = slot
+
+    def _cascade(self) -> None:
+        """
+        When a lower level completes a rotation, move the timers of the
+        next slot on the level above down to where they now belong.
+        """
+        current = self._current
+        if current & ((1 << (self._bits * self._levels)) - 1) == 0:
+            self._replace_all(self._overflow)
+        for level in range(self._levels - 1, 0, -1):
+            shift = self._bits * level
+            if current & ((1 << shift) - 1) == 0:
+                self._replace_all(self._wheels[level][(current >> shift) & self._mask])
+
+    def _replace_all(self, slot: Dict[str, int]) -> None:
+        if not slot:
+            return
+        entries = list(slot.items())
+        slot.clear()
+        for key, deadline in entries:
+            self._place(key, deadline)
+
+    def _take(self, slot: Dict[str, int], due: List[str]) -> None:
+        if not slot:
+            return
+        for key in slot:
+            del self._where[key]
+        due.extend(slot)
+        slot.clear()
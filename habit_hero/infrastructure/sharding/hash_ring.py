@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+from typing import Iterable, List
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """
+    Maps keys (user ids) to shards with consistent hashing.
+
+    Each shard owns `vnodes` points on the ring, which evens out the
+    load. When shards are added or removed only the keys whose nearest
+    point changed move, roughly 1/N of them.
+    """
+
+    def __init__(self, shard_ids: Iterable[int], vnodes: int = 128) -> None:
+        points = sorted(
+            (_hash(f"shard-{shard}#{v}"), shard)
+            for shard in shard_ids
+            for v in range(vnodes)
+        )
+        if not points:
+            raise ValueError("A hash ring needs at least one shard.")
+        self._hashes: List[int] = [h for h, _ in points]
+        self._shards: List[int] = [s for _, s in points]
+
+    def shard_for(self, key: str) -> int:
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._shards[index]
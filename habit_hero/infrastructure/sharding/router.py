@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import heapq
+import multiprocessing
+from dataclasses import replace
+from itertools import chain
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from habit_hero.container import Settings
+from habit_hero.domain.entities import Character
+from habit_hero.domain.services import leaderboard_key
+from habit_hero.infrastructure.ids import MAX_NODE_ID, SortableIdGenerator
+from habit_hero.infrastructure.persistence.user_data import UserData
+from habit_hero.infrastructure.sharding.hash_ring import ConsistentHashRing
+from habit_hero.infrastructure.sharding.worker import run_shard_worker
+
+
+class ShardRouter:
+    """
+    Front for a sharded runtime: users are spread over N worker
+    processes by a consistent hash of user_id, each worker owning the
+    in-memory repositories for its users.
+
+    Requests are routed by their `user_id` field over a pipe to the
+    owning worker. execute_many() sends each shard its whole batch
+    before waiting, so shards work in parallel. Cross-shard reads
+    (leaderboard) are broadcast and merged here.
+
+    The router mints ids as node settings.node_id and shard k as the
+    node after it plus k, so ids never collide between processes. Shard
+    k keeps its files under settings.data_dir/shard-k, so on-disk
+    backends (tiered) never share a store between shards.
+    """
+
+    def __init__(
+        self,
+        shards: int,
+        settings: Optional[Settings] = None,
+        vnodes: int = 128,
+    ) -> None:
+        if shards <= 0:
+            raise ValueError("A sharded runtime needs at least one shard.")
+        self._settings = settings or Settings.from_env()
+        self._ids = SortableIdGenerator(node_id=self._settings.node_id)
+        self._vnodes = vnodes
+        self._ctx = multiprocessing.get_context()
+        self._workers: Dict[int, tuple[BaseProcess, Connection]] = {}
+        for shard in range(shards):
+            self._start(shard)
+        self._ring = ConsistentHashRing(range(shards), vnodes)
+
+    def __enter__(self) -> "ShardRouter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    @property
+    def shards(self) -> int:
+        return len(self._workers)
+
+    def shard_for(self, user_id: str) -> int:
+        return self._ring.shard_for(user_id)
+
+    # --- dispatch -----------------------------------------------------
+
+    def execute(self, use_case: str, request: Any) -> Any:
+        return self.execute_many(use_case, [request])[0]
+
+    def execute_many(self, use_case: str, requests: Sequence[Any]) -> List[Any]:
+        """
+        Run a batch of requests for one use case, each on the shard of
+        its user. Results come back in request order; the first failure
+        is raised once every shard has answered.
+        """
+        routed = [self._assign_user_id(req) for req in requests]
+        groups: Dict[int, List[int]] = {}
+        for index, req in enumerate(routed):
+            groups.setdefault(self.shard_for(req.user_id), []).append(index)
+
+        for shard, indexes in groups.items():
+            self._send(shard, "execute", (use_case, [routed[i] for i in indexes]))
+
+        results: List[Any] = [None] * len(routed)
+        errors: List[Exception] = []
+        for shard, indexes in groups.items():
+            for index, (ok, value) in zip(indexes, self._receive(shard)):
+                if ok:
+                    results[index] = value
+                else:
+                    errors.append(value)
+        if errors:
+            raise errors[0]
+        return results
+
+    def broadcast(self, use_case: str, request: Any = None) -> List[Any]:
+        """
+        Run the same request on every shard (tick jobs, cross-shard reads).
+        """
+        for shard in self._workers:
+            self._send(shard, "execute", (use_case, [request]))
+        outcomes = [self._receive(shard)[0] for shard in self._workers]
+        for ok, value in outcomes:
+            if not ok:
+                raise value
+        return [value for _, value in outcomes]
+
+    def leaderboard(self, limit: int = 10) -> List[Character]:
+        from habit_hero.application.use_cases.get_leaderboard import (
+            GetLeaderboardRequest,
+        )
+
+        per_shard = self.broadcast("get_leaderboard", GetLeaderboardRequest(limit=limit))
+        return heapq.nlargest(limit, chain.from_iterable(per_shard), key=leaderboard_key)
+
+    # --- rebalancing --------------------------------------------------
+
+    def rebalance(self, shards: int) -> int:
+        """
+        Change the number of shards, moving only the users whose owner
+        changes on the new ring. Returns how many users moved.
+        """
+        if shards <= 0:
+            raise ValueError("A sharded runtime needs at least one shard.")
+        old_shards = list(self._workers)
+        for shard in range(shards):
+            if shard not in self._workers:
+                self._start(shard)
+        ring = ConsistentHashRing(range(shards), self._vnodes)
+
+        for shard in old_shards:
+            self._send(shard, "user_ids", None)
+        owned = {shard: self._receive(shard) for shard in old_shards}
+
+        incoming: Dict[int, List[UserData]] = {}
+        moved = 0
+        for shard, ids in owned.items():
+            leaving = [user_id for user_id in ids if ring.shard_for(user_id) != shard]
+            if not leaving:
+                continue
+            self._send(shard, "export", leaving)
+            for data in self._receive(shard):
+                incoming.setdefault(ring.shard_for(data.user_id), []).append(data)
+            moved += len(leaving)
+
+        for shard, exported in incoming.items():
+            self._send(shard, "import", exported)
+        for shard in incoming:
+            self._receive(shard)
+
+        for shard in old_shards:
+            if shard >= shards:
+                self._stop(shard)
+        self._ring = ring
+        return moved
+
+    def close(self) -> None:
+        for shard in list(self._workers):
+            self._stop(shard)
+
+    # --- plumbing -----------------------------------------------------
+
+    def _assign_user_id(self, request: Any) -> Any:
+        if not hasattr(request, "user_id"):
+            raise ValueError(
+                f"{type(request).__name__} has no user_id to route on; use broadcast()."
+            )
+        if request.user_id is None:
+            # e.g. CreateUserRequest: the id decides the shard, so mint it here
+            return replace(request, user_id=self._ids.new_id("user"))
+        return request
+
+    def _start(self, shard: int) -> None:
+        node_id = self._settings.node_id + 1 + shard
+        if node_id > MAX_NODE_ID:
+            raise ValueError("Not enough id node numbers for this many shards.")
+        settings = replace(
+            self._settings,
+            node_id=node_id,
+            data_dir=str(Path(self._settings.data_dir) / f"shard-{shard}"),
+        )
+        parent, child = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=run_shard_worker,
+            args=(child, settings),
+            name=f"habit-hero-shard-{shard}",
+            daemon=True,
+        )
+        process.start()
+        child.close()
+        self._workers[shard] = (process, parent)
+
+    def _stop(self, shard: int) -> None:
+        process, conn = self._workers.pop(shard)
+        conn.send(("stop", None))
+        conn.close()
+        process.join()
+
+    def _send(self, shard: int, op: str, payload: Any) -> None:
+        self._workers[shard][1].send((op, payload))
+
+    def _receive(self, shard: int) -> Any:
+        ok, value = self._workers[shard][1].recv()
+        if not ok:
+            raise value
+        return value
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Tuple
+
+from habit_hero.container import Container, Settings
+from habit_hero.domain.services import next_reminder_at
+from habit_hero.infrastructure.persistence.user_data import (
+    UserData,
+    export_user,
+    import_user,
+    user_ids,
+)
+
+# (succeeded, value or exception) for each request in a batch
+Outcome = Tuple[bool, Any]
+
+
+class ShardWorker:
+    """
+    Owns one shard: its own container and in-memory repositories for
+    the users hashed to it. Runs inside a worker process and answers
+    the router's messages one at a time.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        self.container = Container(settings)
+        self._handlers: Dict[str, Callable[[Any], Any]] = {
+            "execute": self._execute,
+            "user_ids": self._user_ids,
+            "export": self._export,
+            "import": self._import,
+        }
+
+    def handle(self, op: str, payload: Any) -> Any:
+        return self._handlers[op](payload)
+
+    def _execute(self, payload: Tuple[str, List[Any]]) -> List[Outcome]:
+        name, requests = payload
+        use_case = self.container.use_case(name)
+        outcomes: List[Outcome] = []
+        for request in requests:
+            # Tick-style use cases (reminders, focus timers) take no request
+            args = () if request is None else (request,)
+            try:
+                outcomes.append((True, use_case.execute(*args)))
+            except Exception as exc:  # reported back to the caller
+                outcomes.append((False, exc))
+        return outcomes
+
+    def _user_ids(self, _: Any) -> List[str]:
+        return sorted(user_ids(self.container.repositories()))
+
+    def _export(self, ids: List[str]) -> List[UserData]:
+        # Subscribers (achievements) may still owe these users a save
+        self.container.resolve("events").flush()
+        repositories = self.container.repositories()
+        exported = [export_user(repositories, user_id) for user_id in ids]
+        for data in exported:
+            self._disarm_timers(data)
+        return exported
+
+    def _import(self, exported: List[UserData]) -> None:
+        repositories = self.container.repositories()
+        for data in exported:
+            import_user(repositories, data)
+            self._arm_timers(data)
+
+    def _disarm_timers(self, data: UserData) -> None:
+        for session in data.entities.get("focus_sessions", []):
+            self.container.resolve("focus_timers").cancel(session.id)
+        for habit in data.entities.get("habits", []):
+            self.container.resolve("reminder_index").cancel(habit.id)
+
+    def _arm_timers(self, data: UserData) -> None:
+        now = self.container.resolve("clock").now()
+        for session in data.entities.get("focus_sessions", []):
+            if session.completed_at is None and session.cancelled_at is None:
+                self.container.resolve("focus_timers").schedule(
+                    session.id,
+                    session.started_at + timedelta(minutes=session.duration_minutes),
+                )
+        for habit in data.entities.get("habits", []):
+            next_fire = next_reminder_at(habit, now)
+            if next_fire is not None:
+                self.container.resolve("reminder_index").schedule(habit.id, next_fire)
+
+
+def run_shard_worker(conn: Connection, settings: Settings) -> None:
+    """
+    Process entry point: serve (op, payload) messages until "stop".
+    """
+    worker = ShardWorker(settings)
+    while True:
+        op, payload = conn.recv()
+        if op == "stop":
+            worker.container.close()
+            conn.close()
+            return
+        try:
+            conn.send((True, worker.handle(op, payload)))
+        except Exception as exc:
+            conn.send((False, exc))
@@ -2,35 +2,7 @@ from __future__ import annotations
 
 from datetime import date
 
-from habit_hero.application.use_cases.complete_habit import (
-    CompleteHabitUseCase,
-    CompleteHabitRequest,
-)
-from habit_hero.application.use_cases.create_user import (
-    CreateUserUseCase,
-    CreateUserRequest,
-)
-from habit_hero.application.use_cases.create_habit import (
-    CreateHabitUseCase,
-    CreateHabitRequest,
-)
-from habit_hero.application.use_cases.list_habits import (
-    ListHabitsUseCase,
-    ListHabitsRequest,
-)
-from habit_hero.infrastructure.persistence.in_memory_repositories import (
-    InMemoryUserRepository,
-    InMemoryCharacterRepository,
-    InMemoryHabitRepository,
-    InMemoryHabitLogRepository,
-    InMemoryStreakRepository,
-    InMemoryLifeForceRepository,
-)
-
-from habit_hero.application.use_cases.log_life_force import (
-    LogLifeForceUseCase,
-    LogLifeForceRequest,
-)
+from habit_hero.container import Container
 
 
 def run_demo() -> None:
@@ -40,22 +12,28 @@ def run_demo() -> None:
       2) Runs CompleteHabitUseCase once
       3) Prints the updated level, XP, and streak
     """
-
-    # 1. Set up in-memory "database" (repos)
-    user_repo = InMemoryUserRepository()
-    character_repo = InMemoryCharacterRepository()
-    habit_repo = InMemoryHabitRepository()
-    log_repo = InMemoryHabitLogRepository()
-    streak_repo = InMemoryStreakRepository()
-    life_force_repo = InMemoryLifeForceRepository()
-
+    # 1. Composition root: repos + use cases are built on first use
+    container = Container()
+    try:
+        _demo(container)
+    finally:
+        # Deliver queued events and write out buffered saves
+        container.close()
+
+
+def _demo(container: Container) -> None:
+    # Request objects are imported here so importing this module stays cheap
+    from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+    from habit_hero.application.use_cases.create_user import CreateUserRequest
+    from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+    from habit_hero.application.use_cases.list_habits import ListHabitsRequest
+    from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+
+    character_repo = container.repository("characters")
+    streak_repo = container.repository("streaks")
 
     # 2–3. Create a user and starting character via the use case
-    create_user = CreateUserUseCase(
-        users=user_repo,
-        characters=character_repo,
-    )
-    create_user_response = create_user.execute(
+    create_user_response = container.use_case("create_user").execute(
         CreateUserRequest(
             long_term_vision="Become the strongest, clearest version of myself.",
         )
@@ -63,15 +41,9 @@ def run_demo() -> None:
 
     user = create_user_response.user
     character = create_user_response.character
-    log_life_force = LogLifeForceUseCase(
-    life_force=life_force_repo,
-    characters=character_repo,
-)
-
 
     # 4. Create one habit via the use case
-    create_habit = CreateHabitUseCase(habits=habit_repo)
-    habit = create_habit.execute(
+    habit = container.use_case("create_habit").execute(
         CreateHabitRequest(
             user_id=user.id,
             name="Morning training",
@@ -83,14 +55,10 @@ def run_demo() -> None:
         )
     )
 
-    # 5. Wire up the use case
-    complete_habit = CompleteHabitUseCase(
-        habits=habit_repo,
-        logs=log_repo,
-        streaks=streak_repo,
-        characters=character_repo,
-    )
-    list_habits = ListHabitsUseCase(habits=habit_repo)
+    # 5. Look up the use cases we need
+    complete_habit = container.use_case("complete_habit")
+    log_life_force = container.use_case("log_life_force")
+    list_habits = container.use_case("list_habits")
 
     # 6. Execute the use case once (simulate completing the habit today)
     today = date.today()
@@ -110,10 +78,17 @@ def run_demo() -> None:
 )
 
 
-    # 7. List all habits for this user
-    habit_list = list_habits.execute(
-        ListHabitsRequest(user_id=user.id)
-    )
+    # 7. List all habits for this user, a page at a time
+    habit_list = []
+    cursor = None
+    while True:
+        page = list_habits.execute(
+            ListHabitsRequest(user_id=user.id, cursor=cursor, limit=20)
+        )
+        habit_list.extend(page.habits)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
 
     # 8. Read back the updated state
     updated_character = character_repo.get_for_user(user.id)
@@ -0,0 +1,180 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from datetime import date, timedelta
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.application.achievements import AchievementEngine
+from habit_hero.domain.achievements import (
+    ALIGNED_DAYS,
+    ALIGNED_WINDOW_DAYS,
+    COMPLETIONS,
+    LEVEL,
+    STREAK,
+    AchievementRule,
+)
+from habit_hero.domain.events import (
+    AchievementUnlocked,
+    HabitCompleted,
+    LevelUp,
+    LifeForceLogged,
+)
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryAchievementRepository,
+)
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.get_achievements import GetAchievementsRequest
+
+DAY = date(2025, 4, 1)
+
+
+class CountingRepository(InMemoryAchievementRepository):
+    def __init__(self, rules) -> None:
+        self.lookups = 0
+        super().__init__(rules)
+
+    def rules_between(self, metric, low, high):
+        self.lookups += 1
+        return super().rules_between(metric, low, high)
+
+
+def completed(user_id: str, streak: int, day: date = DAY) -> HabitCompleted:
+    return HabitCompleted(user_id, "habit-1", day, xp_earned=10, current_streak=streak)
+
+
+def test_rules_are_only_looked_up_when_a_threshold_is_crossed():
+    repo = CountingRepository(
+        [
+            AchievementRule("streak-3", "3-day streak", STREAK, 3),
+            AchievementRule("streak-5", "5-day streak", STREAK, 5),
+            AchievementRule("also-5", "High five", STREAK, 5),
+            AchievementRule("done-2", "Two done", COMPLETIONS, 2),
+        ]
+    )
+    engine = AchievementEngine(repo)
+
+    unlocked = []
+    for streak in range(1, 8):
+        unlocked += [e.rule_id for e in engine.handle([completed("u1", streak)])]
+
+    assert unlocked == ["done-2", "streak-3", "streak-5", "also-5"]
+    # one lookup per crossing, not one per event
+    assert repo.lookups == 3
+    progress = repo.get_progress("u1")
+    assert progress.values == {COMPLETIONS: 7, STREAK: 7}
+    assert progress.next_thresholds == {COMPLETIONS: None, STREAK: None}
+
+    # a jump over several thresholds unlocks them all in one go
+    assert [e.rule_id for e in engine.handle([completed("u2", 6)])] == [
+        "streak-3",
+        "streak-5",
+        "also-5",
+    ]
+
+
+def test_new_rules_apply_to_values_already_reached():
+    repo = InMemoryAchievementRepository([AchievementRule("level-10", "Level 10", LEVEL, 10)])
+    engine = AchievementEngine(repo)
+    engine.handle([LevelUp("u1", previous_level=3, level=4)])
+
+    repo.add_rule(AchievementRule("level-2", "Level 2", LEVEL, 2))
+    unlocked = engine.handle([LevelUp("u1", previous_level=4, level=5)])
+
+    assert unlocked == [AchievementUnlocked("u1", rule_id="level-2", name="Level 2")]
+    assert repo.get_progress("u1").next_thresholds[LEVEL] == 10
+    with pytest.raises(ValueError):
+        repo.add_rule(AchievementRule("bad", "Bad", "minutes", 1))
+
+
+def test_aligned_days_count_distinct_days():
+    repo = InMemoryAchievementRepository(
+        [AchievementRule("aligned-3", "3 aligned days", ALIGNED_DAYS, 3)]
+    )
+    engine = AchievementEngine(repo)
+
+    def logged(day: date, exercise: int, diet: int) -> LifeForceLogged:
+        return LifeForceLogged("u1", day, exercise, diet, xp_awarded=0)
+
+    # the same day logged twice, then re-logged as not aligned
+    batch = [logged(DAY, 3, 3), logged(DAY, 2, 2), logged(DAY + timedelta(days=1), 2, 3)]
+    batch.append(logged(DAY + timedelta(days=1), 1, 3))
+    assert engine.handle(batch) == []
+    assert repo.get_progress("u1").aligned_count == 1
+
+    unlocked = engine.handle([logged(DAY + timedelta(days=d), 2, 2) for d in (1, 2)])
+    assert [e.rule_id for e in unlocked] == ["aligned-3"]
+
+    # only the last ALIGNED_WINDOW_DAYS of day flags are kept
+    engine.handle([logged(DAY + timedelta(days=d), 2, 2) for d in range(3, 200)])
+    progress = repo.get_progress("u1")
+    assert progress.aligned_count == 200
+    assert len(progress.recent_days) == ALIGNED_WINDOW_DAYS + 1
+    engine.handle([logged(DAY + timedelta(days=199), 0, 0)])
+    assert repo.get_progress("u1").aligned_count == 199
+
+
+def test_use_cases_drive_achievements_through_the_event_bus():
+    container = Container(Settings())
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Meditate daily.")
+    ).user
+    habit = container.use_case("create_habit").execute(
+        CreateHabitRequest(
+            user_id=user.id,
+            name="Meditate",
+            cue="Wake up",
+            action="Meditate",
+            reward="Tea",
+            estimated_minutes=10,
+            base_xp=60,
+        )
+    )
+    complete = container.use_case("complete_habit")
+    for d in range(7):
+        complete.execute(CompleteHabitRequest(user.id, habit.id, DAY + timedelta(days=d)))
+    assert container.resolve("events").flush(timeout=5)
+
+    result = container.use_case("get_achievements").execute(GetAchievementsRequest(user.id))
+
+    assert [rule.id for rule in result.unlocked] == ["completions-1", "streak-7"]
+    assert result.values[STREAK] == 7 and result.values[COMPLETIONS] == 7
+    assert result.values[LEVEL] == 3 and result.next_thresholds[LEVEL] == 5
+    assert result.next_thresholds[STREAK] == 30
+    assert result.next_thresholds[ALIGNED_DAYS] == 7
+
+
+def test_unlocks_are_only_kept_once_published():
+    class Flaky:
+        def __init__(self):
+            self.fail = True
+            self.published = []
+
+        def publish(self, events):
+            if self.fail:
+                raise RuntimeError("Event bus is closed.")
+            self.published.extend(events)
+
+    repo = InMemoryAchievementRepository(
+        [AchievementRule("done-1", "First", COMPLETIONS, 1)]
+    )
+    events = Flaky()
+    engine = AchievementEngine(repo, events=events)
+
+    with pytest.raises(RuntimeError):
+        engine.handle([completed("u1", 1)])
+    progress = repo.get_progress("u1")
+    assert progress.values[COMPLETIONS] == 1 and progress.unlocked == {}
+
+    events.fail = False
+    engine.handle([completed("u1", 2)])
+    assert [e.rule_id for e in events.published] == ["done-1"]
+    assert list(repo.get_progress("u1").unlocked) == ["done-1"]
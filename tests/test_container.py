@@ -0,0 +1,110 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import subprocess
+import threading
+from datetime import date
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+
+
+def test_settings_read_backend_from_environment():
+    assert Settings.from_env({}).backend == "in_memory"
+    assert Settings.from_env({"HABIT_HERO_BACKEND": "other"}).backend == "other"
+
+
+def test_container_shares_repositories_between_use_cases():
+    container = Container(Settings())
+
+    created = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Be consistent.")
+    )
+    container.use_case("log_life_force").execute(
+        LogLifeForceRequest(
+            user_id=created.user.id,
+            day=date(2025, 1, 1),
+            exercise_score=2,
+            diet_score=2,
+        )
+    )
+
+    character = container.repository("characters").get_for_user(created.user.id)
+    assert character.xp == 20
+    assert container.use_case("create_user") is container.use_case("create_user")
+
+
+def test_container_builds_registered_components_lazily():
+    built = []
+
+    def make_clock():
+        built.append("clock")
+        return object()
+
+    class NeedsClock:
+        def __init__(self, clock):
+            self.clock = clock
+
+    container = Container(Settings())
+    container.register_component("clock", make_clock)
+    container.register_use_case("tick", NeedsClock, clock="clock")
+    assert built == []
+
+    use_case = container.use_case("tick")
+    assert built == ["clock"]
+    assert use_case.clock is container.resolve("clock")
+
+
+def test_container_rejects_unknown_backend():
+    container = Container(Settings(backend="nope"))
+    with pytest.raises(ValueError):
+        container.repository("users")
+
+
+def test_importing_container_does_not_import_use_cases():
+    code = (
+        "import sys, habit_hero.container, habit_hero.presentation.cli.cli_app;"
+        "print(any('use_cases' in m or 'persistence' in m for m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert out.stdout.strip() == "False"
+
+
+def test_close_delivers_queued_events_and_flushes_buffers():
+    container = Container(Settings(write_behind_max_pending=100))
+    bus = container.resolve("events")
+    release = threading.Event()
+    seen = []
+
+    def slow(events):
+        release.wait()
+        seen.extend(events)
+
+    bus.subscribe("slow", slow)
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Be consistent.")
+    ).user
+    characters = container.repository("characters")
+    assert characters.pending == 1
+    release.set()
+
+    container.close()
+    assert [type(e).__name__ for e in seen] == ["UserCreated"]
+    assert characters.pending == 0
+    assert characters.backend.get_for_user(user.id) is not None
+    with pytest.raises(RuntimeError):
+        bus.publish(seen)
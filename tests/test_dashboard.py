@@ -0,0 +1,138 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import threading
+from datetime import date
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.application.dashboards import record_habit
+from habit_hero.domain.entities import Dashboard, Habit
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.deactivate_habit import DeactivateHabitRequest
+from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+from habit_hero.application.use_cases.get_dashboard import GetDashboardRequest
+
+TODAY = date(2025, 3, 10)
+
+
+def create_habit(container: Container, user_id: str, name: str):
+    return container.use_case("create_habit").execute(
+        CreateHabitRequest(
+            user_id=user_id,
+            name=name,
+            cue="Morning",
+            action=name,
+            reward="Coffee",
+            estimated_minutes=20,
+        )
+    )
+
+
+def test_dashboard_is_kept_up_to_date_by_the_write_side():
+    container = Container(Settings())
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Get strong.")
+    ).user
+    stretch = create_habit(container, user.id, "Stretch")
+    lift = create_habit(container, user.id, "Lift")
+    walk = create_habit(container, user.id, "Walk")
+    old = create_habit(container, user.id, "Old habit")
+
+    complete = container.use_case("complete_habit")
+    complete.execute(CompleteHabitRequest(user.id, stretch.id, date(2025, 3, 9)))
+    complete.execute(CompleteHabitRequest(user.id, stretch.id, TODAY))
+    complete.execute(CompleteHabitRequest(user.id, lift.id, date(2025, 3, 9)))
+    complete.execute(CompleteHabitRequest(user.id, walk.id, date(2025, 3, 1)))
+    container.use_case("deactivate_habit").execute(DeactivateHabitRequest(user.id, old.id))
+    container.use_case("log_life_force").execute(
+        LogLifeForceRequest(user.id, TODAY, exercise_score=2, diet_score=3)
+    )
+    # a backfill for an older day does not hide today's check
+    container.use_case("log_life_force").execute(
+        LogLifeForceRequest(user.id, date(2025, 3, 8), exercise_score=1, diet_score=1)
+    )
+
+    # No write-side repository is needed to answer
+    dashboards = container.repository("dashboards")
+    result = container.use_case("get_dashboard").execute(
+        GetDashboardRequest(user_id=user.id, today=TODAY)
+    )
+
+    habits = {h.name: h for h in result.habits}
+    assert list(habits) == ["Stretch", "Lift", "Walk"]
+    assert habits["Stretch"].completed_today and habits["Stretch"].current_streak == 2
+    assert not habits["Lift"].completed_today and habits["Lift"].current_streak == 1
+    # lapsed but not yet reset by the rollover job
+    assert habits["Walk"].current_streak == 0 and habits["Walk"].longest_streak == 1
+
+    character = container.repository("characters").get_for_user(user.id)
+    assert result.character == character
+    assert result.life_force_today.day == TODAY
+    assert dashboards.get(user.id).life_force.exercise_score == 2
+
+
+def test_users_without_a_dashboard_get_one_composed_on_first_read():
+    container = Container(Settings())
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Read more.")
+    ).user
+    habit = create_habit(container, user.id, "Read")
+    container.use_case("complete_habit").execute(
+        CompleteHabitRequest(user.id, habit.id, TODAY)
+    )
+    # e.g. data written before the read model existed
+    container.repository("dashboards").pop_user(user.id)
+
+    result = container.use_case("get_dashboard").execute(
+        GetDashboardRequest(user_id=user.id, today=TODAY)
+    )
+
+    assert [(h.name, h.completed_today, h.current_streak) for h in result.habits] == [
+        ("Read", True, 1)
+    ]
+    assert result.character.xp == habit.base_xp
+    assert container.repository("dashboards").get(user.id) is not None
+
+
+@pytest.mark.parametrize("backend", ["in_memory", "tiered"])
+def test_concurrent_dashboard_updates_are_not_lost(backend, tmp_path):
+    container = Container(Settings(backend=backend, data_dir=str(tmp_path)))
+    dashboards = container.repository("dashboards")
+    dashboards.save(Dashboard(user_id="user-1"))
+
+    def add_habits(thread):
+        for i in range(200):
+            habit = Habit(
+                id=f"habit-{thread}-{i}",
+                user_id="user-1",
+                name="Walk",
+                cue="Morning",
+                action="Walk",
+                reward="Coffee",
+                estimated_minutes=10,
+                base_xp=5,
+            )
+            record_habit(dashboards, habit)
+
+    interval = sys.getswitchinterval()
+    # Switch threads as often as possible so the updates interleave
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=add_habits, args=(t,)) for t in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert len(dashboards.get("user-1").habits) == 800
@@ -0,0 +1,148 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import threading
+from datetime import date
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.domain.events import (
+    AchievementUnlocked,
+    HabitCompleted,
+    LevelUp,
+    LifeForceLogged,
+    StreakBroken,
+    UserCreated,
+)
+from habit_hero.infrastructure.events.batching_bus import BatchingEventBus, EventBusFull
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+from habit_hero.application.use_cases.expire_streaks import ExpireStreaksRequest
+
+
+def test_use_cases_publish_domain_events():
+    container = Container(Settings())
+    bus = container.resolve("events")
+    seen = []
+    bus.subscribe("recorder", seen.extend)
+
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Run a marathon.")
+    ).user
+    habit = container.use_case("create_habit").execute(
+        CreateHabitRequest(
+            user_id=user.id,
+            name="Run",
+            cue="Alarm",
+            action="Run 5k",
+            reward="Smoothie",
+            estimated_minutes=30,
+            base_xp=60,
+        )
+    )
+    complete = container.use_case("complete_habit")
+    complete.execute(CompleteHabitRequest(user.id, habit.id, date(2025, 1, 1)))
+    complete.execute(CompleteHabitRequest(user.id, habit.id, date(2025, 1, 2)))
+    # gap of two days: the 2-day streak is broken
+    complete.execute(CompleteHabitRequest(user.id, habit.id, date(2025, 1, 5)))
+    container.use_case("log_life_force").execute(
+        LogLifeForceRequest(user.id, date(2025, 1, 5), exercise_score=3, diet_score=1)
+    )
+    container.use_case("expire_streaks").execute(
+        ExpireStreaksRequest(today=date(2025, 1, 9))
+    )
+
+    assert bus.flush(timeout=5)
+    # the achievements subscriber publishes its unlocks on the same bus
+    unlocked = [e.rule_id for e in seen if isinstance(e, AchievementUnlocked)]
+    assert unlocked == ["completions-1"]
+    seen = [e for e in seen if not isinstance(e, AchievementUnlocked)]
+    assert [type(e) for e in seen] == [
+        UserCreated,
+        HabitCompleted,
+        HabitCompleted,
+        LevelUp,
+        StreakBroken,
+        HabitCompleted,
+        LifeForceLogged,
+        StreakBroken,
+    ]
+    assert seen[3] == LevelUp(user_id=user.id, previous_level=1, level=2)
+    assert seen[4].previous_streak == 2
+    assert seen[7].previous_streak == 1
+    assert seen[6].xp_awarded == 20
+
+
+def test_subscribers_get_batches_filtered_by_type_and_failures_are_isolated():
+    with BatchingEventBus(batch_size=2) as bus:
+        batches = []
+        bus.subscribe("users", batches.append, UserCreated)
+
+        def explode(events):
+            raise RuntimeError("boom")
+
+        bus.subscribe("broken", explode)
+        bus.publish([UserCreated("u1"), LevelUp("u1", 1, 2), UserCreated("u2")])
+        bus.publish([UserCreated("u3")])
+        assert bus.flush(timeout=5)
+
+        assert [e.user_id for batch in batches for e in batch] == ["u1", "u2", "u3"]
+        assert all(len(batch) <= 2 for batch in batches)
+        stats = bus.stats()
+        assert stats["users"].delivered == 3
+        assert stats["users"].lag == 0
+        assert stats["broken"].failures >= 1
+        assert isinstance(stats["broken"].last_error, RuntimeError)
+
+
+def test_publish_applies_backpressure_and_reports_lag():
+    release = threading.Event()
+    bus = BatchingEventBus(batch_size=1, max_pending=2, publish_timeout=0.05)
+    bus.subscribe("slow", lambda events: release.wait(5))
+
+    # one event in flight, two queued: the queue is full
+    bus.publish([UserCreated("u1")])
+    while bus.pending:
+        pass
+    bus.publish([UserCreated("u2"), UserCreated("u3")])
+    with pytest.raises(EventBusFull):
+        bus.publish([UserCreated("u4")])
+    assert bus.stats()["slow"].lag == 3
+
+    release.set()
+    assert bus.flush(timeout=5)
+    assert bus.stats()["slow"].lag == 0
+    bus.close()
+    with pytest.raises(RuntimeError):
+        bus.publish([UserCreated("u5")])
+
+
+def test_subscribers_can_publish_while_the_bus_is_full_or_closing():
+    release = threading.Event()
+    bus = BatchingEventBus(batch_size=1, max_pending=1, publish_timeout=0.05)
+    unlocked = []
+
+    def unlock(events):
+        release.wait(5)
+        # from the worker: neither the full queue nor close() may stop it
+        bus.publish([AchievementUnlocked(e.user_id, "first", "First") for e in events])
+        bus.publish([AchievementUnlocked(e.user_id, "second", "Second") for e in events])
+
+    bus.subscribe("engine", unlock, UserCreated)
+    bus.subscribe("unlocked", unlocked.extend, AchievementUnlocked)
+    bus.publish([UserCreated("u1")])
+    closing = threading.Thread(target=bus.close)
+    closing.start()
+    release.set()
+    closing.join(5)
+
+    assert [e.rule_id for e in unlocked] == ["first", "second"]
+    assert bus.stats()["engine"].failures == 0
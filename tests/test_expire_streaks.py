@@ -0,0 +1,90 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from dataclasses import replace
+from datetime import date
+
+from habit_hero.domain.entities import StreakState
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryStreakRepository,
+)
+from habit_hero.application.use_cases.expire_streaks import (
+    ExpireStreaksUseCase,
+    ExpireStreaksRequest,
+)
+
+
+def make_streak(habit_id: str, current: int, last: date) -> StreakState:
+    return StreakState(
+        habit_id=habit_id,
+        user_id="user-1",
+        current_streak=current,
+        longest_streak=max(current, 7),
+        last_completed_day=last,
+    )
+
+
+def test_expire_streaks_resets_only_streaks_before_yesterday():
+    repo = InMemoryStreakRepository()
+    today = date(2025, 1, 10)
+    repo.save(make_streak("habit-today", 3, date(2025, 1, 10)))
+    repo.save(make_streak("habit-yesterday", 4, date(2025, 1, 9)))
+    repo.save(make_streak("habit-lapsed", 5, date(2025, 1, 8)))
+    repo.save(make_streak("habit-old", 2, date(2024, 12, 1)))
+
+    result = ExpireStreaksUseCase(streaks=repo).execute(
+        ExpireStreaksRequest(today=today)
+    )
+
+    assert result.processed == 2
+    assert result.expired == 2
+    assert repo.get("user-1", "habit-today").current_streak == 3
+    assert repo.get("user-1", "habit-yesterday").current_streak == 4
+
+    lapsed = repo.get("user-1", "habit-lapsed")
+    assert lapsed.current_streak == 0
+    # history is kept
+    assert lapsed.longest_streak == 7
+    assert lapsed.last_completed_day == date(2025, 1, 8)
+
+
+def test_expired_streaks_leave_the_day_index():
+    repo = InMemoryStreakRepository()
+    use_case = ExpireStreaksUseCase(streaks=repo)
+    repo.save(make_streak("habit-1", 5, date(2025, 1, 1)))
+
+    first = use_case.execute(ExpireStreaksRequest(today=date(2025, 1, 5)))
+    second = use_case.execute(ExpireStreaksRequest(today=date(2025, 1, 6)))
+
+    assert first.expired == 1
+    # already-expired streaks are not visited again
+    assert second.processed == 0
+
+
+def test_completing_again_moves_streak_to_new_bucket():
+    repo = InMemoryStreakRepository()
+    first = make_streak("habit-1", 1, date(2025, 1, 1))
+    repo.save(first)
+    repo.save(replace(first, current_streak=2, last_completed_day=date(2025, 1, 2)))
+
+    assert repo.list_completed_before(date(2025, 1, 2)) == []
+    assert len(repo.list_completed_before(date(2025, 1, 3))) == 1
+
+
+def test_expire_streaks_across_several_expired_days():
+    repo = InMemoryStreakRepository()
+    for i in range(40):
+        repo.save(make_streak(f"habit-{i}", i + 1, date(2025, 1, 1 + i % 5)))
+
+    use_case = ExpireStreaksUseCase(streaks=repo)
+    result = use_case.execute(ExpireStreaksRequest(today=date(2025, 1, 6)))
+
+    # days 1..4 have expired (day 5 is "yesterday")
+    assert result.expired == 32
+    assert result.streaks_per_second > 0
+    assert repo.list_completed_before(date(2025, 1, 5)) == []
@@ -0,0 +1,126 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from habit_hero.domain.entities import Character
+from habit_hero.infrastructure.clock import ManualClock
+from habit_hero.infrastructure.scheduling.timing_wheel import HierarchicalTimingWheel
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryCharacterRepository,
+    InMemoryFocusSessionRepository,
+)
+from habit_hero.application.use_cases.start_focus_session import (
+    StartFocusSessionUseCase,
+    StartFocusSessionRequest,
+)
+from habit_hero.application.use_cases.complete_focus_session import (
+    CompleteFocusSessionUseCase,
+    CompleteFocusSessionRequest,
+)
+from habit_hero.application.use_cases.cancel_focus_session import (
+    CancelFocusSessionUseCase,
+    CancelFocusSessionRequest,
+)
+from habit_hero.application.use_cases.expire_focus_sessions import (
+    ExpireFocusSessionsUseCase,
+)
+
+START = datetime(2025, 1, 1, 8, 0, 0)
+
+
+def test_timing_wheel_fires_each_timer_once_and_never_early():
+    wheel = HierarchicalTimingWheel(start=START, wheel_bits=3, levels=2)
+    rng = random.Random(7)
+    # spread deadlines well past the top level so overflow cascades too
+    deadlines = {f"t{i}": rng.randint(1, 400) for i in range(300)}
+    for key, seconds in deadlines.items():
+        wheel.schedule(key, START + timedelta(seconds=seconds))
+
+    fired = {}
+    for second in range(0, 401):
+        for key in wheel.pop_due(START + timedelta(seconds=second)):
+            fired[key] = second
+
+    assert fired == deadlines
+    assert len(wheel) == 0
+
+
+def test_timing_wheel_cancel_and_reschedule():
+    wheel = HierarchicalTimingWheel(start=START)
+    wheel.schedule("a", START + timedelta(seconds=5))
+    wheel.schedule("b", START + timedelta(seconds=5))
+    wheel.schedule("b", START + timedelta(seconds=90))
+
+    assert wheel.cancel("a") is True
+    assert wheel.cancel("a") is False
+    assert wheel.pop_due(START + timedelta(seconds=60)) == []
+    assert wheel.pop_due(START + timedelta(seconds=90)) == ["b"]
+
+
+def make_use_cases():
+    clock = ManualClock(START)
+    sessions = InMemoryFocusSessionRepository()
+    characters = InMemoryCharacterRepository()
+    timers = HierarchicalTimingWheel(start=START)
+    characters.save(Character(user_id="user-1"))
+    return (
+        clock,
+        sessions,
+        characters,
+        StartFocusSessionUseCase(sessions=sessions, timers=timers, clock=clock),
+        CompleteFocusSessionUseCase(
+            sessions=sessions, characters=characters, timers=timers, clock=clock
+        ),
+        CancelFocusSessionUseCase(sessions=sessions, timers=timers, clock=clock),
+        ExpireFocusSessionsUseCase(
+            sessions=sessions, characters=characters, timers=timers, clock=clock
+        ),
+    )
+
+
+def test_expiry_tick_completes_due_sessions_and_batches_xp():
+    clock, sessions, characters, start, _, cancel, expire = make_use_cases()
+    first = start.execute(StartFocusSessionRequest(user_id="user-1", duration_minutes=25))
+    second = start.execute(StartFocusSessionRequest(user_id="user-1", duration_minutes=50))
+    cancelled = start.execute(StartFocusSessionRequest(user_id="user-1", duration_minutes=25))
+    cancel.execute(CancelFocusSessionRequest(user_id="user-1", session_id=cancelled.id))
+
+    clock.advance(timedelta(minutes=24))
+    assert expire.execute().completed == []
+
+    clock.advance(timedelta(minutes=30))
+    result = expire.execute()
+
+    assert [s.id for s in result.completed] == [first.id, second.id]
+    assert result.xp_by_user == {"user-1": 75}
+    assert characters.get_for_user("user-1").xp == 75
+    assert sessions.get(first.id).completed_at == START + timedelta(minutes=25)
+    assert sessions.get(cancelled.id).xp_earned == 0
+
+
+def test_complete_requires_finished_timer_and_disarms_it():
+    clock, _, characters, start, complete, _, expire = make_use_cases()
+    session = start.execute(StartFocusSessionRequest(user_id="user-1", duration_minutes=30))
+    req = CompleteFocusSessionRequest(user_id="user-1", session_id=session.id)
+
+    with pytest.raises(ValueError):
+        complete.execute(req)
+
+    clock.advance(timedelta(minutes=30))
+    result = complete.execute(req)
+
+    assert result.session.xp_earned == 30
+    assert result.character.xp == 30
+    # the timer no longer fires, so XP is not granted twice
+    assert expire.execute().completed == []
+    with pytest.raises(ValueError):
+        complete.execute(req)
@@ -0,0 +1,233 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.domain.entities import Character, Habit, StreakState
+from habit_hero.domain.forecasting import (
+    HabitPace,
+    ProgressionForecaster,
+    UserPace,
+    forecast_user_scalar,
+)
+from habit_hero.domain.xp_rules import XpRuleDefinition
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryHabitLogRepository,
+)
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.forecast_progression import (
+    ForecastProgressionRequest,
+)
+
+START = date(2025, 3, 1)
+STEEP = XpRuleDefinition(
+    name="steep",
+    streak_step_days=3,
+    streak_step_bonus=0.25,
+    streak_bonus_cap=1.0,
+    bad_habit_multiplier=1.5,
+    max_habit_xp=60,
+)
+
+
+def random_users(count: int, seed: int) -> list[UserPace]:
+    rng = random.Random(seed)
+    users = []
+    for u in range(count):
+        character = Character(
+            user_id=f"user-{u}",
+            level=rng.randint(1, 4),
+            xp=rng.randint(0, 90),
+            xp_to_next_level=100,
+        )
+        habits = []
+        for h in range(rng.randint(0, 4)):
+            habit = Habit(
+                id=f"habit-{u}-{h}",
+                user_id=character.user_id,
+                name="Habit",
+                cue="Cue",
+                action="Action",
+                reward="Reward",
+                estimated_minutes=10,
+                base_xp=rng.randint(5, 40),
+                is_bad_habit=rng.random() < 0.3,
+                active=rng.random() < 0.9,
+            )
+            streak = None
+            if rng.random() < 0.6:
+                streak = StreakState(
+                    habit_id=habit.id,
+                    user_id=character.user_id,
+                    current_streak=rng.randint(1, 30),
+                    longest_streak=30,
+                    # yesterday's streak carries on, older ones reset
+                    last_completed_day=START - timedelta(days=rng.randint(0, 2)),
+                )
+            rate = rng.choice([0.0, 1.0, 0.5, 0.3, rng.random()])
+            habits.append(HabitPace(habit, rate, streak))
+        users.append(UserPace(character, habits))
+    return users
+
+
+@pytest.mark.parametrize("rules", [None, STEEP])
+def test_deterministic_forecast_matches_the_scalar_domain_functions(rules):
+    users = random_users(150, seed=11)
+
+    forecasts = ProgressionForecaster(rules).forecast(users, START, days=60)
+
+    for pace, forecast in zip(users, forecasts):
+        expected = forecast_user_scalar(pace, START, 60, rules)
+        assert (forecast.level, forecast.xp) == (expected.level, expected.xp)
+        assert forecast.level_p10 == forecast.level == forecast.level_p90
+        # the input characters are left alone
+        assert pace.character.level <= forecast.level
+
+
+def test_target_date_is_the_first_day_the_level_is_reached():
+    habit = Habit("h", "u", "Run", "Cue", "Run", "Rest", 30, base_xp=25)
+    pace = UserPace(Character(user_id="u"), [HabitPace(habit, 1.0)])
+
+    # 25 XP a day (no streak bonus before day 5): level 2 needs 100 XP
+    [forecast] = ProgressionForecaster().forecast([pace], START, days=10)
+    assert forecast.target_level == 2
+    assert forecast.target_date == START + timedelta(days=4)
+    assert forecast.reach_probability == 1.0
+
+    [never] = ProgressionForecaster().forecast([pace], START, days=10, target_levels=[9])
+    assert never.target_date is None and never.reach_probability == 0.0
+
+
+def test_monte_carlo_is_seeded_and_brackets_the_expected_pace():
+    users = random_users(40, seed=5)
+    forecaster = ProgressionForecaster()
+
+    first = forecaster.forecast(users, START, days=45, runs=200, seed=3)
+    again = forecaster.forecast(users, START, days=45, runs=200, seed=3)
+    assert first == again
+
+    for forecast in first:
+        assert forecast.level_p10 <= forecast.level <= forecast.level_p90
+        assert 0.0 <= forecast.reach_probability <= 1.0
+        if forecast.target_date is not None:
+            assert forecast.reach_probability >= 0.5
+
+    # always-on / never habits have no randomness at all
+    certain = [
+        UserPace(u.character, [h for h in u.habits if h.completion_rate in (0.0, 1.0)])
+        for u in users
+    ]
+    deterministic = forecaster.forecast(certain, START, days=45)
+    sampled = forecaster.forecast(certain, START, days=45, runs=20, seed=1)
+    assert [(f.level, f.xp) for f in sampled] == [(f.level, f.xp) for f in deterministic]
+
+
+def test_use_case_forecasts_from_recent_logs_and_cohort_rules():
+    container = Container(Settings())
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Run a marathon.")
+    ).user
+    habit = container.use_case("create_habit").execute(
+        CreateHabitRequest(
+            user_id=user.id,
+            name="Run",
+            cue="Morning",
+            action="Run",
+            reward="Coffee",
+            estimated_minutes=30,
+        )
+    )
+    today = date(2025, 3, 28)
+    complete = container.use_case("complete_habit")
+    # three weeks out of the four-week window, ending today
+    for back in range(21):
+        complete.execute(CompleteHabitRequest(user.id, habit.id, today - timedelta(days=back)))
+
+    forecast_progression = container.use_case("forecast_progression")
+    req = ForecastProgressionRequest(user_ids=[user.id], today=today, days=30)
+    forecast = forecast_progression.execute(req)[user.id]
+
+    characters = container.repository("characters")
+    pace = UserPace(
+        characters.get_for_user(user.id),
+        [HabitPace(habit, 0.75, container.repository("streaks").get(user.id, habit.id))],
+    )
+    expected = forecast_user_scalar(pace, today, 30)
+    assert (forecast.level, forecast.xp) == (expected.level, expected.xp)
+
+    # users in a cohort are forecast under that cohort's curve
+    xp_rules = container.resolve("xp_rules")
+    xp_rules.register(STEEP)
+    xp_rules.set_cohort("steep", "steep")
+    xp_rules.assign_user(user.id, "steep")
+    steep = forecast_progression.execute(req)[user.id]
+    assert (steep.level, steep.xp) != (forecast.level, forecast.xp)
+    expected = forecast_user_scalar(pace, today, 30, STEEP)
+    assert (steep.level, steep.xp) == (expected.level, expected.xp)
+
+
+class CountingLogRepository(InMemoryHabitLogRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def list_for_day(self, user_id, day):
+        self.calls += 1
+        return super().list_for_day(user_id, day)
+
+    def list_range(self, user_id, start, end):
+        self.calls += 1
+        return super().list_range(user_id, start, end)
+
+
+def test_use_case_reads_each_users_window_in_one_query():
+    container = Container(Settings())
+    logs = CountingLogRepository()
+    container.override("logs", logs)
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Read more.")
+    ).user
+    habit = container.use_case("create_habit").execute(
+        CreateHabitRequest(
+            user_id=user.id,
+            name="Read",
+            cue="Evening",
+            action="Read",
+            reward="Tea",
+            estimated_minutes=20,
+        )
+    )
+    today = date(2025, 3, 28)
+    complete = container.use_case("complete_habit")
+    # the first and last day of the four-week window, and the day before it
+    for back in (0, 27, 28):
+        complete.execute(CompleteHabitRequest(user.id, habit.id, today - timedelta(days=back)))
+
+    logs.calls = 0
+    forecast = container.use_case("forecast_progression").execute(
+        ForecastProgressionRequest(user_ids=[user.id], today=today, days=30)
+    )[user.id]
+
+    assert logs.calls == 1
+    pace = UserPace(
+        container.repository("characters").get_for_user(user.id),
+        [HabitPace(habit, 2 / 28, container.repository("streaks").get(user.id, habit.id))],
+    )
+    expected = forecast_user_scalar(pace, today, 30)
+    assert (forecast.level, forecast.xp) == (expected.level, expected.xp)
+
+
+def test_negative_horizons_are_rejected():
+    with pytest.raises(ValueError):
+        ProgressionForecaster().forecast([], START, days=-1)
@@ -0,0 +1,86 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import pytest
+
+from habit_hero.application.ids import UuidIdGenerator
+from habit_hero.container import Container, Settings
+from habit_hero.domain.entities import FocusSession
+from habit_hero.infrastructure.ids import (
+    EPOCH_MS,
+    SortableIdGenerator,
+    compact_key,
+    decode_id,
+)
+from habit_hero.infrastructure.persistence.tiered_repositories import SqliteColdStore
+from habit_hero.infrastructure.persistence.user_data import UserData
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+
+
+class SteppedClock:
+    def __init__(self, *readings: int) -> None:
+        self.readings = list(readings)
+
+    def __call__(self) -> int:
+        # the last reading repeats forever
+        reading = self.readings.pop(0) if len(self.readings) > 1 else self.readings[0]
+        return EPOCH_MS + reading
+
+
+def test_sortable_ids_order_by_time_as_strings_and_integers():
+    # same millisecond twice, then the clock steps back
+    generator = SortableIdGenerator(node_id=3, clock_ms=SteppedClock(5, 5, 9, 2, 10))
+    ids = [generator.new_id("habit") for _ in range(5)]
+
+    assert ids == sorted(ids)
+    assert [decode_id(i) for i in ids] == sorted(decode_id(i) for i in ids)
+    assert len(set(ids)) == 5
+    assert all(i.startswith("habit-") and len(i) == len("habit-") + 13 for i in ids)
+    # node id sits above the 12 sequence bits
+    assert (decode_id(ids[0]) >> 12) & 0x3FF == 3
+
+
+def test_sequence_overflow_borrows_the_next_millisecond():
+    generator = SortableIdGenerator(clock_ms=SteppedClock(0))
+    values = [generator.new_int() for _ in range(4097)]
+
+    assert values == sorted(set(values))
+    assert values[-1] >> 22 == 1
+
+
+def test_compact_keys_are_ints_only_for_sortable_ids():
+    generator = SortableIdGenerator()
+    sortable = generator.new_id("user")
+    legacy = UuidIdGenerator().new_id("user")
+
+    assert compact_key(sortable) == decode_id(sortable)
+    assert compact_key(legacy) == legacy
+    assert compact_key("log-habit-1-2025-01-01") == "log-habit-1-2025-01-01"
+    with pytest.raises(ValueError):
+        decode_id(legacy)
+
+    # the cold store's owner table takes both kinds of key
+    store = SqliteColdStore(":memory:")
+    sessions = [
+        FocusSession(id=session_id, user_id=sortable, duration_minutes=25, started_at=None)
+        for session_id in (generator.new_id("focus"), UuidIdGenerator().new_id("focus"))
+    ]
+    store.put(UserData(user_id=sortable, entities={"focus_sessions": sessions}))
+    assert [store.owner("focus_sessions", s.id) for s in sessions] == [sortable] * 2
+    assert store.owner("focus_sessions", generator.new_id("focus")) is None
+
+
+def test_container_mints_sortable_ids_per_node():
+    with pytest.raises(ValueError):
+        SortableIdGenerator(node_id=1024)
+
+    container = Container(Settings(node_id=7))
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Sleep more.")
+    ).user
+    assert (decode_id(user.id) >> 12) & 0x3FF == 7
@@ -0,0 +1,89 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import random
+from datetime import date, timedelta
+
+from habit_hero.domain.entities import LifeForceCheck
+from habit_hero.domain.services import is_aligned_day
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryLifeForceRepository,
+)
+from habit_hero.application.use_cases.get_life_force_trends import (
+    GetLifeForceTrendsUseCase,
+    GetLifeForceTrendsRequest,
+)
+
+DAY_0 = date(2025, 1, 1)
+
+
+def check(user_id: str, offset: int, exercise: int, diet: int) -> LifeForceCheck:
+    return LifeForceCheck(
+        id=f"lf-{user_id}-{offset}",
+        user_id=user_id,
+        day=DAY_0 + timedelta(days=offset),
+        exercise_score=exercise,
+        diet_score=diet,
+    )
+
+
+def test_trend_matches_brute_force_with_gaps_overwrites_and_backfill():
+    repo = InMemoryLifeForceRepository()
+    rng = random.Random(3)
+    latest = {}
+    # offsets in random order: out-of-order saves, backfills before the
+    # first day, and overwrites of an existing day
+    for _ in range(200):
+        offset = rng.randint(-20, 60)
+        c = check("user-1", offset, rng.randint(0, 3), rng.randint(0, 3))
+        repo.save(c)
+        latest[offset] = c
+
+    for _ in range(100):
+        lo = rng.randint(-30, 70)
+        hi = rng.randint(lo, 80)
+        start, end = DAY_0 + timedelta(days=lo), DAY_0 + timedelta(days=hi)
+        expected = [c for o, c in latest.items() if lo <= o <= hi]
+
+        trend = repo.trend("user-1", start, end)
+        assert trend.days_logged == len(expected)
+        assert trend.exercise_total == sum(c.exercise_score for c in expected)
+        assert trend.diet_total == sum(c.diet_score for c in expected)
+        assert trend.aligned_days == sum(is_aligned_day(c) for c in expected)
+        assert repo.list_range("user-1", start, end) == sorted(expected, key=lambda c: c.day)
+
+
+def test_get_for_day_still_works_and_unknown_users_are_empty():
+    repo = InMemoryLifeForceRepository()
+    repo.save(check("user-1", 0, 3, 2))
+    repo.save(check("user-1", 0, 1, 1))
+
+    assert repo.get_for_day("user-1", DAY_0).exercise_score == 1
+    assert repo.get_for_day("user-1", DAY_0 + timedelta(days=1)) is None
+    assert repo.trend("nobody", DAY_0, DAY_0).days_logged == 0
+
+
+def test_trends_use_case_returns_window_for_many_users():
+    repo = InMemoryLifeForceRepository()
+    for offset in range(10):
+        repo.save(check("user-1", offset, 3, 3))
+        repo.save(check("user-2", offset, 1, 2))
+
+    trends = GetLifeForceTrendsUseCase(life_force=repo).execute(
+        GetLifeForceTrendsRequest(
+            user_ids=["user-1", "user-2"],
+            end=DAY_0 + timedelta(days=9),
+            window_days=7,
+        )
+    )
+
+    assert trends["user-1"].days_logged == 7
+    assert trends["user-1"].aligned_days == 7
+    assert trends["user-1"].exercise_average == 3.0
+    assert trends["user-2"].aligned_days == 0
+    assert trends["user-2"].diet_total == 14
@@ -0,0 +1,100 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import pytest
+
+from habit_hero.domain.entities import Habit
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryHabitRepository,
+)
+from habit_hero.application.use_cases.list_habits import (
+    ListHabitsUseCase,
+    ListHabitsRequest,
+)
+
+
+def make_habit(i: int, user_id: str = "user-1", **kwargs) -> Habit:
+    return Habit(
+        id=f"habit-{i:03d}",
+        user_id=user_id,
+        name=f"Habit {i}",
+        cue="Cue",
+        action="Action",
+        reward="Reward",
+        estimated_minutes=5,
+        base_xp=10,
+        **kwargs,
+    )
+
+
+def all_pages(use_case: ListHabitsUseCase, **filters) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        result = use_case.execute(
+            ListHabitsRequest(user_id="user-1", cursor=cursor, **filters)
+        )
+        pages.append([h.id for h in result.habits])
+        cursor = result.next_cursor
+        if cursor is None:
+            return pages
+
+
+def test_pages_follow_creation_order_and_end_with_no_cursor():
+    repo = InMemoryHabitRepository()
+    for i in range(7):
+        repo.save(make_habit(i))
+    repo.save(make_habit(99, user_id="user-2"))
+
+    pages = all_pages(ListHabitsUseCase(repo), limit=3)
+
+    assert pages == [
+        ["habit-000", "habit-001", "habit-002"],
+        ["habit-003", "habit-004", "habit-005"],
+        ["habit-006"],
+    ]
+
+
+def test_filters_use_the_indexes_and_track_changes():
+    repo = InMemoryHabitRepository()
+    for i in range(10):
+        repo.save(
+            make_habit(
+                i,
+                is_bad_habit=i % 2 == 1,
+                replaces_habit_id="habit-001" if i in (4, 8) else None,
+            )
+        )
+    use_case = ListHabitsUseCase(repo)
+
+    # deactivated in place, as DeactivateHabitUseCase does
+    habit = repo.get("habit-002")
+    habit.active = False
+    repo.save(habit)
+
+    active = sum(all_pages(use_case, limit=4), [])
+    assert "habit-002" not in active and len(active) == 9
+    assert sum(all_pages(use_case, active=False), []) == ["habit-002"]
+    assert sum(all_pages(use_case, active=None, is_bad_habit=True, limit=2), []) == [
+        "habit-001", "habit-003", "habit-005", "habit-007", "habit-009",
+    ]
+    assert sum(all_pages(use_case, replaces_habit_id="habit-001"), []) == [
+        "habit-004", "habit-008",
+    ]
+    assert [h.id for h in repo.list_for_user("user-1")] == active
+
+
+def test_cursor_must_belong_to_the_user():
+    repo = InMemoryHabitRepository()
+    repo.save(make_habit(1))
+    repo.save(make_habit(2, user_id="user-2"))
+    use_case = ListHabitsUseCase(repo)
+
+    with pytest.raises(ValueError):
+        use_case.execute(ListHabitsRequest(user_id="user-1", cursor="habit-002"))
+    with pytest.raises(ValueError):
+        use_case.execute(ListHabitsRequest(user_id="user-1", limit=0))
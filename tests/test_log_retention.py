@@ -0,0 +1,164 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from datetime import date, timedelta
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.compact_habit_logs import CompactHabitLogsRequest
+
+START = date(2024, 1, 1)
+TODAY = date(2025, 3, 15)
+ALL_TIME = (date(2000, 1, 1), date(2100, 1, 1))
+
+
+def seed_user(container: Container) -> tuple[str, list[str]]:
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Keep going.")
+    ).user
+    habit_ids = [
+        container.use_case("create_habit").execute(
+            CreateHabitRequest(
+                user_id=user.id,
+                name=name,
+                cue="Cue",
+                action=name,
+                reward="Reward",
+                estimated_minutes=10,
+            )
+        ).id
+        for name in ("Read", "Run")
+    ]
+    complete = container.use_case("complete_habit")
+    day = START
+    while day <= TODAY:
+        complete.execute(CompleteHabitRequest(user.id, habit_ids[0], day))
+        if day.toordinal() % 3 == 0:
+            complete.execute(CompleteHabitRequest(user.id, habit_ids[1], day))
+        day += timedelta(days=1)
+    return user.id, habit_ids
+
+
+def totals(logs, user_id: str) -> list[tuple]:
+    return [
+        (m.habit_id, m.month, m.completions, m.xp_total, m.first_day, m.last_day)
+        for m in logs.monthly_totals(user_id, *ALL_TIME)
+    ]
+
+
+def test_old_logs_become_monthly_totals_without_changing_any_total():
+    container = Container(Settings())
+    user_id, (read, run) = seed_user(container)
+    logs = container.repository("logs")
+    before = totals(logs, user_id)
+    character = container.repository("characters").get_for_user(user_id)
+    streak = container.repository("streaks").get(user_id, read)
+
+    result = container.use_case("compact_habit_logs").execute(
+        CompactHabitLogsRequest(today=TODAY, retention_days=365)
+    )
+
+    # 2025-03-15 minus a year is 2024-03-15: January and February 2024 go
+    assert result.cutoff == date(2024, 3, 1)
+    assert result.logs_compacted == 60 + len(
+        [d for d in range(60) if (START + timedelta(days=d)).toordinal() % 3 == 0]
+    )
+    assert totals(logs, user_id) == before
+    assert logs.list_range(user_id, *ALL_TIME)[0].day == date(2024, 3, 1)
+    assert logs.list_for_day(user_id, date(2024, 2, 10)) == []
+    assert container.repository("characters").get_for_user(user_id) == character
+    assert container.repository("streaks").get(user_id, read) == streak
+
+    # a compacted month counts whole when the range touches it
+    [read_feb] = [
+        m for m in logs.monthly_totals(user_id, date(2024, 2, 20), date(2024, 2, 20))
+        if m.habit_id == read
+    ]
+    assert (read_feb.completions, read_feb.first_day) == (29, date(2024, 2, 1))
+
+    # a second run has nothing left to do
+    again = container.use_case("compact_habit_logs").execute(
+        CompactHabitLogsRequest(today=TODAY, retention_days=365)
+    )
+    assert again.logs_compacted == 0
+
+
+def test_late_completions_fold_into_their_compacted_month():
+    container = Container(Settings())
+    user_id, (read, run) = seed_user(container)
+    logs = container.repository("logs")
+    container.use_case("compact_habit_logs").execute(
+        CompactHabitLogsRequest(today=TODAY, retention_days=365)
+    )
+
+    def january(habit_id):
+        [month] = [
+            m for m in logs.monthly_totals(user_id, START, date(2024, 1, 31))
+            if m.habit_id == habit_id
+        ]
+        return month
+
+    complete = container.use_case("complete_habit")
+    # already counted that day: no double count
+    complete.execute(CompleteHabitRequest(user_id, read, date(2024, 1, 5)))
+    assert january(read).completions == 31
+    # a day "Run" was skipped: counted once, no raw log kept
+    skipped = next(
+        START + timedelta(days=d)
+        for d in range(31)
+        if (START + timedelta(days=d)).toordinal() % 3
+    )
+    before = january(run)
+    complete.execute(CompleteHabitRequest(user_id, run, skipped))
+    after = january(run)
+    assert after.completions == before.completions + 1
+    assert after.xp_total > before.xp_total
+    assert logs.list_for_day(user_id, skipped) == []
+
+    with pytest.raises(ValueError):
+        container.use_case("compact_habit_logs").execute(
+            CompactHabitLogsRequest(today=TODAY, retention_days=0)
+        )
+
+
+def test_tiered_backend_compacts_evicted_users_on_disk(tmp_path):
+    container = Container(
+        Settings(backend="tiered", data_dir=str(tmp_path), max_resident_users=1)
+    )
+    first, _ = seed_user(container)
+    second, _ = seed_user(container)  # evicts the first user
+    tiers = container.resolve("tier_manager")
+    logs = container.repository("logs")
+    before = totals(logs, first)
+    logs.list_for_day(second, TODAY)  # reading the first user loaded it; evict again
+    assert tiers.cold.peek(first) is not None
+    loads = tiers.stats.loads
+
+    result = container.use_case("compact_habit_logs").execute(
+        CompactHabitLogsRequest(today=TODAY)
+    )
+
+    assert tiers.stats.loads == loads
+    assert result.logs_compacted > 0
+    stored = tiers.cold.peek(first).entities["logs"]
+    assert min(log.day for log in stored if hasattr(log, "day")) == result.cutoff
+    assert totals(logs, first) == before
+
+    # cold users are picked by their indexed oldest raw log: nothing is
+    # left before the cutoff, so a second run opens no blobs
+    peeked = []
+    peek = tiers.cold.peek
+    tiers.cold.peek = lambda user_id: peeked.append(user_id) or peek(user_id)
+    again = container.use_case("compact_habit_logs").execute(
+        CompactHabitLogsRequest(today=TODAY)
+    )
+    assert again.logs_compacted == 0 and peeked == []
@@ -0,0 +1,173 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import multiprocessing
+import threading
+from datetime import date
+
+import pytest
+
+from habit_hero.domain.entities import Character, StreakState
+from habit_hero.application.ports import ConcurrencyError
+from habit_hero.application.concurrency import RetryPolicy, award_xp
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryCharacterRepository,
+    InMemoryHabitLogRepository,
+    InMemoryHabitRepository,
+    InMemoryStreakRepository,
+)
+from habit_hero.infrastructure.persistence.shared_repositories import (
+    SharedCharacterRepository,
+)
+from habit_hero.application.use_cases.create_habit import (
+    CreateHabitUseCase,
+    CreateHabitRequest,
+)
+from habit_hero.application.use_cases.complete_habit import (
+    CompleteHabitUseCase,
+    CompleteHabitRequest,
+)
+
+
+def test_stale_save_is_rejected():
+    repo = InMemoryCharacterRepository()
+    repo.save(Character(user_id="user-1"))
+
+    first = repo.get_for_user("user-1")
+    second = repo.get_for_user("user-1")
+    first.xp = 10
+    repo.save(first)
+    second.xp = 20
+
+    with pytest.raises(ConcurrencyError):
+        repo.save(second)
+    assert repo.get_for_user("user-1").xp == 10
+    assert repo.get_for_user("user-1").version == 2
+
+
+def _race(save, first, second):
+    """
+    Save two copies of the same version from two threads at once and
+    return how many of the saves were rejected.
+    """
+    start = threading.Barrier(2)
+    rejected = []
+
+    def run(entity):
+        start.wait()
+        try:
+            save(entity)
+        except ConcurrencyError:
+            rejected.append(entity)
+
+    threads = [threading.Thread(target=run, args=(e,)) for e in (first, second)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(rejected)
+
+
+@pytest.mark.parametrize("kind", ["characters", "streaks"])
+def test_exactly_one_of_two_racing_saves_is_rejected(kind):
+    interval = sys.getswitchinterval()
+    # Switch threads as often as possible so the saves interleave
+    sys.setswitchinterval(1e-6)
+    try:
+        for i in range(1000):
+            if kind == "characters":
+                repo = InMemoryCharacterRepository()
+                repo.save(Character(user_id="user-1"))
+                first = repo.get_for_user("user-1")
+                second = repo.get_for_user("user-1")
+            else:
+                repo = InMemoryStreakRepository()
+                repo.save(StreakState("habit-1", "user-1", 1, 1, date(2025, 1, 1)))
+                first = repo.get("user-1", "habit-1")
+                second = repo.get("user-1", "habit-1")
+            assert _race(repo.save, first, second) == 1, f"round {i}"
+    finally:
+        sys.setswitchinterval(interval)
+
+
+class RacingCharacterRepository(InMemoryCharacterRepository):
+    """
+    Sneaks in a competing write right after the first few reads.
+    """
+
+    def __init__(self, races: int) -> None:
+        super().__init__()
+        self.races = races
+
+    def get_for_user(self, user_id):
+        character = super().get_for_user(user_id)
+        if self.races:
+            self.races -= 1
+            rival = super().get_for_user(user_id)
+            rival.xp += 1
+            self.save(rival)
+        return character
+
+
+def test_complete_habit_retries_lost_races_without_losing_xp():
+    habits = InMemoryHabitRepository()
+    characters = RacingCharacterRepository(races=0)
+    characters.save(Character(user_id="user-1"))
+    characters.races = 2
+    habit = CreateHabitUseCase(habits=habits).execute(
+        CreateHabitRequest(
+            user_id="user-1",
+            name="Read",
+            cue="After dinner",
+            action="Read 10 pages",
+            reward="Calm",
+            estimated_minutes=20,
+            base_xp=10,
+        )
+    )
+    retry = RetryPolicy(sleep=lambda _: None)
+    use_case = CompleteHabitUseCase(
+        habits=habits,
+        logs=InMemoryHabitLogRepository(),
+        streaks=InMemoryStreakRepository(),
+        characters=characters,
+        retry=retry,
+    )
+
+    use_case.execute(CompleteHabitRequest(user_id="user-1", habit_id=habit.id, day=date(2025, 1, 1)))
+
+    # 10 XP from the habit + 2 from the competing writes
+    assert characters.get_for_user("user-1").xp == 12
+    assert retry.retries == 2
+
+
+def _award_many(store, latch, count):
+    repo = SharedCharacterRepository(store, latch)
+    retry = RetryPolicy(attempts=100)
+    for _ in range(count):
+        award_xp(repo, "user-1", 1, retry)
+
+
+def test_awards_from_several_processes_are_not_lost():
+    with multiprocessing.Manager() as manager:
+        store, latch = manager.dict(), manager.Lock()
+        SharedCharacterRepository(store, latch).save(Character(user_id="user-1"))
+
+        workers = [
+            multiprocessing.Process(target=_award_many, args=(store, latch, 40))
+            for _ in range(3)
+        ]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        character = store["user-1"]
+        # 120 XP total: level 1 -> 2 takes 100, 20 left over
+        assert (character.level, character.xp) == (2, 20)
+        assert character.version == 121
@@ -0,0 +1,157 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from datetime import date, datetime, time, timedelta
+
+from habit_hero.container import Container, Settings
+from habit_hero.infrastructure.clock import ManualClock
+from habit_hero.infrastructure.scheduling.bucketed_index import BucketedTimerIndex
+from habit_hero.infrastructure.notifications.in_memory_outbox import (
+    InMemoryReminderOutbox,
+)
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryCharacterRepository,
+    InMemoryHabitLogRepository,
+    InMemoryHabitRepository,
+    InMemoryStreakRepository,
+)
+from habit_hero.application.use_cases.create_habit import (
+    CreateHabitUseCase,
+    CreateHabitRequest,
+)
+from habit_hero.application.use_cases.complete_habit import (
+    CompleteHabitUseCase,
+    CompleteHabitRequest,
+)
+from habit_hero.application.use_cases.deactivate_habit import (
+    DeactivateHabitUseCase,
+    DeactivateHabitRequest,
+)
+from habit_hero.application.use_cases.dispatch_reminders import (
+    DispatchRemindersUseCase,
+)
+
+START = datetime(2025, 1, 1, 6, 0)
+
+
+def test_bucketed_index_pops_only_due_buckets():
+    index = BucketedTimerIndex()
+    index.schedule("a", START + timedelta(minutes=1))
+    index.schedule("b", START + timedelta(minutes=1, seconds=30))
+    index.schedule("c", START + timedelta(minutes=5))
+    index.cancel("c")
+
+    assert index.pop_due(START) == []
+    assert index.pop_due(START + timedelta(minutes=1)) == ["a"]
+    assert index.pop_due(START + timedelta(minutes=10)) == ["b"]
+    assert len(index) == 0
+
+
+class Harness:
+    def __init__(self) -> None:
+        self.clock = ManualClock(START)
+        self.habits = InMemoryHabitRepository()
+        self.index = BucketedTimerIndex()
+        self.outbox = InMemoryReminderOutbox()
+        self.create = CreateHabitUseCase(
+            habits=self.habits, reminders=self.index, clock=self.clock
+        )
+        self.complete = CompleteHabitUseCase(
+            habits=self.habits,
+            logs=InMemoryHabitLogRepository(),
+            streaks=InMemoryStreakRepository(),
+            characters=InMemoryCharacterRepository(),
+            reminders=self.index,
+        )
+        self.deactivate = DeactivateHabitUseCase(habits=self.habits, reminders=self.index)
+        self.dispatch = DispatchRemindersUseCase(
+            habits=self.habits, reminders=self.index, outbox=self.outbox, clock=self.clock
+        )
+
+    def new_habit(self, at: time | None):
+        return self.create.execute(
+            CreateHabitRequest(
+                user_id="user-1",
+                name="Stretch",
+                cue="After I wake up",
+                action="Stretch for 10 minutes",
+                reward="Loose back",
+                estimated_minutes=10,
+                reminder_time=at,
+            )
+        )
+
+
+def test_reminders_fire_daily_and_reschedule():
+    h = Harness()
+    habit = h.new_habit(time(7, 0))
+    h.new_habit(None)
+    assert len(h.index) == 1
+
+    h.clock.set(START + timedelta(minutes=59))
+    assert h.dispatch.execute().delivered == 0
+
+    h.clock.set(datetime(2025, 1, 1, 7, 0))
+    assert h.dispatch.execute().delivered == 1
+    assert h.outbox.delivered[0].habit_id == habit.id
+    assert h.outbox.delivered[0].cue == "After I wake up"
+
+    # nothing more today, again tomorrow
+    h.clock.set(datetime(2025, 1, 1, 23, 0))
+    assert h.dispatch.execute().due == 0
+    h.clock.set(datetime(2025, 1, 2, 7, 0))
+    assert h.dispatch.execute().delivered == 1
+
+
+def test_completing_skips_todays_reminder_and_deactivating_stops_them():
+    h = Harness()
+    habit = h.new_habit(time(20, 0))
+
+    h.complete.execute(
+        CompleteHabitRequest(user_id="user-1", habit_id=habit.id, day=date(2025, 1, 1))
+    )
+    h.clock.set(datetime(2025, 1, 1, 20, 0))
+    assert h.dispatch.execute().due == 0
+
+    h.deactivate.execute(DeactivateHabitRequest(user_id="user-1", habit_id=habit.id))
+    h.clock.set(datetime(2025, 1, 3, 0, 0))
+    assert h.dispatch.execute().due == 0
+    assert h.outbox.delivered == []
+    assert h.habits.list_for_user("user-1") == []
+
+
+def test_reminder_index_is_rebuilt_from_stored_habits(tmp_path):
+    settings = Settings(backend="tiered", data_dir=str(tmp_path), max_resident_users=1)
+    container = Container(settings)
+    container.override("clock", ManualClock(START))
+    create = container.use_case("create_habit")
+    with_reminder = None
+    for user_id in ("user-1", "user-2"):
+        with_reminder = create.execute(
+            CreateHabitRequest(
+                user_id=user_id,
+                name="Stretch",
+                cue="After I wake up",
+                action="Stretch for 10 minutes",
+                reward="Loose back",
+                estimated_minutes=10,
+                reminder_time=time(7, 0),
+            )
+        )
+    container.resolve("tier_manager").flush()
+
+    # A new process: the index starts out empty and is seeded on resolve
+    restarted = Container(settings)
+    restarted.override("clock", ManualClock(START))
+    index = restarted.resolve("reminder_index")
+
+    assert len(index) == 2
+    assert with_reminder.id in index
+    # seeding reads evicted users in place
+    assert restarted.resolve("tier_manager").resident_users == 0
+    assert len(index.pop_due(datetime(2025, 1, 1, 7, 0))) == 2
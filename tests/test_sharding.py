@@ -0,0 +1,202 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import threading
+from datetime import date
+
+import pytest
+
+from habit_hero.container import Settings
+from habit_hero.infrastructure.sharding.hash_ring import ConsistentHashRing
+from habit_hero.infrastructure.sharding.router import ShardRouter
+from habit_hero.infrastructure.sharding.worker import ShardWorker
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.log_life_force import LogLifeForceRequest
+from habit_hero.application.use_cases.list_habits import ListHabitsRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.get_leaderboard import GetLeaderboardRequest
+from habit_hero.application.use_cases.get_achievements import GetAchievementsRequest
+from habit_hero.domain.achievements import COMPLETIONS
+
+
+def test_hash_ring_moves_about_one_nth_of_keys():
+    keys = [f"user-{i}" for i in range(4000)]
+    three = ConsistentHashRing(range(3))
+    four = ConsistentHashRing(range(4))
+
+    counts = [0, 0, 0]
+    for key in keys:
+        counts[three.shard_for(key)] += 1
+    moved = sum(three.shard_for(k) != four.shard_for(k) for k in keys)
+
+    assert min(counts) > 1000
+    # ideal is 1/4 of the keys; allow for hashing noise
+    assert moved < len(keys) * 0.35
+    # keys only ever move to the new shard
+    assert all(four.shard_for(k) == 3 for k in keys if three.shard_for(k) != four.shard_for(k))
+
+
+@pytest.fixture
+def router():
+    with ShardRouter(shards=2, settings=Settings()) as r:
+        yield r
+
+
+def create_users(router, count):
+    return router.execute_many(
+        "create_user",
+        [CreateUserRequest(long_term_vision=f"vision {i}") for i in range(count)],
+    )
+
+
+def test_router_routes_by_user_and_merges_leaderboard(router):
+    users = create_users(router, 12)
+    assert {router.shard_for(r.user.id) for r in users} == {0, 1}
+
+    # give user i exactly i points of life force -> i * 5 XP
+    router.execute_many(
+        "log_life_force",
+        [
+            LogLifeForceRequest(
+                user_id=r.user.id,
+                day=date(2025, 1, 1),
+                exercise_score=min(i, 3),
+                diet_score=max(0, min(i - 3, 3)),
+            )
+            for i, r in enumerate(users)
+        ],
+    )
+
+    top = router.leaderboard(limit=3)
+    assert [c.xp for c in top] == [30, 30, 30]
+    assert {c.user_id for c in top} <= {r.user.id for r in users[6:]}
+
+    # requests without a user must be broadcast instead
+    with pytest.raises(ValueError):
+        router.execute("get_leaderboard", GetLeaderboardRequest(limit=3))
+
+
+def test_rebalance_keeps_every_users_data(router):
+    users = create_users(router, 30)
+    for r in users:
+        router.execute(
+            "create_habit",
+            CreateHabitRequest(
+                user_id=r.user.id,
+                name="Walk",
+                cue="After lunch",
+                action="Walk 10 minutes",
+                reward="Fresh air",
+                estimated_minutes=10,
+            ),
+        )
+
+    moved = router.rebalance(3)
+    assert router.shards == 3
+    assert 0 < moved < len(users)
+
+    habits = router.execute_many(
+        "list_habits", [ListHabitsRequest(user_id=r.user.id) for r in users]
+    )
+    assert all(len(page.habits) == 1 for page in habits)
+
+    router.rebalance(1)
+    assert len(router.leaderboard(limit=100)) == 30
+
+
+def test_tiered_shards_keep_separate_cold_stores(tmp_path):
+    settings = Settings(backend="tiered", data_dir=str(tmp_path), max_resident_users=1)
+    with ShardRouter(shards=2, settings=settings) as tiered:
+        users = create_users(tiered, 6)
+        assert len(tiered.leaderboard(limit=20)) == 6
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shard-0", "shard-1"]
+    assert {tiered.shard_for(r.user.id) for r in users} == {0, 1}
+
+
+def test_rebalance_moves_resident_and_evicted_tiered_users(tmp_path):
+    settings = Settings(backend="tiered", data_dir=str(tmp_path), max_resident_users=2)
+    with ShardRouter(shards=2, settings=settings) as tiered:
+        users = create_users(tiered, 8)
+        habits = tiered.execute_many(
+            "create_habit",
+            [
+                CreateHabitRequest(
+                    user_id=r.user.id,
+                    name="Walk",
+                    cue="After lunch",
+                    action="Walk 10 minutes",
+                    reward="Fresh air",
+                    estimated_minutes=10,
+                )
+                for r in users
+            ],
+        )
+
+        moved = tiered.rebalance(4)
+        assert 0 < moved < len(users)
+
+        # every habit is found on its user's new shard
+        tiered.execute_many(
+            "complete_habit",
+            [
+                CompleteHabitRequest(r.user.id, habit.id, date(2025, 1, 1))
+                for r, habit in zip(users, habits)
+            ],
+        )
+        leaders = tiered.leaderboard(limit=20)
+        assert len(leaders) == len(users) and all(c.xp > 0 for c in leaders)
+
+        tiered.rebalance(1)
+        assert [c.xp for c in tiered.leaderboard(limit=20)] == [c.xp for c in leaders]
+
+
+
+def test_export_right_after_completing_keeps_achievement_progress():
+    source, target = ShardWorker(Settings()), ShardWorker(Settings())
+    user = source.handle(
+        "execute", ("create_user", [CreateUserRequest(long_term_vision="Walk daily")])
+    )[0][1].user
+    habit = source.handle(
+        "execute",
+        (
+            "create_habit",
+            [
+                CreateHabitRequest(
+                    user_id=user.id,
+                    name="Walk",
+                    cue="After lunch",
+                    action="Walk 10 minutes",
+                    reward="Fresh air",
+                    estimated_minutes=10,
+                )
+            ],
+        ),
+    )[0][1]
+
+    # Hold the bus worker on the first completion so the second stays queued
+    held, gate = threading.Event(), threading.Event()
+
+    def hold(events):
+        held.set()
+        gate.wait(5)
+
+    source.container.resolve("events").subscribe("gate", hold)
+    for day in (1, 2):
+        request = CompleteHabitRequest(user.id, habit.id, date(2025, 1, day))
+        source.handle("execute", ("complete_habit", [request]))
+        assert held.wait(5)
+    threading.Timer(0.2, gate.set).start()
+
+    target.handle("import", source.handle("export", [user.id]))
+    progress = target.handle(
+        "execute", ("get_achievements", [GetAchievementsRequest(user.id)])
+    )[0][1]
+    assert progress.values[COMPLETIONS] == 2
+    source.container.close()
+    target.container.close()
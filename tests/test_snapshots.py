@@ -0,0 +1,204 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import threading
+from datetime import date, timedelta
+
+import pytest
+
+from habit_hero.container import Container, Settings
+from habit_hero.domain.entities import LifeForceCheck
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryLifeForceRepository,
+)
+from habit_hero.infrastructure.persistence.snapshots import SnapshotManager, VersionedDict
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+
+DAY = date(2025, 7, 1)
+
+
+def test_snapshot_reads_the_map_as_of_its_commit_point():
+    snapshots = SnapshotManager()
+    store = VersionedDict(snapshots)
+    store["a"], store["b"], store["gone"] = 1, 2, 0
+    del store["gone"]
+
+    snapshot = snapshots.snapshot()
+    assert snapshots.history_size() == 0
+    store["a"] = 10
+    store["a"] = 11  # a second commit: a second old value
+    del store["b"]
+    store["c"] = 3
+    store["gone"] = 5  # deleted before the snapshot, back after it
+    with snapshots.commit():
+        store["d"] = 1
+        store["d"] = 2  # same commit: remembered once
+
+    view = store.view(snapshot)
+    assert dict(view.items()) == {"a": 1, "b": 2}
+    assert view["a"] == 1 and "c" not in view and len(view) == 2
+    assert store == {"a": 11, "c": 3, "gone": 5, "d": 2}
+    assert snapshots.history_size() == 6
+
+    snapshot.close()
+    assert snapshots.history_size() == 0
+    with pytest.raises(ValueError):
+        view["a"]
+
+
+def test_iterating_a_snapshot_while_writers_insert_and_delete():
+    snapshots = SnapshotManager()
+    store = VersionedDict(snapshots)
+    for i in range(2000):
+        store[i] = i
+    first = snapshots.snapshot()
+    seen = {}
+    for key, value in store.view(first).items():
+        seen[key] = value
+        # writes land mid-iteration: no "dict changed size" here
+        store[key + 2000] = key
+        store[key] = -1
+        if key % 2:
+            del store[key]
+    assert seen == {i: i for i in range(2000)}
+
+    second = snapshots.snapshot()
+    store[0] = "later"
+    first.close()
+    # history older than the remaining snapshot is dropped
+    assert snapshots.history_size() == 1
+    assert store.view(second)[0] == -1 and 1 not in store.view(second)
+    second.close()
+
+
+def test_life_force_series_are_copied_only_while_a_snapshot_sees_them():
+    snapshots = SnapshotManager()
+    life_force = InMemoryLifeForceRepository(snapshots)
+    for d in range(3):
+        life_force.save(LifeForceCheck("c", "u1", DAY + timedelta(days=d), 2, 2))
+
+    with snapshots.snapshot() as snapshot:
+        life_force.save(LifeForceCheck("c", "u1", DAY + timedelta(days=3), 3, 3))
+        life_force.save(LifeForceCheck("c", "u1", DAY, 0, 0))
+        assert [c.exercise_score for c in life_force.scan(snapshot)] == [2, 2, 2]
+        assert life_force.trend("u1", DAY, DAY + timedelta(days=3)).exercise_total == 7
+        assert snapshots.history_size() == 1  # one series copy, not two
+
+    life_force.save(LifeForceCheck("c", "u1", DAY + timedelta(days=4), 1, 1))
+    assert snapshots.history_size() == 0
+
+
+def _seed(container: Container, users: int) -> list[tuple[str, str]]:
+    pairs = []
+    for i in range(users):
+        user = container.use_case("create_user").execute(
+            CreateUserRequest(long_term_vision="Every day.")
+        ).user
+        habit = container.use_case("create_habit").execute(
+            CreateHabitRequest(
+                user_id=user.id,
+                name=f"Habit {i}",
+                cue="Cue",
+                action="Action",
+                reward="Reward",
+                estimated_minutes=5,
+            )
+        )
+        pairs.append((user.id, habit.id))
+    return pairs
+
+
+def test_snapshots_are_point_in_time_cuts_of_use_case_saves():
+    container = Container(Settings())
+    pairs = _seed(container, users=20)
+    days = 40
+    complete = container.use_case("complete_habit")
+
+    def write() -> None:
+        for d in range(days):
+            for user_id, habit_id in pairs:
+                complete.execute(CompleteHabitRequest(user_id, habit_id, DAY + timedelta(days=d)))
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    streaks = container.repository("streaks")
+    logs = container.repository("logs")
+    dashboards = container.repository("dashboards")
+    partial = 0
+    while True:
+        done = not writer.is_alive()
+        with container.resolve("snapshots").snapshot() as snapshot:
+            logged = {}
+            for log in logs.scan(snapshot):
+                logged[log.habit_id] = logged.get(log.habit_id, 0) + 1
+            # each completion saves its streak, then its log, then the
+            # dashboard: a cut is at most one completion into that order
+            streak_of = {s.habit_id: s.current_streak for s in streaks.scan(snapshot)}
+            for dashboard in dashboards.scan(snapshot):
+                for habit_id, entry in dashboard.habits.items():
+                    count = logged.get(habit_id, 0)
+                    assert entry.current_streak <= count <= streak_of[habit_id]
+                    assert streak_of[habit_id] <= entry.current_streak + 1
+            partial += 0 < sum(logged.values()) < days * len(pairs)
+        if done:
+            break
+    writer.join()
+
+    assert sum(logged.values()) == days * len(pairs)
+    assert partial > 0  # some snapshots really were taken mid-run
+    assert container.resolve("snapshots").history_size() == 0
+
+
+def test_no_snapshots_with_write_behind_buffering():
+    container = Container(Settings(write_behind_max_pending=10))
+    pairs = _seed(container, users=1)
+    container.use_case("complete_habit").execute(CompleteHabitRequest(*pairs[0], DAY))
+
+    # buffers flush one repository at a time: a snapshot would see a log
+    # without its streak or XP, so there is none to take
+    with pytest.raises(ValueError):
+        container.resolve("snapshots")
+    assert "snapshots" not in container._instances
+    container.close()
+
+
+def test_a_use_case_stalled_mid_way_blocks_neither_writers_nor_snapshots():
+    container = Container(Settings())
+    (stalled_user, stalled_habit), (user_id, habit_id) = _seed(container, users=2)
+    logs = container.repository("logs")
+    entered, resume = threading.Event(), threading.Event()
+    save = logs.save
+
+    def stall(log):
+        if log.user_id == stalled_user:
+            entered.set()
+            resume.wait(5)
+        save(log)
+
+    logs.save = stall
+    complete = container.use_case("complete_habit")
+    stalled = threading.Thread(
+        target=complete.execute,
+        args=(CompleteHabitRequest(stalled_user, stalled_habit, DAY),),
+    )
+    stalled.start()
+    assert entered.wait(5)
+    try:
+        # the stalled use case holds no lock between its saves
+        complete.execute(CompleteHabitRequest(user_id, habit_id, DAY))
+        with container.resolve("snapshots").snapshot() as snapshot:
+            streaks = {s.habit_id for s in container.repository("streaks").scan(snapshot)}
+            logged = {log.habit_id for log in logs.scan(snapshot)}
+    finally:
+        resume.set()
+        stalled.join(5)
+    # its streak was saved before the stall, its log was not
+    assert streaks == {stalled_habit, habit_id}
+    assert logged == {habit_id}
@@ -0,0 +1,170 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import threading
+from datetime import date, datetime, time
+
+from habit_hero.container import Container, Settings
+from habit_hero.infrastructure.clock import ManualClock
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+from habit_hero.application.use_cases.expire_streaks import ExpireStreaksRequest
+from habit_hero.application.use_cases.get_leaderboard import GetLeaderboardRequest
+
+
+def make_container(tmp_path, max_resident_users=2) -> Container:
+    return Container(
+        Settings(
+            backend="tiered",
+            data_dir=str(tmp_path),
+            max_resident_users=max_resident_users,
+        )
+    )
+
+
+def add_user_with_habit(container: Container, day: date) -> tuple[str, str]:
+    user = container.use_case("create_user").execute(
+        CreateUserRequest(long_term_vision="Stay fit.")
+    ).user
+    habit = container.use_case("create_habit").execute(
+        CreateHabitRequest(
+            user_id=user.id,
+            name="Walk",
+            cue="After lunch",
+            action="Walk 10 minutes",
+            reward="Podcast",
+            estimated_minutes=10,
+        )
+    )
+    container.use_case("complete_habit").execute(
+        CompleteHabitRequest(user_id=user.id, habit_id=habit.id, day=day)
+    )
+    return user.id, habit.id
+
+
+def test_only_the_budgeted_users_stay_in_memory(tmp_path):
+    container = make_container(tmp_path)
+    users = [add_user_with_habit(container, date(2025, 1, 1)) for _ in range(5)]
+    tiers = container.resolve("tier_manager")
+
+    assert tiers.resident_users == 2
+    assert len(tiers.cold) == 3
+    assert tiers.stats.evictions == 3
+
+    # An evicted user's habit is found by id and comes back intact
+    first_user, first_habit = users[0]
+    habit = container.repository("habits").get(first_habit)
+    assert habit.user_id == first_user
+    assert container.repository("streaks").get(first_user, first_habit).current_streak == 1
+    assert tiers.stats.loads == 1
+    assert len(tiers.cold) == 3
+
+
+def test_evicted_users_can_keep_completing_habits(tmp_path):
+    container = make_container(tmp_path)
+    user_id, habit_id = add_user_with_habit(container, date(2025, 1, 1))
+    first_xp = container.repository("characters").get_for_user(user_id).xp
+    for _ in range(3):
+        add_user_with_habit(container, date(2025, 1, 1))
+
+    container.use_case("complete_habit").execute(
+        CompleteHabitRequest(user_id=user_id, habit_id=habit_id, day=date(2025, 1, 2))
+    )
+
+    # Versions survive the trip to disk, so the CAS saves go through
+    assert container.repository("streaks").get(user_id, habit_id).current_streak == 2
+    assert container.repository("characters").get_for_user(user_id).xp == 2 * first_xp
+
+
+def test_cross_user_queries_see_cold_users(tmp_path):
+    container = make_container(tmp_path)
+    users = [add_user_with_habit(container, date(2025, 1, 1)) for _ in range(4)]
+    tiers = container.resolve("tier_manager")
+    loads = tiers.stats.loads
+
+    leaders = container.use_case("get_leaderboard").execute(
+        GetLeaderboardRequest(limit=10)
+    )
+    assert len(leaders) == 4
+    # Leaderboards read cold users in place
+    assert tiers.stats.loads == loads
+
+    expired = container.use_case("expire_streaks").execute(
+        ExpireStreaksRequest(today=date(2025, 1, 5))
+    )
+    assert expired.expired == 4
+    for user_id, habit_id in users:
+        assert container.repository("streaks").get(user_id, habit_id).current_streak == 0
+
+
+def test_lookups_of_unknown_users_do_not_take_resident_slots(tmp_path):
+    container = make_container(tmp_path)
+    users = [add_user_with_habit(container, date(2025, 1, 1)) for _ in range(2)]
+    tiers = container.resolve("tier_manager")
+    evictions = tiers.stats.evictions
+
+    for i in range(5):
+        assert container.repository("characters").get_for_user(f"ghost-{i}") is None
+        assert container.repository("habits").get(f"habit-ghost-{i}") is None
+
+    assert tiers.resident_users == 2
+    assert tiers.stats.evictions == evictions
+    assert container.repository("streaks").get(*users[0]).current_streak == 1
+    assert tiers.stats.loads == 0
+
+
+def test_sweep_and_reminder_tick_leave_cold_users_on_disk(tmp_path):
+    container = make_container(tmp_path)
+    container.override("clock", ManualClock(datetime(2025, 1, 5, 6, 0)))
+    users = [add_user_with_habit(container, date(2025, 1, 1)) for _ in range(4)]
+    for user_id, habit_id in users:
+        habit = container.repository("habits").get(habit_id)
+        habit.reminder_time = time(7, 0)
+        container.repository("habits").save(habit)
+        container.resolve("reminder_index").schedule(habit_id, datetime(2025, 1, 5, 7, 0))
+    tiers = container.resolve("tier_manager")
+    tiers.flush()
+    loads = tiers.stats.loads
+
+    expired = container.use_case("expire_streaks").execute(
+        ExpireStreaksRequest(today=date(2025, 1, 5))
+    )
+    container.resolve("clock").set(datetime(2025, 1, 5, 7, 0))
+    delivered = container.use_case("dispatch_reminders").execute().delivered
+
+    assert (expired.expired, delivered) == (4, 4)
+    assert tiers.resident_users == 0 and tiers.stats.loads == loads
+    # the resets were written to disk: nothing is left for the next sweep
+    assert container.repository("streaks").list_completed_before(date(2025, 1, 6)) == []
+    for user_id, habit_id in users:
+        assert container.repository("streaks").get(user_id, habit_id).current_streak == 0
+
+
+def test_tiered_repositories_can_be_used_from_other_threads(tmp_path):
+    container = make_container(tmp_path, max_resident_users=1)
+    # Builds the components (and opens SQLite) on this thread
+    add_user_with_habit(container, date(2025, 1, 1))
+    errors = []
+
+    def add_users():
+        try:
+            for _ in range(5):
+                add_user_with_habit(container, date(2025, 1, 1))
+        except Exception as exc:  # surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=add_users) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    leaders = container.use_case("get_leaderboard").execute(GetLeaderboardRequest(limit=20))
+    assert len(leaders) == 16
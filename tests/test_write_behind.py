@@ -0,0 +1,284 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+import threading
+from dataclasses import replace
+from datetime import date, datetime
+
+import pytest
+
+from habit_hero.application.ports import ConcurrencyError
+from habit_hero.container import Container, Settings
+from habit_hero.domain.entities import Character, Dashboard, DashboardHabit, HabitLog
+from habit_hero.application.concurrency import RetryPolicy, award_xp
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryCharacterRepository,
+    InMemoryDashboardRepository,
+    InMemoryHabitLogRepository,
+)
+from habit_hero.infrastructure.persistence.shared_repositories import (
+    SharedCharacterRepository,
+)
+from habit_hero.infrastructure.persistence.write_behind import (
+    WriteBehindCharacterRepository,
+    WriteBehindDashboardRepository,
+    WriteBehindHabitLogRepository,
+)
+from habit_hero.application.use_cases.create_user import CreateUserRequest
+from habit_hero.application.use_cases.create_habit import CreateHabitRequest
+from habit_hero.application.use_cases.complete_habit import CompleteHabitRequest
+
+DAY = date(2025, 5, 1)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CountingCharacters(InMemoryCharacterRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = []
+
+    def save_many(self, characters):
+        self.batches.append([c.user_id for c in characters])
+        super().save_many(characters)
+
+
+def test_repeated_saves_collapse_into_one_versioned_write():
+    backend = CountingCharacters()
+    backend.save(Character(user_id="u1"))  # stored at version 1
+    characters = WriteBehindCharacterRepository(backend, max_pending=10, clock=FakeClock())
+
+    for _ in range(5):
+        character = characters.get_for_user("u1")
+        character.xp += 10
+        characters.save(character)
+
+    # reads see the buffered state, the backend has not been written
+    assert characters.get_for_user("u1").xp == 50
+    assert characters.get_for_user("u1").version == 6
+    assert backend.get_for_user("u1").xp == 0 and backend.batches == []
+
+    # compare-and-swap still applies to buffered entities
+    stale = replace(characters.get_for_user("u1"), version=3)
+    with pytest.raises(ConcurrencyError):
+        characters.save(stale)
+
+    characters.flush()
+    assert backend.batches == [["u1"]]
+    stored = backend.get_for_user("u1")
+    assert (stored.xp, stored.version) == (50, 2)
+    assert characters.stats.saves == 5 and characters.stats.writes == 1
+    assert characters.stats.write_reduction == 5.0
+
+    # after a flush callers work from the backend's version again
+    character = characters.get_for_user("u1")
+    character.level = 2
+    characters.save(character)
+    characters.close()
+    assert backend.get_for_user("u1").version == 3
+
+
+def test_flushes_on_size_interval_and_queries():
+    clock = FakeClock()
+    backend = CountingCharacters()
+    characters = WriteBehindCharacterRepository(
+        backend, max_pending=3, flush_interval=2.0, clock=clock
+    )
+
+    for user_id in ("a", "b", "a", "c"):
+        characters.save(characters.get_for_user(user_id) or Character(user_id=user_id))
+    # the third distinct key hit the size limit
+    assert backend.batches == [["a", "b", "c"]]
+
+    characters.save(Character(user_id="d"))
+    clock.now = 1.9
+    characters.get_for_user("x")
+    assert len(backend.batches) == 1
+    clock.now = 2.0
+    characters.get_for_user("x")
+    assert backend.batches[-1] == ["d"]
+
+    # unwrapped methods see every buffered write
+    characters.save(Character(user_id="e", level=9))
+    assert [c.user_id for c in characters.list_top(1)] == ["e"]
+    assert sorted(characters.user_ids()) == ["a", "b", "c", "d", "e"]
+
+
+def test_log_reads_merge_buffered_and_stored_logs():
+    backend = InMemoryHabitLogRepository()
+    logs = WriteBehindHabitLogRepository(backend, clock=FakeClock())
+
+    def log(log_id: str, day: date, xp: int) -> HabitLog:
+        return HabitLog(log_id, "u1", "h1", day, datetime(2025, 5, 1), xp)
+
+    backend.save(log("log-1", DAY, 10))
+    backend.save(log("log-2", DAY, 10))
+    logs.save(log("log-1", DAY, 25))  # updated in place
+    logs.save(log("log-2", date(2025, 5, 2), 10))  # moved to another day
+    logs.save(log("log-3", DAY, 5))
+
+    assert [(l.id, l.xp_earned) for l in logs.list_for_day("u1", DAY)] == [
+        ("log-1", 25),
+        ("log-3", 5),
+    ]
+    assert [l.id for l in logs.list_for_day("u1", date(2025, 5, 2))] == ["log-2"]
+
+    logs.close()
+    assert [(l.id, l.xp_earned) for l in backend.list_for_day("u1", DAY)] == [
+        ("log-1", 25),
+        ("log-3", 5),
+    ]
+
+
+def test_container_wraps_hot_repositories_when_enabled():
+    def run(settings: Settings):
+        container = Container(settings)
+        user = container.use_case("create_user").execute(
+            CreateUserRequest(long_term_vision="Write every day.")
+        ).user
+        habits = [
+            container.use_case("create_habit").execute(
+                CreateHabitRequest(
+                    user_id=user.id,
+                    name=f"Habit {i}",
+                    cue="Cue",
+                    action="Action",
+                    reward="Reward",
+                    estimated_minutes=10,
+                )
+            )
+            for i in range(4)
+        ]
+        complete = container.use_case("complete_habit")
+        for habit in habits:
+            complete.execute(CompleteHabitRequest(user.id, habit.id, DAY))
+        characters = container.repository("characters")
+        container.close()
+        return characters, user.id
+
+    plain, plain_user = run(Settings())
+    buffered, buffered_user = run(Settings(write_behind_max_pending=100))
+
+    assert isinstance(buffered, WriteBehindCharacterRepository)
+    assert buffered.stats.writes == 1 and buffered.stats.saves == 5
+    expected = plain.get_for_user(plain_user)
+    stored = buffered.backend.get_for_user(buffered_user)
+    assert (stored.level, stored.xp) == (expected.level, expected.xp)
+
+
+def test_a_failed_flush_only_drops_what_was_written_or_stale():
+    backend = CountingCharacters()
+    for user_id in ("u1", "u2", "u3"):
+        backend.save(Character(user_id=user_id))
+    characters = WriteBehindCharacterRepository(backend, clock=FakeClock())
+    for user_id in ("u1", "u2", "u3"):
+        character = characters.get_for_user(user_id)
+        character.xp += 10
+        characters.save(character)
+
+    # someone writes u2 behind the wrapper's back
+    InMemoryCharacterRepository.save(backend, replace(backend.get_for_user("u2"), xp=99))
+    with pytest.raises(ConcurrencyError):
+        characters.flush()
+    # u1 and u3 still reached the backend; only the stale u2 save is gone
+    assert characters.pending == 0
+    assert [backend.get_for_user(u).xp for u in ("u1", "u2", "u3")] == [10, 99, 10]
+    assert characters.stats.writes == 2
+
+    class Unavailable(CountingCharacters):
+        def save_many(self, characters):
+            raise OSError("disk full")
+
+    down = Unavailable()
+    buffered = WriteBehindCharacterRepository(down, clock=FakeClock())
+    buffered.save(Character(user_id="u1"))
+    with pytest.raises(OSError):
+        buffered.flush()
+    assert buffered.pending == 1 and buffered.stats.writes == 0
+
+
+def test_versioned_write_behind_needs_the_only_writer():
+    backend = InMemoryCharacterRepository()
+    characters = WriteBehindCharacterRepository(backend)
+    with pytest.raises(ValueError):
+        WriteBehindCharacterRepository(backend)
+    with pytest.raises(ValueError):
+        WriteBehindCharacterRepository(SharedCharacterRepository({}, threading.Lock()))
+    assert characters.backend is backend
+
+
+def test_a_copy_read_before_a_flush_is_stale_after_it():
+    backend = InMemoryCharacterRepository()
+    backend.save(Character(user_id="u1"))
+    characters = WriteBehindCharacterRepository(backend, max_pending=10, clock=FakeClock())
+
+    for i in range(3):
+        character = characters.get_for_user("u1")
+        if i == 1:
+            early = characters.get_for_user("u1")  # version 2
+        character.xp += 10
+        characters.save(character)
+    characters.flush()
+
+    # The backend is at version 2 too, but callers now see version 4
+    assert backend.get_for_user("u1").version == 2
+    assert characters.get_for_user("u1").version == 4
+    with pytest.raises(ConcurrencyError):
+        characters.save(early)
+    character = characters.get_for_user("u1")
+    character.xp += 10
+    characters.save(character)
+    characters.flush()
+    assert backend.get_for_user("u1").xp == 40
+
+
+def test_buffer_can_be_shared_by_threads():
+    backend = InMemoryCharacterRepository()
+    for i in range(4):
+        backend.save(Character(user_id=f"u{i}"))
+    characters = WriteBehindCharacterRepository(backend, max_pending=3, clock=FakeClock())
+    retry = RetryPolicy(attempts=1000, base_delay=0)
+
+    def award(user_id):
+        for _ in range(40):
+            award_xp(characters, user_id, 1, retry)
+
+    interval = sys.getswitchinterval()
+    # Switch threads as often as possible so the calls interleave
+    sys.setswitchinterval(1e-6)
+    try:
+        # two threads per user, so saves of the same key race too
+        threads = [
+            threading.Thread(target=award, args=(f"u{i % 4}",)) for i in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+    finally:
+        sys.setswitchinterval(interval)
+
+    characters.flush()
+    assert [backend.get_for_user(f"u{i}").xp for i in range(4)] == [80] * 4
+
+
+def test_buffered_dashboards_are_handed_out_as_copies():
+    dashboards = WriteBehindDashboardRepository(
+        InMemoryDashboardRepository(), max_pending=10, clock=FakeClock()
+    )
+    dashboards.save(Dashboard(user_id="u1"))
+
+    dashboard = dashboards.get("u1")
+    dashboard.habits["h1"] = DashboardHabit("h1", "Walk", "Morning", 5, False)
+    assert dashboards.get("u1").habits == {}
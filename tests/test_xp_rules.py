@@ -0,0 +1,128 @@
+from pathlib import Path
+import sys
+
+# Ensure the project root (where habit_hero/ lives) is on sys.path
+ROOT_DIR = Path(__file__).resolve().parents[1]
+if str(ROOT_DIR) not in sys.path:
+    sys.path.append(str(ROOT_DIR))
+
+from datetime import date
+
+import pytest
+
+from habit_hero.domain.entities import Character, Habit, StreakState
+from habit_hero.domain.services import xp_gain_for_habit
+from habit_hero.domain.xp_rules import (
+    MAX_STREAK_STEPS,
+    XpRuleDefinition,
+    XpRuleEngine,
+    compile_rules,
+    streak_multipliers,
+)
+from habit_hero.infrastructure.persistence.in_memory_repositories import (
+    InMemoryCharacterRepository,
+    InMemoryLifeForceRepository,
+)
+from habit_hero.application.use_cases.log_life_force import (
+    LogLifeForceUseCase,
+    LogLifeForceRequest,
+)
+
+
+def make_habit(base_xp: int = 10, user_id: str = "user-1", bad: bool = False) -> Habit:
+    return Habit(
+        id="habit-1",
+        user_id=user_id,
+        name="Morning training",
+        cue="After I wake up",
+        action="Lift weights",
+        reward="Feel strong",
+        estimated_minutes=45,
+        base_xp=base_xp,
+        is_bad_habit=bad,
+    )
+
+
+def make_streak(current: int) -> StreakState:
+    return StreakState(
+        habit_id="habit-1",
+        user_id="user-1",
+        current_streak=current,
+        longest_streak=current,
+        last_completed_day=date(2025, 1, 1),
+    )
+
+
+def test_default_rules_match_scalar_xp_function():
+    rules = compile_rules(XpRuleDefinition())
+    for base in (1, 7, 10, 33, 50):
+        habit = make_habit(base)
+        for current in range(0, 60):
+            streak = make_streak(current)
+            assert rules.habit_xp(habit, streak) == xp_gain_for_habit(habit, streak)
+
+
+def test_bad_habit_multiplier_and_cap():
+    rules = compile_rules(
+        XpRuleDefinition(name="strict", bad_habit_multiplier=2.0, max_habit_xp=25)
+    )
+    assert rules.habit_xp(make_habit(10, bad=True), make_streak(1)) == 20
+    assert rules.habit_xp(make_habit(40), make_streak(1)) == 25
+    assert rules.habit_xp_batch(
+        [(make_habit(10), make_streak(1)), (make_habit(10), make_streak(10))]
+    ) == [10, 12]
+
+
+def test_cohorts_select_rules_per_user():
+    engine = XpRuleEngine()
+    engine.configure(
+        {
+            "rules": [{"name": "double", "life_force_xp_per_point": 10}],
+            "cohorts": {
+                "control": {"rules": "default", "weight": 1},
+                "double": {"rules": "double", "weight": 1},
+            },
+        }
+    )
+    users = [f"user-{i}" for i in range(200)]
+    cohorts = {engine.cohort_for(u) for u in users}
+    assert cohorts == {"control", "double"}
+    # bucketing is stable
+    assert [engine.cohort_for(u) for u in users] == [engine.cohort_for(u) for u in users]
+
+    engine.assign_user("vip", "double")
+    assert engine.life_force_xp("vip", 3, 3) == 60
+
+    with pytest.raises(ValueError):
+        engine.configure({"rules": [{"name": "x", "nope": 1}]})
+
+
+def test_log_life_force_uses_rule_engine():
+    engine = XpRuleEngine(XpRuleDefinition(life_force_aligned_bonus=10))
+    characters = InMemoryCharacterRepository()
+    characters.save(Character(user_id="user-1"))
+    use_case = LogLifeForceUseCase(
+        life_force=InMemoryLifeForceRepository(),
+        characters=characters,
+        xp_rules=engine,
+    )
+
+    result = use_case.execute(
+        LogLifeForceRequest(user_id="user-1", day=date(2025, 1, 1), exercise_score=2, diet_score=3)
+    )
+
+    assert result.xp_awarded == 35
+
+
+def test_streak_table_stays_bounded():
+    with pytest.raises(ValueError):
+        XpRuleDefinition.from_dict({"streak_bonus_cap": 1e9, "streak_step_bonus": 0.001})
+    with pytest.raises(ValueError):
+        XpRuleDefinition.from_dict({"streak_step_bonus": float("nan")})
+    with pytest.raises(ValueError):
+        XpRuleDefinition.from_dict({"streak_bonus_cap": -0.5})
+
+    # built directly, bypassing from_dict: the table still stops
+    huge = XpRuleDefinition(streak_bonus_cap=1e9, streak_step_bonus=0.001)
+    assert len(streak_multipliers(huge)) == MAX_STREAK_STEPS + 1
+    assert len(streak_multipliers(XpRuleDefinition())) == 6